@@ -0,0 +1,262 @@
+"""
+File: bench.py
+Purpose: Implements the benchmark harness for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module builds synthetic Process workloads and times the core operations (can_execute,
+assign_resources, try_assign_resources, Process.execute and Process.run) while sweeping the pool size, the task count
+and the number of resources each task requires. It can also report the memory used per task by
+Task objects and by TaskTable rows. Results are written as JSON so runs from different releases
+can be compared. Run it with `python -m src.bench --help`.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from src.events import NullSink, set_sink
+from src.process import Process
+from src.resource_pool import ResourcePool
+from src.task import Task
+from src.task_table import TaskTable
+from src.usable_resource import UsableResource
+from typing import Any, Callable, Dict, List, Optional
+
+OPERATIONS = ("can_execute", "assign_resources", "try_assign_resources", "execute", "run")
+
+class Workload:
+    """Synthetic process with a pool of usable resources and tasks that fan in on them.
+
+    Demonstrates composition: the workload builds and owns the objects being measured.
+    """
+
+    def __init__(self, pool_size: int, task_count: int, fan_in: int, max_workers: int = 1):
+        """Initialize a Workload.
+
+        Task i requires the fan_in resources following index i in the pool, so requirements
+        are spread evenly over every resource name.
+
+        Args:
+            pool_size: Number of distinct resources in the pool.
+            task_count: Number of tasks in the process.
+            fan_in: Number of resources each task requires.
+            max_workers: Number of tasks the process may run at the same time.
+
+        Raises:
+            ValueError: If a size is not positive or fan_in exceeds pool_size.
+        """
+        if pool_size <= 0 or task_count <= 0 or fan_in <= 0:
+            raise ValueError("Pool size, task count and fan-in must be positive")
+        if fan_in > pool_size:
+            raise ValueError(f"Fan-in {fan_in} exceeds pool size {pool_size}")
+        self._pool_size = pool_size
+        self._task_count = task_count
+        self._fan_in = fan_in
+        self._max_workers = max_workers
+        self._names = [f"Resource{i}" for i in range(pool_size)]
+
+    def resources(self) -> List[UsableResource]:
+        """Create a fresh set of pool resources."""
+        return [UsableResource(name, self._max_workers) for name in self._names]
+
+    def tasks(self) -> List[Task]:
+        """Create a fresh set of tasks."""
+        names, size, fan_in = self._names, self._pool_size, self._fan_in
+        return [Task(f"Task{i}", "Synthetic task", [names[(i + j) % size] for j in range(fan_in)], 1 + i % 5)
+                for i in range(self._task_count)]
+
+    def process(self) -> Process:
+        """Create a fresh process holding the workload's resources and tasks."""
+        process = Process("Benchmark", "Synthetic workload", [], 1, max_workers=self._max_workers)
+        for resource in self.resources():
+            process.add_resource(resource)
+        for task in self.tasks():
+            process.add_task(task)
+        return process
+
+    def describe(self) -> Dict[str, int]:
+        """Get the workload's parameters."""
+        return {"pool_size": self._pool_size, "task_count": self._task_count, "fan_in": self._fan_in,
+                "max_workers": self._max_workers}
+
+def _best_of(repeat: int, setup: Callable[[], Any], body: Callable[[Any], None]) -> float:
+    """Time body(setup()) repeat times and return the fastest run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        body(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _can_execute(state) -> None:
+    """Check every task against the pool."""
+    pool, tasks = state
+    for task in tasks:
+        task.can_execute(pool)
+
+def _assign_resources(state) -> None:
+    """Assign and release every task's resources."""
+    pool, tasks = state
+    for task in tasks:
+        task.assign_resources(pool)
+        task.release_resources()
+
+def _try_assign_resources(state) -> None:
+    """Try to assign every task's resources, keeping them until all tasks were tried."""
+    pool, tasks = state
+    for task in tasks:
+        task.try_assign_resources(pool)
+    for task in tasks:
+        task.release_resources()
+
+def measure(workload: Workload, repeat: int = 3) -> Dict[str, Any]:
+    """Time every benchmarked operation on a workload.
+
+    Args:
+        workload: The workload to measure.
+        repeat: Number of runs per operation; the fastest one is reported.
+
+    Returns:
+        The workload parameters plus seconds and per-task microseconds for each operation.
+    """
+    def pool_and_tasks():
+        return ResourcePool(workload.resources()), workload.tasks()
+
+    timings = {
+        "can_execute": _best_of(repeat, pool_and_tasks, _can_execute),
+        "assign_resources": _best_of(repeat, pool_and_tasks, _assign_resources),
+        "try_assign_resources": _best_of(repeat, pool_and_tasks, _try_assign_resources),
+        "execute": _best_of(repeat, workload.process, lambda process: process.execute()),
+        "run": _best_of(repeat, workload.process, lambda process: process.run()),
+    }
+    task_count = workload.describe()["task_count"]
+    result: Dict[str, Any] = workload.describe()
+    for operation in OPERATIONS:
+        result[f"{operation}_s"] = timings[operation]
+        result[f"{operation}_us_per_task"] = timings[operation] / task_count * 1e6
+    return result
+
+def sweep(pool_sizes: List[int], task_counts: List[int], fan_ins: List[int], max_workers: int = 1,
+          repeat: int = 3, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """Measure every combination of pool size, task count and fan-in.
+
+    Combinations whose fan-in exceeds the pool size are skipped. Events are routed to a
+    NullSink while measuring so console output does not distort the timings.
+
+    Args:
+        pool_sizes: Pool sizes to try.
+        task_counts: Task counts to try.
+        fan_ins: Resources required per task to try.
+        max_workers: Number of tasks each process may run at the same time.
+        repeat: Number of runs per operation.
+        progress: Called with each result as soon as it is measured.
+
+    Returns:
+        One result per measured combination.
+    """
+    results: List[Dict[str, Any]] = []
+    previous = set_sink(NullSink())
+    try:
+        for pool_size in pool_sizes:
+            for task_count in task_counts:
+                for fan_in in fan_ins:
+                    if fan_in > pool_size:
+                        continue
+                    result = measure(Workload(pool_size, task_count, fan_in, max_workers), repeat)
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    finally:
+        set_sink(previous)
+    return results
+
+def measure_memory(task_count: int, fan_in: int = 2) -> Dict[str, Any]:
+    """Measure the bytes allocated per task by Task objects and by TaskTable rows.
+
+    Args:
+        task_count: Number of tasks to create for each representation.
+        fan_in: Number of resources each task requires.
+
+    Returns:
+        The parameters and the bytes per task of each representation.
+    """
+    names = [f"Resource{j}" for j in range(fan_in)]
+
+    def allocated(build: Callable[[], Any]) -> float:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            kept = build()
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del kept
+        return used / task_count
+
+    def objects() -> List[Task]:
+        return [Task(f"Task{i}", "Synthetic task", list(names), 1 + i % 5) for i in range(task_count)]
+
+    def table() -> TaskTable:
+        rows = TaskTable()
+        for i in range(task_count):
+            rows.add(f"Task{i}", "Synthetic task", list(names), 1 + i % 5)
+        return rows
+
+    return {"task_count": task_count, "fan_in": fan_in, "task_bytes_per_task": allocated(objects),
+            "table_bytes_per_task": allocated(table)}
+
+def _int_list(text: str) -> List[int]:
+    """Parse a comma-separated list of positive integers."""
+    values = [int(part) for part in text.split(",") if part.strip()]
+    if not values or any(value <= 0 for value in values):
+        raise argparse.ArgumentTypeError(f"expected positive integers, got '{text}'")
+    return values
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark sweep from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m src.bench",
+                                     description="Benchmark resource assignment and process execution.")
+    parser.add_argument("--pool-sizes", type=_int_list, default=[10, 100, 1000])
+    parser.add_argument("--task-counts", type=_int_list, default=[100, 1000, 10000])
+    parser.add_argument("--fan-in", type=_int_list, default=[1, 2, 4])
+    parser.add_argument("--workers", type=int, default=1, help="tasks each process may run at the same time")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per operation; the fastest is reported")
+    parser.add_argument("--memory", type=int, metavar="TASKS",
+                        help="also measure bytes per task for this many tasks")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    def progress(result: Dict[str, Any]) -> None:
+        print(f"pool={result['pool_size']:<6} tasks={result['task_count']:<7} fan_in={result['fan_in']:<3} "
+              + " ".join(f"{op}={result[f'{op}_us_per_task']:.2f}us" for op in OPERATIONS), file=sys.stderr)
+
+    results = sweep(args.pool_sizes, args.task_counts, args.fan_in, args.workers, args.repeat, progress)
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.memory:
+        report["memory"] = measure_memory(args.memory)
+        print(f"memory: {report['memory']['task_bytes_per_task']:.0f} B/task as Task objects, "
+              f"{report['memory']['table_bytes_per_task']:.0f} B/task in a TaskTable", file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+File: capacity_planner.py
+Purpose: Implements the CapacityPlanner and CapacityPlan classes for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the CapacityPlanner class, which sizes a Process's resource pool for a
+makespan or throughput target without executing any task. Consumable capacity is derived
+exactly, since every completed task draws its units down for good. For usable resources,
+analytical bounds come first: each needs at least the largest single request plus the work it
+carries divided by the target, and never more than its peak use when nothing is constrained.
+The Simulation engine then searches between those bounds, first along the line from the lower to
+the upper bounds and then one resource at a time, so a plan costs a few dozen simulations.
+"""
+
+import math
+from src.executable import Executable
+from src.resource import ResourceType
+from src.simulation import Simulation, SimulationResult
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.process import Process
+
+class CapacityPlan:
+    """Capacities found by a CapacityPlanner, with the simulation that validates them.
+
+    Demonstrates encapsulation of the plan behind read-only properties.
+    """
+
+    def __init__(self, capacities: Dict[str, int], target: int, lower_bounds: Dict[str, int],
+                 simulations: int, result: SimulationResult):
+        """Initialize a CapacityPlan.
+
+        Args:
+            capacities: Planned capacity per resource name (slots or units).
+            target: The makespan the plan had to meet.
+            lower_bounds: Analytical minimum per resource name.
+            simulations: Number of simulations the search ran.
+            result: The simulation of the process with the planned capacities.
+        """
+        self._capacities = capacities
+        self._target = target
+        self._lower_bounds = lower_bounds
+        self._simulations = simulations
+        self._result = result
+
+    @property
+    def capacities(self) -> Dict[str, int]:
+        """Get the planned capacity per resource name."""
+        return dict(self._capacities)
+
+    @property
+    def target(self) -> int:
+        """Get the makespan the plan had to meet."""
+        return self._target
+
+    @property
+    def makespan(self) -> int:
+        """Get the simulated makespan with the planned capacities."""
+        return self._result.makespan
+
+    @property
+    def lower_bounds(self) -> Dict[str, int]:
+        """Get the analytical minimum capacity per resource name."""
+        return dict(self._lower_bounds)
+
+    @property
+    def simulations(self) -> int:
+        """Get the number of simulations the search ran."""
+        return self._simulations
+
+    @property
+    def result(self) -> SimulationResult:
+        """Get the simulation of the process with the planned capacities."""
+        return self._result
+
+class CapacityPlanner:
+    """Searches for the smallest pool capacities that let a process meet a target.
+
+    Demonstrates composition: the planner drives a Simulation of the process with
+    overridden capacities and never touches the real pool.
+    """
+
+    def __init__(self, process: "Process", max_workers: Optional[int] = None):
+        """Initialize a CapacityPlanner.
+
+        Args:
+            process: The process to size; its tasks must be known ahead of time.
+            max_workers: Number of tasks that may run at once (defaults to the process's;
+                0 means limited by resources only).
+        """
+        self._process = process
+        self._max_workers = process.max_workers if max_workers is None else max_workers
+        self._simulations = 0
+
+    def plan(self, makespan: Optional[int] = None, throughput: Optional[float] = None) -> CapacityPlan:
+        """Find the smallest capacities with which every task completes within the target.
+
+        Consumable resources get exactly the units all tasks draw. Usable resources are
+        minimal one at a time: lowering any single one of them misses the target in
+        simulation (the search assumes makespan does not grow with capacity). Resource names
+        the pool does not know are planned as usable resources.
+
+        Args:
+            makespan: Latest acceptable simulated completion time.
+            throughput: Minimum completed tasks per time unit; turned into a makespan target.
+
+        Returns:
+            The CapacityPlan.
+
+        Raises:
+            ValueError: If no target is given, a target is not positive, the task graph is
+                invalid, or the target is unreachable with any capacity (e.g., below the
+                critical path or the limit set by max_workers).
+        """
+        process = self._process
+        tasks = process.task_list()
+        target = self._target(len(tasks), makespan, throughput)
+        self._simulations = 0
+        consumable_names = {resource.name for resource in process.resource_pool
+                            if resource.resource_type is ResourceType.CONSUMABLE}
+        held, consumed, largest, work = self._demands(tasks, consumable_names)
+
+        capacities: Dict[str, int] = {name: held.get(name, 0) + units for name, units in consumed.items()}
+        usable = sorted(largest)
+        unlimited = {name: held.get(name, 0) + sum(amount for task in tasks for demand_name, amount
+                                                   in task.demand() if demand_name == name)
+                     for name in usable}
+        free = self._simulate({**capacities, **unlimited})
+        if free.skipped:
+            raise ValueError(f"Tasks of process '{process.name}' cannot run with any capacity")
+        if free.makespan > target:
+            raise ValueError(f"Process '{process.name}' cannot finish within {target} time units with any "
+                             f"capacity; its makespan is at least {free.makespan}")
+
+        upper = {name: held.get(name, 0) + peak for name, peak in self._peaks(free, usable).items()}
+        lower = {name: min(upper[name], held.get(name, 0) + max(largest[name], math.ceil(work[name] / target)))
+                 for name in usable}
+        best = self._search(capacities, lower, upper, target)
+        capacities.update(best)
+        result = self._simulate(capacities)
+        bounds = dict(lower)
+        bounds.update((name, capacities[name]) for name in consumed)
+        return CapacityPlan(capacities, target, bounds, self._simulations, result)
+
+    @staticmethod
+    def _target(count: int, makespan: Optional[int], throughput: Optional[float]) -> int:
+        """Combine the makespan and throughput targets into one makespan."""
+        if makespan is None and throughput is None:
+            raise ValueError("A makespan or throughput target is required")
+        if (makespan is not None and makespan <= 0) or (throughput is not None and throughput <= 0):
+            raise ValueError("Capacity planning targets must be positive")
+        targets = [] if makespan is None else [makespan]
+        if throughput is not None:
+            targets.append(math.floor(count / throughput))
+        target = min(targets)
+        if target <= 0:
+            raise ValueError(f"A throughput of {throughput} tasks per time unit cannot be met by {count} tasks")
+        return target
+
+    def _demands(self, tasks: List[Executable], consumable_names: set) -> Tuple[Dict[str, int], Dict[str, int],
+                                                                                Dict[str, int], Dict[str, int]]:
+        """Aggregate what the process and its tasks request.
+
+        Returns:
+            Units the process itself holds per name, units consumed per consumable name,
+            the largest single request per usable name, and usable slot-time per name.
+        """
+        held = dict(self._process.demand())
+        consumed: Dict[str, int] = {}
+        largest: Dict[str, int] = {}
+        work: Dict[str, int] = {}
+        for name in consumable_names:
+            consumed[name] = 0
+        for task in tasks:
+            duration = task.planned_duration()
+            for name, amount in task.demand():
+                if name in consumable_names:
+                    consumed[name] += amount
+                else:
+                    largest[name] = max(largest.get(name, 0), amount)
+                    work[name] = work.get(name, 0) + amount * duration
+        for name, amount in held.items():
+            if name not in consumable_names:
+                largest.setdefault(name, 0)
+                work.setdefault(name, 0)
+        return held, consumed, largest, work
+
+    @staticmethod
+    def _peaks(result: SimulationResult, names: List[str]) -> Dict[str, int]:
+        """Find the most units of each usable name in use at once in a simulated timeline."""
+        changes: Dict[str, List[Tuple[int, int]]] = {name: [] for name in names}
+        for task, start, end in result.timeline():
+            for name, amount in task.demand():
+                if name in changes:
+                    changes[name].append((start, amount))
+                    changes[name].append((end, -amount))
+        peaks: Dict[str, int] = {}
+        for name, points in changes.items():
+            # Releases sort before acquisitions at the same instant.
+            points.sort()
+            level = peak = 0
+            for _, delta in points:
+                level += delta
+                peak = max(peak, level)
+            peaks[name] = peak
+        return peaks
+
+    def _search(self, fixed: Dict[str, int], lower: Dict[str, int], upper: Dict[str, int],
+                target: int) -> Dict[str, int]:
+        """Search the usable capacities between their bounds.
+
+        First the smallest point on the line from lower to upper that meets the target is
+        found by bisection; then each capacity is lowered by bisection with the others fixed,
+        until no single capacity can be lowered.
+
+        Returns:
+            The usable capacities found.
+        """
+        def meets(capacities: Dict[str, int]) -> bool:
+            result = self._simulate({**fixed, **capacities})
+            return not result.skipped and result.makespan <= target
+
+        if meets(lower):
+            return dict(lower)
+        span = max((upper[name] - lower[name] for name in lower), default=0)
+
+        def point(step: int) -> Dict[str, int]:
+            return {name: lower[name] + math.ceil((upper[name] - lower[name]) * step / span) for name in lower}
+
+        low, high = 0, span
+        while high - low > 1:
+            middle = (low + high) // 2
+            if meets(point(middle)):
+                high = middle
+            else:
+                low = middle
+        best = point(high)
+        changed = True
+        while changed:
+            changed = False
+            for name in sorted(best, key=lambda name: best[name] - lower[name], reverse=True):
+                low, high = lower[name] - 1, best[name]
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if meets({**best, name: middle}):
+                        high = middle
+                    else:
+                        low = middle
+                if high < best[name]:
+                    best[name] = high
+                    changed = True
+        return best
+
+    def _simulate(self, capacities: Dict[str, int]) -> SimulationResult:
+        """Simulate the process with overridden capacities, counting the run."""
+        self._simulations += 1
+        return Simulation(self._process, capacities, self._max_workers).run()
@@ -0,0 +1,266 @@
+"""
+File: checkpoint.py
+Purpose: Implements the CheckpointJournal class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the CheckpointJournal class, which records the progress of a Process run in
+an append-only file so that a run that crashed can be resumed instead of restarted. Each
+checkpoint appends the positions of the tasks completed since the previous one and the remaining
+capacity of the process's consumable resources. Resuming skips every task recorded as completed,
+restores the capacities of the last checkpoint and runs only the pending tasks, so its cost
+follows the remaining work; tasks completed after the last checkpoint simply run again.
+
+The file starts with a magic number and a length-prefixed JSON header naming the process, its
+task count, a digest of its task names in order and its consumable resources, followed by one
+record per checkpoint:
+
+    b"C" <uint32 byte length> <uint32 task position>... <int64 remaining capacity per consumable>
+
+Positions only identify the same tasks if the process lists them in the same order, so a journal
+is refused by a process whose task names differ or come in a different order. A record cut short
+by a crash is dropped when the journal is resumed.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+from array import array
+from src.consumable_resource import ConsumableResource
+from src.executable import Executable
+from src.resource import ResourceType
+from src.resource_pool import ResourcePool
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+FORMAT_VERSION = 2
+JOURNAL_MAGIC = b"PCKJ\x01"
+
+_CHECKPOINT = b"C"
+_LENGTH = struct.Struct("<I")
+
+class CheckpointJournal:
+    """Append-only record of the tasks a process completed and the capacity it has left.
+
+    Demonstrates encapsulation of the journal file: a Process only reports completions and
+    asks whether a task position was already completed.
+    """
+
+    def __init__(self, path: str, every: int = 100, interval: Optional[float] = None):
+        """Initialize a CheckpointJournal.
+
+        Args:
+            path: The journal file.
+            every: Completed tasks between two checkpoints.
+            interval: Seconds after which a completion triggers a checkpoint even if fewer
+                than every tasks completed (None checkpoints by count only).
+
+        Raises:
+            ValueError: If every or interval is not positive.
+        """
+        if every <= 0:
+            raise ValueError("Checkpoint frequency must be positive")
+        if interval is not None and interval <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        self._path = path
+        self._every = every
+        self._interval = interval
+        self._file: Optional[BinaryIO] = None
+        self._consumables: List[ConsumableResource] = []
+        self._done = bytearray()
+        self._completed = 0
+        self._unsaved = array("I")
+        self._saved_at = 0.0
+
+    @property
+    def path(self) -> str:
+        """Get the journal file."""
+        return self._path
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether a run is currently recorded in the journal."""
+        return self._file is not None
+
+    @property
+    def completed(self) -> int:
+        """Get the number of completed tasks, including those restored from the file."""
+        return self._completed
+
+    def is_done(self, position: int) -> bool:
+        """Check whether the task at a position completed in an earlier, checkpointed run.
+
+        Args:
+            position: The task's index in the process (or in its stream).
+        """
+        return position < len(self._done) and self._done[position] == 1
+
+    def start(self, name: str, tasks: Optional[Iterable[str]], pool: ResourcePool) -> None:
+        """Begin a fresh journal for a run, replacing any previous file.
+
+        Args:
+            name: The process name.
+            tasks: The task names in process order, or None for a stream.
+            pool: The process's pool; its own consumable resources are checkpointed.
+        """
+        self._consumables = self._own_consumables(pool)
+        self._done = bytearray()
+        self._completed = 0
+        self._unsaved = array("I")
+        header = json.dumps(self._header(name, tasks), separators=(",", ":")).encode("utf-8")
+        self._file = open(self._path, "wb")
+        self._file.write(JOURNAL_MAGIC + _LENGTH.pack(len(header)) + header)
+        self._file.flush()
+        self._saved_at = time.monotonic()
+
+    def restore(self, name: str, tasks: Optional[Iterable[str]], pool: ResourcePool) -> int:
+        """Reopen a journal to continue its run from the last checkpoint.
+
+        The completed positions are loaded and the consumable capacities are set to the
+        values of the last complete checkpoint; later completions append to the same file.
+
+        Args:
+            name: The process name.
+            tasks: The task names in process order, or None for a stream.
+            pool: The process's pool.
+
+        Returns:
+            The number of tasks that completed before the last checkpoint.
+
+        Raises:
+            ValueError: If the file is not a journal or was written for a different process,
+                including one whose tasks have other names or come in another order.
+            OSError: If the file cannot be opened.
+        """
+        consumables = self._own_consumables(pool)
+        file = open(self._path, "r+b")
+        try:
+            if file.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+                raise ValueError(f"'{self._path}' is not a checkpoint journal")
+            (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+            if json.loads(file.read(length)) != self._header(name, tasks, consumables):
+                raise ValueError(f"Checkpoint journal '{self._path}' was written for a different definition "
+                                 f"or task order of process '{name}'")
+            done = bytearray()
+            completed = 0
+            remaining: Optional[array] = None
+            snapshot = 8 * len(consumables)
+            end = file.tell()
+            while True:
+                tag, prefix = file.read(1), file.read(_LENGTH.size)
+                if tag != _CHECKPOINT or len(prefix) != _LENGTH.size:
+                    break
+                (length,) = _LENGTH.unpack(prefix)
+                body = file.read(length)
+                if len(body) != length or length < snapshot or (length - snapshot) % 4:
+                    break
+                positions = array("I", body[:length - snapshot])
+                if positions:
+                    top = max(positions)
+                    if top >= len(done):
+                        done.extend(bytes(top + 1 - len(done)))
+                    for position in positions:
+                        completed += not done[position]
+                        done[position] = 1
+                remaining = array("q", body[length - snapshot:])
+                end = file.tell()
+            file.seek(end)
+            file.truncate()
+        except (struct.error, UnicodeDecodeError, json.JSONDecodeError):
+            file.close()
+            raise ValueError(f"Checkpoint journal '{self._path}' is malformed") from None
+        except BaseException:
+            file.close()
+            raise
+        if remaining is not None:
+            for resource, capacity in zip(consumables, remaining):
+                pool.restore(resource, capacity)
+        self._consumables = consumables
+        self._done = done
+        self._completed = completed
+        self._unsaved = array("I")
+        self._file = file
+        self._saved_at = time.monotonic()
+        return completed
+
+    def record(self, position: int) -> None:
+        """Note a completed task; it is saved with the next checkpoint.
+
+        Args:
+            position: The task's index in the process (or in its stream).
+        """
+        self._unsaved.append(position)
+        self._completed += 1
+
+    @property
+    def due(self) -> bool:
+        """Check whether enough tasks completed, or enough time passed, for a checkpoint."""
+        return len(self._unsaved) >= self._every or (
+            self._interval is not None and bool(self._unsaved) and time.monotonic() - self._saved_at >= self._interval)
+
+    def checkpoint(self, running: Iterable[Executable] = ()) -> None:
+        """Append the completions since the last checkpoint and the current capacities.
+
+        Capacity consumed by running tasks is counted as still available, since those tasks
+        run again when the journal is resumed.
+
+        Args:
+            running: Tasks holding resources right now.
+        """
+        if self._file is None:
+            return
+        remaining = array("q", (resource.remaining_capacity for resource in self._consumables))
+        if running and self._consumables:
+            slots = {id(resource): i for i, resource in enumerate(self._consumables)}
+            for task in running:
+                for resource in task.assigned_resources:
+                    i = slots.get(id(resource))
+                    if i is not None:
+                        remaining[i] += task.quantity_of(resource.name)
+        body = self._unsaved.tobytes() + remaining.tobytes()
+        self._file.write(_CHECKPOINT + _LENGTH.pack(len(body)) + body)
+        self._file.flush()
+        self._unsaved = array("I")
+        self._saved_at = time.monotonic()
+
+    def close(self, running: Iterable[Executable] = ()) -> None:
+        """Take a final checkpoint and close the file.
+
+        Args:
+            running: Tasks holding resources right now; see checkpoint().
+        """
+        if self._file is None:
+            return
+        try:
+            self.checkpoint(running)
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _header(self, name: str, tasks: Optional[Iterable[str]],
+                consumables: Optional[List[ConsumableResource]] = None) -> Dict[str, Any]:
+        """Describe the run a journal belongs to."""
+        size, order = self._digest(tasks) if tasks is not None else (None, None)
+        return {"checkpoint": FORMAT_VERSION, "process": name, "tasks": size, "order": order,
+                "consumables": [[resource.name, resource.total_capacity]
+                                for resource in (self._consumables if consumables is None else consumables)]}
+
+    @staticmethod
+    def _digest(tasks: Iterable[str]) -> Tuple[int, str]:
+        """Count task names and hash them in order, so a reordered process gets another digest."""
+        digest = hashlib.sha256()
+        size = 0
+        for task in tasks:
+            encoded = task.encode("utf-8")
+            digest.update(_LENGTH.pack(len(encoded)) + encoded)
+            size += 1
+        return size, digest.hexdigest()
+
+    @staticmethod
+    def _own_consumables(pool: ResourcePool) -> List[ConsumableResource]:
+        """List the consumable resources registered in the pool itself, in insertion order."""
+        return [resource for resource in pool if resource.resource_type is ResourceType.CONSUMABLE]
@@ -11,6 +11,7 @@ resources that can be consumed like memory. It demonstrates inheritance and enca
 capacity that decreases with use, integral to the process simulation in python-oop-review.
 """
 
+from src.events import EventType, emit
 from src.resource import Resource, ResourceType
 
 class ConsumableResource(Resource):
@@ -19,6 +20,8 @@ class ConsumableResource(Resource):
     Demonstrates inheritance from Resource.
     """
 
+    __slots__ = ("_total_capacity", "_remaining_capacity")
+
     def __init__(self, name: str, capacity: int):
         """Initialize a ConsumableResource with a name and capacity.
 
@@ -43,30 +46,105 @@ class ConsumableResource(Resource):
         """
         return self._remaining_capacity > 0
 
-    def allocate(self) -> None:
-        """Allocate one unit of the resource, reducing its remaining capacity.
+    def can_allocate(self, amount: int = 1) -> bool:
+        """Check if enough capacity remains for an allocation.
+
+        Args:
+            amount: The capacity requested.
+
+        Returns:
+            True if at least amount units remain, False otherwise.
+        """
+        return self._remaining_capacity >= amount
+
+    def allocate(self, amount: int = 1) -> None:
+        """Allocate capacity from the resource, reducing its remaining capacity.
+
+        Args:
+            amount: The capacity to consume.
 
         Raises:
-            RuntimeError: If no capacity remains to allocate.
+            ValueError: If amount is not positive.
+            RuntimeError: If not enough capacity remains to allocate.
         """
-        if self._remaining_capacity <= 0:
-            raise RuntimeError(f"No remaining capacity for consumable resource '{self._name}'")
-        self._remaining_capacity -= 1
-        self._is_available = self._remaining_capacity > 0
+        if amount <= 0:
+            raise ValueError(f"Amount allocated from resource '{self._name}' must be positive")
+        with self._lock:
+            if self._remaining_capacity < amount:
+                raise RuntimeError(f"No remaining capacity for consumable resource '{self._name}'")
+            self._remaining_capacity -= amount
+            self._is_available = self._remaining_capacity > 0
+        emit(EventType.RESOURCE_ALLOCATE, self._name, amount=amount)
+        if self._metrics is not None:
+            self._metrics.record_allocation(self._name, amount)
 
-    def release(self) -> None:
+    def release(self, amount: int = 1) -> None:
         """Release the resource, updating availability status.
 
+        Args:
+            amount: The capacity that was allocated (it stays consumed).
+
         Note:
             Does not restore capacity; external replenishment is required.
         """
-        if self._remaining_capacity == 0 and not self._is_available:
-            print(f"Warning: Consumable resource '{self._name}' is depleted and cannot be reused without replenishment")
-        self._is_available = self._remaining_capacity > 0
+        with self._lock:
+            depleted = self._remaining_capacity == 0 and not self._is_available
+            self._is_available = self._remaining_capacity > 0
+        emit(EventType.RESOURCE_RELEASE, self._name, amount=amount)
+        if self._metrics is not None:
+            self._metrics.record_release(self._name, amount)
+        if depleted:
+            emit(EventType.WARNING, self._name,
+                 message=f"Consumable resource '{self._name}' is depleted and cannot be reused without replenishment")
+
+    def replenish(self, amount: int) -> int:
+        """Restore consumed capacity, up to the resource's total capacity.
+
+        Args:
+            amount: The capacity to restore.
+
+        Returns:
+            The capacity actually restored.
+
+        Raises:
+            ValueError: If amount is not positive.
+        """
+        if amount <= 0:
+            raise ValueError(f"Amount replenished for resource '{self._name}' must be positive")
+        with self._lock:
+            restored = min(amount, self._total_capacity - self._remaining_capacity)
+            self._remaining_capacity += restored
+            self._is_available = self._remaining_capacity > 0
+        if restored:
+            self._freed()
+        return restored
+
+    def restore(self, remaining: int) -> None:
+        """Set the remaining capacity, e.g. to the value recorded in a checkpoint.
+
+        Args:
+            remaining: The capacity left, between 0 and the total capacity.
+
+        Raises:
+            ValueError: If remaining is out of range.
+        """
+        if not 0 <= remaining <= self._total_capacity:
+            raise ValueError(f"Remaining capacity {remaining} of resource '{self._name}' must be between 0 "
+                             f"and {self._total_capacity}")
+        with self._lock:
+            self._remaining_capacity = remaining
+            self._is_available = remaining > 0
+        self._freed()
 
     def use(self) -> None:
-        """Display the resource usage details."""
-        print(f"    Using consumable resource '{self._name}' (remaining: {self._remaining_capacity}/{self._total_capacity} MB)")
+        """Report the resource usage details."""
+        emit(EventType.RESOURCE_USE, self._name, resource_type=self._resource_type.value,
+             remaining=self._remaining_capacity, total=self._total_capacity)
+
+    @property
+    def total_capacity(self) -> int:
+        """Get the total capacity of the resource."""
+        return self._total_capacity
 
     @property
     def remaining_capacity(self) -> int:
@@ -0,0 +1,436 @@
+"""
+File: distributed.py
+Purpose: Implements the Coordinator and WorkerNode classes for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module spreads the tasks of one Process over worker nodes that may run on other machines,
+with a ResourceBroker owning the resource pool. The Coordinator keeps the process's task graph:
+it offers the tasks whose dependencies completed, by critical-path priority, and records what the
+nodes report, replaying the events each task emitted remotely. A WorkerNode pulls a batch of
+tasks, leases their resources from the broker, executes them and reports back. Reporting a
+batch and pulling the next share one round trip to the coordinator, and the leases of a whole
+batch are reserved in one round trip to the broker and released in another, so neither service
+is consulted once per task; a batch holds its leases until its last task ran, so smaller batches
+free resources sooner. Leases are released before the batch is reported, so a task the broker
+refuses goes back to the coordinator, which offers it again after another task finishes, or skips
+it if none of its running tasks could release what it lacks. A node is alive while its connection
+to the coordinator is open; when no node has been connected for the coordinator's timeout, the
+unfinished tasks are skipped so the run still ends.
+
+Both services exchange pickled tasks and must only be reachable by trusted nodes; they bind to
+localhost by default, and WorkerNode.spawn starts local nodes in separate processes for testing.
+"""
+
+import heapq
+import multiprocessing
+import queue
+import socket
+import socketserver
+import threading
+import time
+from src.events import Event, EventSink, EventType, emit, get_sink, set_sink
+from src.executable import Executable
+from src.process import Process
+from src.resource_broker import Address, BrokerClient, receive_message, send_message
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+class Coordinator:
+    """Hands out the tasks of a process to worker nodes and collects their outcomes.
+
+    Demonstrates composition: the coordinator drives the process's task graph, while
+    execution is delegated to worker nodes and resources to a ResourceBroker.
+    """
+
+    def __init__(self, process: Process, broker: Address, host: str = "127.0.0.1", port: int = 0,
+                 poll_interval: float = 0.5, timeout: Optional[float] = 30.0):
+        """Initialize a Coordinator and bind its socket.
+
+        Args:
+            process: The process to run; its tasks must be known ahead of time and must not
+                be processes themselves.
+            broker: The (host, port) of the ResourceBroker owning the pool.
+            host: The interface nodes connect to.
+            port: The port nodes connect to (0 picks a free one; see address).
+            poll_interval: Longest time a node's request for tasks is held open while none
+                is ready.
+            timeout: Seconds without any connected worker node after which the tasks that
+                have not finished are skipped (None waits for nodes indefinitely).
+
+        Raises:
+            ValueError: If the tasks are streamed or include nested processes, or timeout
+                is not positive.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Coordinator timeout must be positive")
+        tasks = process.task_list()
+        nested = next((task for task in tasks if isinstance(task, Process)), None)
+        if nested is not None:
+            raise ValueError(f"Nested process '{nested.name}' cannot run on a worker node")
+        self._process = process
+        self._tasks = tasks
+        self._broker = broker
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._nodes = 0
+        self._alone_since = time.monotonic()
+        self._ready: List[Tuple[int, int]] = []
+        self._ready_lock = threading.Condition()
+        self._reports: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._done = False
+        coordinator = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                coordinator._serve(self.request)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.server_bind()
+        self._server.server_activate()
+
+    @property
+    def address(self) -> Address:
+        """Get the (host, port) worker nodes connect to."""
+        return self._server.server_address[:2]
+
+    def run(self) -> int:
+        """Run the process on the connected worker nodes until every task finished or was skipped.
+
+        The process's own requirements are leased from the broker for the whole run. Nodes
+        may connect before or during the run; the coordinator stops serving when it returns.
+        If no node is connected for the timeout, the tasks that did not finish are skipped.
+
+        Returns:
+            The number of tasks that completed.
+
+        Raises:
+            RuntimeError: If the broker cannot lease the process's own requirements.
+            ValueError: If the task graph is invalid.
+        """
+        process = self._process
+        tasks = self._tasks
+        schedule = process.schedule(tasks=tasks)
+        successors, indegree = process.dependency_graph(tasks)
+        priority = [schedule.priority(task) for task in tasks]
+        thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name=f"{process.name}-coordinator",
+                                  daemon=True)
+        with self._ready_lock:
+            self._alone_since = time.monotonic()
+        thread.start()
+        demand = [(name, process.quantity_of(name)) for name in process.required_resources_names]
+        with BrokerClient(self._broker, 1) as client:
+            (grant,) = client.reserve([demand])
+            try:
+                if grant[0] is None:
+                    raise RuntimeError(f"Insufficient resources in pool to start '{process.name}'")
+                emit(EventType.PROCESS_START, process.name, description=process.description,
+                     duration=process.duration_in_units)
+                completed = self._drive(successors, indegree, priority)
+                emit(EventType.PROCESS_END, process.name)
+            finally:
+                with self._ready_lock:
+                    self._done = True
+                    self._ready_lock.notify_all()
+                self._server.shutdown()
+                self._server.server_close()
+                thread.join()
+                if grant[0] is not None:
+                    client.release([grant[0]])
+        return completed
+
+    def _drive(self, successors: List[List[int]], indegree: List[int], priority: List[int]) -> int:
+        """Offer ready tasks and process reports until every task is settled.
+
+        Returns:
+            The number of tasks that completed.
+        """
+        process = self._process
+        tasks = self._tasks
+        remaining = list(indegree)
+        settled = 0
+        completed = 0
+        blocked: List[int] = []
+        failed = [False] * len(tasks)
+        done = [False] * len(tasks)
+
+        def settle(i: int, succeeded: bool) -> None:
+            nonlocal settled, completed
+            settled += 1
+            completed += succeeded
+            done[i] = True
+            stack = [(i, succeeded)]
+            while stack:
+                j, ok = stack.pop()
+                for k in successors[j]:
+                    if not ok and not failed[k]:
+                        failed[k] = True
+                        done[k] = True
+                        process.report_skip(tasks[k], "dependency", f"dependency '{tasks[j].name}' did not complete")
+                        settled += 1
+                        stack.append((k, False))
+                    elif ok:
+                        remaining[k] -= 1
+                        if remaining[k] == 0 and not failed[k]:
+                            self._offer([k], priority)
+
+        self._offer([i for i in range(len(tasks)) if indegree[i] == 0], priority)
+        finished = 0
+        # Tasks finished when each running task was taken: a refusal is stale if any finished since.
+        taken_at: Dict[int, int] = {}
+        while settled < len(tasks):
+            try:
+                kind, payload = self._reports.get(timeout=None if self._timeout is None else self._poll_interval)
+            except queue.Empty:
+                if self._alone_for() < self._timeout:
+                    continue
+                message = f"no worker node connected for {self._timeout} seconds"
+                for i in range(len(tasks)):
+                    if not done[i]:
+                        process.report_skip(tasks[i], "nodes", message)
+                break
+            if kind == "taken":
+                taken_at.update((i, finished) for i in payload)
+                continue
+            if kind == "lost":
+                # The node disconnected; the broker released its leases.
+                for i in payload:
+                    taken_at.pop(i, None)
+                self._offer(payload, priority)
+                continue
+            released = False
+            for i, outcome in payload:
+                since = taken_at.pop(i)
+                if outcome[0] == "done":
+                    finished += 1
+                    released = True
+                    error = process.replay_outcome(tasks[i], outcome[1])
+                    process.report_finish(tasks[i], error)
+                    settle(i, error is None)
+                elif outcome[1] and finished > since:
+                    self._offer([i], priority)
+                elif outcome[1]:
+                    blocked.append(i)
+                else:
+                    process.report_skip(tasks[i], "resources", "insufficient resources")
+                    settle(i, False)
+            if blocked and released:
+                self._offer(blocked, priority)
+                blocked = []
+            elif blocked and not taken_at:
+                for i in blocked:
+                    process.report_skip(tasks[i], "resources", "insufficient resources")
+                    settle(i, False)
+                blocked = []
+        return completed
+
+    def _alone_for(self) -> float:
+        """Get the seconds since the last worker node disconnected (0 while one is connected)."""
+        with self._ready_lock:
+            return 0.0 if self._nodes else time.monotonic() - self._alone_since
+
+    def _offer(self, indices: List[int], priority: List[int]) -> None:
+        """Make tasks available to worker nodes, highest priority first."""
+        with self._ready_lock:
+            for i in indices:
+                heapq.heappush(self._ready, (-priority[i], i))
+            self._ready_lock.notify_all()
+
+    def _take(self, count: int) -> Optional[List[int]]:
+        """Wait up to the poll interval for ready tasks and take at most count of them.
+
+        Returns:
+            The task indices (possibly none), or None once the run is over.
+        """
+        with self._ready_lock:
+            if not self._ready and not self._done:
+                self._ready_lock.wait(self._poll_interval)
+            if self._done:
+                return None
+            return [heapq.heappop(self._ready)[1] for _ in range(min(count, len(self._ready)))]
+
+    def _serve(self, connection: socket.socket) -> None:
+        """Answer the requests of one worker node.
+
+        A request is ("pull", outcomes, count): outcomes reports the node's previous batch as
+        (index, ("done", (events, error, seconds))) or (index, ("refused", can_wait)), and the
+        reply is ("tasks", [(index, task)...], whether to capture events) or ("stop",).
+        """
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        held: Set[int] = set()
+        with self._ready_lock:
+            self._nodes += 1
+        try:
+            while True:
+                try:
+                    _, outcomes, count = receive_message(connection)
+                except (ConnectionError, OSError):
+                    return
+                held.difference_update(i for i, _ in outcomes)
+                if outcomes:
+                    self._reports.put(("outcomes", outcomes))
+                taken = self._take(count)
+                if taken is None:
+                    send_message(connection, ("stop",))
+                    return
+                if taken:
+                    held.update(taken)
+                    self._reports.put(("taken", taken))
+                send_message(connection, ("tasks", [(i, self._tasks[i]) for i in taken], get_sink().enabled))
+        finally:
+            with self._ready_lock:
+                self._nodes -= 1
+                if not self._nodes:
+                    self._alone_since = time.monotonic()
+            if held and not self._done:
+                self._reports.put(("lost", sorted(held)))
+
+class WorkerNode:
+    """Pulls tasks from a Coordinator, leases their resources from a ResourceBroker and executes them.
+
+    Demonstrates composition: one node runs several threads that share a pool of broker
+    connections.
+    """
+
+    def __init__(self, coordinator: Address, broker: Address, threads: int = 1, batch_size: int = 8):
+        """Initialize a WorkerNode.
+
+        Args:
+            coordinator: The (host, port) of the Coordinator.
+            broker: The (host, port) of the ResourceBroker.
+            threads: Tasks executed at the same time by this node.
+            batch_size: Tasks each thread pulls and leases at once.
+
+        Raises:
+            ValueError: If threads or batch_size is not positive.
+        """
+        if threads <= 0 or batch_size <= 0:
+            raise ValueError("Worker node threads and batch size must be positive")
+        self._coordinator = tuple(coordinator)
+        self._broker = tuple(broker)
+        self._threads = threads
+        self._batch_size = batch_size
+        self._executed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def executed(self) -> int:
+        """Get the number of tasks this node executed."""
+        return self._executed
+
+    def run(self) -> int:
+        """Execute tasks until the coordinator ends the run.
+
+        Returns:
+            The number of tasks this node executed.
+
+        Raises:
+            ConnectionError: If the coordinator or the broker cannot be reached.
+        """
+        sink = _TaskEvents()
+        previous = set_sink(sink)
+        errors: List[BaseException] = []
+        try:
+            with BrokerClient(self._broker, self._threads) as client:
+
+                def loop() -> None:
+                    try:
+                        self._loop(client, sink)
+                    except BaseException as e:
+                        errors.append(e)
+
+                workers = [threading.Thread(target=loop, name=f"worker-node-{i}") for i in range(self._threads)]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+        finally:
+            set_sink(previous)
+        if errors:
+            raise errors[0]
+        return self._executed
+
+    @staticmethod
+    def spawn(coordinator: Address, broker: Address, threads: int = 1,
+              batch_size: int = 8) -> multiprocessing.Process:
+        """Start a worker node in a new local process, e.g. to test a distributed run on one machine.
+
+        Args:
+            coordinator: The (host, port) of the Coordinator.
+            broker: The (host, port) of the ResourceBroker.
+            threads: Tasks executed at the same time by the node.
+            batch_size: Tasks each thread pulls and leases at once.
+
+        Returns:
+            The started process; join it after the coordinator's run returns.
+        """
+        node = multiprocessing.Process(target=_run_node, args=(coordinator, broker, threads, batch_size), daemon=True)
+        node.start()
+        return node
+
+    def _loop(self, client: BrokerClient, sink: "_TaskEvents") -> None:
+        """Pull, lease, execute and report batches of tasks on one connection to the coordinator."""
+        outcomes: List[Tuple[int, Tuple[Any, ...]]] = []
+        with socket.create_connection(self._coordinator) as connection:
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            while True:
+                send_message(connection, ("pull", outcomes, self._batch_size))
+                reply = receive_message(connection)
+                outcomes = []
+                if reply[0] == "stop":
+                    return
+                _, batch, sink.enabled = reply
+                if not batch:
+                    continue
+                grants = client.reserve([[(name, task.quantity_of(name)) for name in task.required_resources_names]
+                                         for _, task in batch])
+                leases: List[int] = []
+                for (i, task), grant in zip(batch, grants):
+                    if grant[0] is None:
+                        outcomes.append((i, ("refused", grant[1])))
+                        continue
+                    leases.append(grant[0])
+                    with task.leased(grant[1]):
+                        outcomes.append((i, ("done", self._execute(task, sink))))
+                # Released before reporting, so the coordinator never sees a finished task still holding resources.
+                client.release(leases)
+                with self._lock:
+                    self._executed += len(leases)
+
+    @staticmethod
+    def _execute(task: Executable, sink: "_TaskEvents") -> Tuple[List[Event], Optional[Exception], float]:
+        """Execute a task whose resources are leased, capturing its events and time."""
+        events = sink.capture()
+        error: Optional[Exception] = None
+        start = time.perf_counter()
+        try:
+            task.execute()
+        except Exception as e:
+            error = e
+        finally:
+            sink.capture(None)
+        return events, error, time.perf_counter() - start
+
+class _TaskEvents(EventSink):
+    """Sink of a worker node that collects the events of the task each thread is executing."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def emit(self, event: Event) -> None:
+        """Keep the event if the emitting thread is executing a task."""
+        events = getattr(self._local, "events", None)
+        if events is not None:
+            events.append(event)
+
+    def capture(self, events: Optional[List[Event]] = ()) -> Optional[List[Event]]:
+        """Start collecting the calling thread's events into a new list, or stop with None."""
+        self._local.events = [] if events == () else events
+        return self._local.events
+
+def _run_node(coordinator: Address, broker: Address, threads: int, batch_size: int) -> None:
+    """Entry point of a worker node started by WorkerNode.spawn."""
+    WorkerNode(coordinator, broker, threads, batch_size).run()
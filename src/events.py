@@ -0,0 +1,314 @@
+"""
+File: events.py
+Purpose: Implements the structured event API for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the Event record, the EventType enumeration and the EventSink hierarchy.
+Tasks, processes and resources report what they do (starts, ends, allocations, releases, usage,
+skips, errors and warnings) through emit(), and the active sink decides what happens to the
+records: print them to the console, keep them in memory, write them to a JSON-lines file in
+batches, or drop them. A disabled sink makes emit() return before any record is built.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+class EventType(Enum):
+    """Enumeration defining the kinds of emitted events."""
+    PROCESS_START = "process_start"
+    PROCESS_END = "process_end"
+    PROCESS_ERROR = "process_error"
+    TASK_START = "task_start"
+    TASK_END = "task_end"
+    TASK_SKIP = "task_skip"
+    TASK_ERROR = "task_error"
+    RESOURCE_ALLOCATE = "resource_allocate"
+    RESOURCE_RELEASE = "resource_release"
+    RESOURCE_USE = "resource_use"
+    WARNING = "warning"
+
+class Event:
+    """Structured record of something that happened during execution.
+
+    Demonstrates encapsulation of the event fields behind read-only properties.
+    """
+
+    def __init__(self, event_type: EventType, source: str, data: Dict[str, Any], timestamp: float):
+        """Initialize an Event.
+
+        Args:
+            event_type: The kind of event.
+            source: The name of the task, process or resource that emitted it.
+            data: Event-specific fields.
+            timestamp: Wall-clock time of the event in seconds since the epoch.
+        """
+        self._event_type = event_type
+        self._source = source
+        self._data = data
+        self._timestamp = timestamp
+
+    @property
+    def event_type(self) -> EventType:
+        """Get the kind of event."""
+        return self._event_type
+
+    @property
+    def source(self) -> str:
+        """Get the name of the emitting entity."""
+        return self._source
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Get the event-specific fields."""
+        return self._data
+
+    @property
+    def timestamp(self) -> float:
+        """Get the wall-clock time of the event."""
+        return self._timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-serializable dictionary.
+
+        Returns:
+            The event type, source, timestamp and data fields in one flat mapping.
+        """
+        record = {"event": self._event_type.value, "source": self._source, "timestamp": self._timestamp}
+        record.update(self._data)
+        return record
+
+class EventSink(ABC):
+    """Abstract destination for emitted events.
+
+    Demonstrates abstraction: emitters do not know whether events are printed, stored or dropped.
+    """
+
+    enabled = True
+
+    @abstractmethod
+    def emit(self, event: Event) -> None:
+        """Handle one event.
+
+        Args:
+            event: The event to handle.
+        """
+        pass
+
+    def flush(self) -> None:
+        """Push out any buffered events."""
+        pass
+
+    def close(self) -> None:
+        """Flush and release the sink's resources."""
+        self.flush()
+
+    def __enter__(self) -> "EventSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class NullSink(EventSink):
+    """Sink that discards every event; emit() skips building records entirely."""
+
+    enabled = False
+
+    def emit(self, event: Event) -> None:
+        """Discard the event."""
+        pass
+
+class MemorySink(EventSink):
+    """Sink that keeps events in memory, optionally only the most recent ones."""
+
+    def __init__(self, capacity: Optional[int] = None):
+        """Initialize a MemorySink.
+
+        Args:
+            capacity: Maximum number of events kept (None keeps all of them).
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Event buffer capacity must be positive")
+        self._events: Deque[Event] = deque(maxlen=capacity)
+
+    def emit(self, event: Event) -> None:
+        """Store the event, evicting the oldest one when the buffer is full."""
+        self._events.append(event)
+
+    @property
+    def events(self) -> List[Event]:
+        """Get the stored events, oldest first."""
+        return list(self._events)
+
+    def clear(self) -> None:
+        """Drop every stored event."""
+        self._events.clear()
+
+class JsonLinesSink(EventSink):
+    """Sink that appends events to a file as JSON lines, written in batches."""
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """Initialize a JsonLinesSink.
+
+        Args:
+            path: The file to append to.
+            batch_size: Number of events buffered before they are written.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError("Event batch size must be positive")
+        self._file = open(path, "a", encoding="utf-8")
+        self._batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event) -> None:
+        """Buffer the event and write the batch once it is full."""
+        with self._lock:
+            self._buffer.append(event.to_dict())
+            if len(self._buffer) >= self._batch_size:
+                self._write()
+
+    def flush(self) -> None:
+        """Write the buffered events and flush the file."""
+        with self._lock:
+            self._write()
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered events and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def _write(self) -> None:
+        """Write the buffer to the file (caller holds the lock)."""
+        if self._buffer:
+            self._file.write("".join(json.dumps(record, default=str) + "\n" for record in self._buffer))
+            self._buffer.clear()
+
+class ConsoleSink(EventSink):
+    """Sink that prints events as the human-readable console messages of the simulation."""
+
+    def emit(self, event: Event) -> None:
+        """Print the event if it has a console message."""
+        message = self.format(event)
+        if message is not None:
+            print(message)
+
+    @staticmethod
+    def format(event: Event) -> Optional[str]:
+        """Render an event as a console line.
+
+        Args:
+            event: The event to render.
+
+        Returns:
+            The console line, or None for events that are not shown on the console.
+        """
+        data = event.data
+        kind = event.event_type
+        if kind is EventType.PROCESS_START:
+            return (f"Executing process '{event.source}': {data['description']} "
+                    f"(Duration: {data['duration']} units)")
+        if kind is EventType.PROCESS_END:
+            return f"Process '{event.source}' completed."
+        if kind is EventType.PROCESS_ERROR:
+            return f"Error in process '{event.source}': {data['error']}"
+        if kind is EventType.TASK_START:
+            return (f"  Executing task '{event.source}': {data['description']} "
+                    f"(Duration: {data['duration']} units)")
+        if kind is EventType.TASK_SKIP:
+            return f"  Task '{event.source}' skipped: {data['reason']}"
+        if kind is EventType.TASK_ERROR:
+            return f"  Error in '{event.source}': {data['error']}"
+        if kind is EventType.RESOURCE_USE:
+            if data["resource_type"] == "Usable":
+                return (f"    Using usable resource '{event.source}' (capacity: {data['capacity']} GHz, "
+                        f"in use: {data['in_use']}/{data['capacity']})")
+            return (f"    Using consumable resource '{event.source}' "
+                    f"(remaining: {data['remaining']}/{data['total']} MB)")
+        if kind is EventType.WARNING:
+            return f"Warning: {data['message']}"
+        return None
+
+class MultiSink(EventSink):
+    """Sink that forwards every event to several sinks."""
+
+    def __init__(self, sinks: Iterable[EventSink]):
+        """Initialize a MultiSink.
+
+        Args:
+            sinks: The sinks to forward to; disabled ones are left out.
+        """
+        self._sinks = [sink for sink in sinks if sink.enabled]
+        self.enabled = bool(self._sinks)
+
+    def emit(self, event: Event) -> None:
+        """Forward the event to every sink."""
+        for sink in self._sinks:
+            sink.emit(event)
+
+    def flush(self) -> None:
+        """Flush every sink."""
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        """Close every sink."""
+        for sink in self._sinks:
+            sink.close()
+
+_sink: EventSink = ConsoleSink()
+
+def get_sink() -> EventSink:
+    """Get the sink that currently receives emitted events."""
+    return _sink
+
+def set_sink(sink: EventSink) -> EventSink:
+    """Route emitted events to another sink.
+
+    Args:
+        sink: The sink to use from now on.
+
+    Returns:
+        The previously active sink, so callers can restore it.
+    """
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+def replay(events: Iterable[Event]) -> None:
+    """Send events that were recorded elsewhere (e.g., in a worker process) to the active sink.
+
+    Args:
+        events: The recorded events, oldest first; their timestamps are kept.
+    """
+    sink = _sink
+    if sink.enabled:
+        for event in events:
+            sink.emit(event)
+
+def emit(event_type: EventType, source: str, **data: Any) -> None:
+    """Send an event to the active sink.
+
+    Args:
+        event_type: The kind of event.
+        source: The name of the emitting entity.
+        **data: Event-specific fields.
+    """
+    sink = _sink
+    if sink.enabled:
+        sink.emit(Event(event_type, source, data, time.time()))
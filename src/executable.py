@@ -9,11 +9,43 @@ License: MIT
 This module provides the Executable abstract base class, illustrating abstraction in OOP.
 It serves as the foundation for Task and Process classes, defining common behavior for entities
 that require resources to execute, central to the process simulation in python-oop-review.
+Executables use __slots__, intern their requirement lists and share empty containers so that
+processes with millions of tasks stay compact. An input fingerprint makes an executable's result
+addressable by content, so a result cache can complete it without running it again.
 """
 
+import hashlib
+import json
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from types import MappingProxyType
+from src.events import EventType, emit
+from src.metrics import Metrics, timed_phase
 from src.resource import Resource
-from typing import List
+from src.resource_pool import ResourcePool
+from src.resource_tracer import get_tracer
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+_NO_QUANTITIES: Mapping[str, int] = MappingProxyType({})
+_requirement_lists: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+def intern_requirements(names: Iterable[str]) -> Tuple[str, ...]:
+    """Return a shared, immutable copy of a list of required resource names.
+
+    Executables with the same requirements reuse one tuple of interned strings.
+
+    Args:
+        names: The required resource names.
+
+    Returns:
+        The canonical tuple for those names.
+    """
+    key = tuple(names)
+    shared = _requirement_lists.get(key)
+    if shared is None:
+        shared = _requirement_lists[key] = tuple(sys.intern(name) for name in key)
+    return shared
 
 class Executable(ABC):
     """Abstract base class for entities that can be executed with resource requirements.
@@ -21,7 +53,12 @@ class Executable(ABC):
     Demonstrates abstraction and serves as a base for Task and Process.
     """
 
-    def __init__(self, name: str, description: str, required_resources_names: List[str], duration_in_units: int):
+    __slots__ = ("_name", "_description", "_required_resources_names", "_duration_in_units", "_assigned_resources",
+                 "_assigned_pool", "_quantities", "_metrics", "_dependencies", "_fingerprint", "__weakref__")
+
+    def __init__(self, name: str, description: str, required_resources_names: List[str], duration_in_units: int,
+                 dependencies: Optional[List["Executable"]] = None, quantities: Optional[Dict[str, int]] = None,
+                 fingerprint: Optional[str] = None):
         """Initialize an Executable entity.
 
         Args:
@@ -29,19 +66,33 @@ class Executable(ABC):
             description: A description of the entity's purpose.
             required_resources_names: Names of resources required for execution.
             duration_in_units: Duration of execution in time units.
+            dependencies: Entities that must complete before this one can start.
+            quantities: Units needed per required resource name (e.g., CPU slots); names
+                not listed need one unit.
+            fingerprint: Digest of the entity's inputs; see set_fingerprint.
 
         Raises:
-            ValueError: If name is empty or duration is not positive.
+            ValueError: If name is empty, duration is not positive or a quantity is not positive.
         """
         if not name:
             raise ValueError("Executable name cannot be empty")
         if duration_in_units <= 0:
             raise ValueError(f"Duration for '{name}' must be positive")
+        for resource_name, amount in (quantities or {}).items():
+            if amount <= 0:
+                raise ValueError(f"Quantity of '{resource_name}' for '{name}' must be positive")
         self._name = name
-        self._description = description
-        self._required_resources_names = required_resources_names
+        self._description = sys.intern(description)
+        self._required_resources_names = intern_requirements(required_resources_names)
         self._duration_in_units = duration_in_units
-        self._assigned_resources: List[Resource] = []
+        self._assigned_resources: Sequence[Resource] = ()
+        self._assigned_pool: Optional[ResourcePool] = None
+        self._quantities: Mapping[str, int] = dict(quantities) if quantities else _NO_QUANTITIES
+        self._metrics: Optional[Metrics] = None
+        self._dependencies: Sequence[Executable] = ()
+        self._fingerprint = fingerprint
+        for dependency in dependencies or ():
+            self.add_dependency(dependency)
 
     @property
     def name(self) -> str:
@@ -49,8 +100,13 @@ class Executable(ABC):
         return self._name
 
     @property
-    def required_resources_names(self) -> List[str]:
-        """Get the names of required resources."""
+    def description(self) -> str:
+        """Get the entity's description."""
+        return self._description
+
+    @property
+    def required_resources_names(self) -> Sequence[str]:
+        """Get the names of required resources (a shared, read-only sequence)."""
         return self._required_resources_names
 
     @property
@@ -58,39 +114,268 @@ class Executable(ABC):
         """Get the execution duration."""
         return self._duration_in_units
 
-    def assign_resources(self, resource_pool: List[Resource]) -> None:
-        """Assign required resources from a pool.
+    def planned_duration(self) -> int:
+        """Get the duration schedulers should plan for.
+
+        Returns:
+            The declared duration in time units.
+        """
+        return self._duration_in_units
+
+    @property
+    def required_quantities(self) -> Mapping[str, int]:
+        """Get the units needed per resource name, for names that need more than one."""
+        return self._quantities
+
+    def quantity_of(self, resource_name: str) -> int:
+        """Get the units needed of a required resource.
+
+        Args:
+            resource_name: The name of a required resource.
+
+        Returns:
+            The declared quantity, or 1 if none was declared.
+        """
+        return self._quantities.get(resource_name, 1)
+
+    def demand(self) -> List[Tuple[str, int]]:
+        """Collapse the required names and their quantities into (name, amount) pairs.
+
+        Returns:
+            One pair per distinct required name, in requirement order, with the units needed
+            for every occurrence of the name.
+        """
+        amounts: Dict[str, int] = {}
+        for name in self._required_resources_names:
+            amounts[name] = amounts.get(name, 0) + self.quantity_of(name)
+        return list(amounts.items())
+
+    @property
+    def assigned_resources(self) -> Sequence[Resource]:
+        """Get the resources currently assigned to the entity, in requirement order."""
+        return self._assigned_resources
+
+    @property
+    def dependencies(self) -> Sequence["Executable"]:
+        """Get the entities that must complete before this one can start."""
+        return self._dependencies
+
+    def add_dependency(self, dependency: "Executable") -> None:
+        """Declare that another entity must complete before this one can start.
+
+        Args:
+            dependency: The entity this one depends on.
+
+        Raises:
+            ValueError: If the entity would depend on itself.
+        """
+        if dependency is self:
+            raise ValueError(f"'{self._name}' cannot depend on itself")
+        if dependency not in self._dependencies:
+            if not isinstance(self._dependencies, list):
+                self._dependencies = list(self._dependencies)
+            self._dependencies.append(dependency)
+
+    def instrument(self, metrics: Optional[Metrics]) -> None:
+        """Attach a metrics collector to the entity, or detach it with None.
+
+        Args:
+            metrics: The collector that records the entity's phase times.
+        """
+        self._metrics = metrics
+
+    def assign_resources(self, resource_pool: ResourcePool) -> None:
+        """Assign required resources from a pool, all or nothing.
 
         Args:
             resource_pool: The pool of available resources.
 
         Raises:
+            TypeError: If resource_pool is not a ResourcePool.
             RuntimeError: If any required resource is unavailable.
         """
-        self._assigned_resources.clear()
+        if not self.try_assign_resources(resource_pool):
+            raise RuntimeError(f"Resource '{self._missing_resource(resource_pool)}' not available for '{self._name}'")
+
+    @timed_phase("assign")
+    def try_assign_resources(self, resource_pool: ResourcePool) -> bool:
+        """Check and assign required resources in one step, all or nothing.
+
+        Unlike can_execute followed by assign_resources, the pool is searched once, and a
+        request the pool has already refused since its last release is rejected without
+        searching at all.
+
+        Args:
+            resource_pool: The pool of available resources.
+
+        Returns:
+            True if every required resource was assigned, False if none was.
+
+        Raises:
+            TypeError: If resource_pool is not a ResourcePool.
+        """
+        pool = self._indexed(resource_pool)
+        self._assigned_resources = ()
         if not self._required_resources_names:
-            return
+            return True
 
-        for resource_name in self._required_resources_names:
-            found = False
-            for resource in resource_pool:
-                if resource.name == resource_name and resource.is_available_for_use():
-                    resource.allocate()
-                    self._assigned_resources.append(resource)
-                    found = True
-                    break
-            if not found:
-                self.release_resources()
-                raise RuntimeError(f"Resource '{resource_name}' not available for '{self._name}'")
+        reserved = pool.reserve((name, self.quantity_of(name)) for name in self._required_resources_names)
+        tracer = get_tracer()
+        if reserved is None:
+            if self._metrics is not None or tracer is not None:
+                missing = self._missing_resource(pool)
+                if self._metrics is not None:
+                    self._metrics.record_contention(missing)
+                if tracer is not None:
+                    tracer.refused(self, missing)
+            return False
+        self._assigned_pool = pool
+        self._assigned_resources = reserved
+        if tracer is not None:
+            tracer.acquired(self, reserved)
+        return True
+
+    @contextmanager
+    def leased(self, resources: Sequence[Resource]) -> Iterator["Executable"]:
+        """Assign resources allocated elsewhere (e.g., leased from a ResourceBroker) for a with block.
+
+        The entity does not release them; they are unassigned when the block ends, and the
+        caller returns them to whoever allocated them.
+
+        Args:
+            resources: One allocated resource per required name, in requirement order.
+
+        Yields:
+            The entity, ready to execute.
+
+        Raises:
+            ValueError: If the number of resources does not match the requirements.
+        """
+        if len(resources) != len(self._required_resources_names):
+            raise ValueError(f"'{self._name}' needs {len(self._required_resources_names)} resources, "
+                             f"not {len(resources)}")
+        self._assigned_resources = tuple(resources)
+        self._assigned_pool = None
+        try:
+            yield self
+        finally:
+            self._assigned_resources = ()
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Get the digest of the entity's inputs, or None if its results are not cached."""
+        return self._fingerprint
+
+    def set_fingerprint(self, fingerprint: Optional[str]) -> None:
+        """Declare the entity deterministic, with inputs summarized by a fingerprint.
 
+        An entity with a fingerprint may be completed from a Process's result cache
+        instead of being executed, as long as its definition, fingerprint and dependencies
+        are unchanged (e.g., use result_cache.file_fingerprint over the files it reads).
+
+        Args:
+            fingerprint: The digest of the inputs, or None to always execute the entity.
+        """
+        self._fingerprint = fingerprint
+
+    def cache_key(self, known: Optional[MutableMapping["Executable", Optional[str]]] = None) -> Optional[str]:
+        """Compute the content address of the entity's result.
+
+        The key digests the entity's class, name, description, duration, requirements,
+        quantities and fingerprint together with the keys of its dependencies, so changing
+        an upstream input changes every key downstream of it.
+
+        Args:
+            known: Keys computed before, by entity; filled with the keys computed here.
+
+        Returns:
+            The hex key, or None if the entity or one of its dependencies has no fingerprint.
+        """
+        known = {} if known is None else known
+        stack: List[Executable] = [self]
+        while stack:
+            entity = stack[-1]
+            if entity in known:
+                stack.pop()
+                continue
+            pending = [dependency for dependency in entity._dependencies if dependency not in known]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            dependency_keys = [known[dependency] for dependency in entity._dependencies]
+            if entity._fingerprint is None or None in dependency_keys:
+                known[entity] = None
+                continue
+            cls = type(entity)
+            identity = [f"{cls.__module__}.{cls.__qualname__}", entity._name, entity._description,
+                        entity._duration_in_units, list(entity._required_resources_names),
+                        sorted(entity._quantities.items()), entity._fingerprint, dependency_keys]
+            known[entity] = hashlib.sha256(json.dumps(identity, separators=(",", ":")).encode("utf-8")).hexdigest()
+        return known[self]
+
+    def _indexed(self, resource_pool: ResourcePool) -> ResourcePool:
+        """Check that resources come indexed; re-indexing a plain list on every call would cost O(pool)."""
+        if not isinstance(resource_pool, ResourcePool):
+            raise TypeError(f"Resources for '{self._name}' must be a ResourcePool; index a list once with "
+                            f"ResourcePool.of")
+        return resource_pool
+
+    def _missing_resource(self, pool: ResourcePool) -> str:
+        """Name the first required resource the pool cannot currently provide."""
+        return next((name for name in self._required_resources_names
+                     if not pool.is_available(name, self.quantity_of(name))),
+                    self._required_resources_names[0])
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Copy the entity's state for pickling, e.g. to execute it in a worker process.
+
+        The copy keeps snapshots of its assigned resources but drops the pool, the metrics
+        collector and its dependencies; resource accounting stays with the original.
+        Attributes of subclasses that do not declare __slots__ are copied as well.
+        """
+        state = dict(getattr(self, "__dict__", ()))
+        state.update((slot, getattr(self, slot)) for cls in type(self).__mro__
+                     for slot in getattr(cls, "__slots__", ()) if slot != "__weakref__" and hasattr(self, slot))
+        state["_assigned_pool"] = None
+        state["_metrics"] = None
+        state["_dependencies"] = ()
+        if state.get("_quantities") is _NO_QUANTITIES:
+            state["_quantities"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled entity."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        if self._quantities is None:
+            self._quantities = _NO_QUANTITIES
+
+    @timed_phase("release")
     def release_resources(self) -> None:
-        """Release all assigned resources."""
+        """Release all assigned resources.
+
+        A resource whose release fails is reported with a warning and stays allocated; with
+        tracing enabled (see resource_tracer) it is also recorded as a leak.
+        """
+        pool = self._assigned_pool
+        tracer = get_tracer()
         for resource in self._assigned_resources:
             try:
-                resource.release()
+                if pool is not None:
+                    pool.release(resource, self.quantity_of(resource.name))
+                else:
+                    resource.release(self.quantity_of(resource.name))
             except Exception as e:
-                print(f"Warning: Failed to release resource '{resource.name}' in '{self._name}': {e}")
-        self._assigned_resources.clear()
+                emit(EventType.WARNING, self._name,
+                     message=f"Failed to release resource '{resource.name}' in '{self._name}': {e}")
+                if tracer is not None:
+                    tracer.released(self, resource, e)
+            else:
+                if tracer is not None:
+                    tracer.released(self, resource)
+        self._assigned_resources = ()
+        self._assigned_pool = None
 
     @abstractmethod
     def execute(self) -> None:
@@ -101,7 +386,8 @@ class Executable(ABC):
         """
         pass
 
-    def can_execute(self, resource_pool: List[Resource]) -> bool:
+    @timed_phase("can_execute")
+    def can_execute(self, resource_pool: ResourcePool) -> bool:
         """Check if the entity can be executed with the given resource pool.
 
         Args:
@@ -109,10 +395,16 @@ class Executable(ABC):
 
         Returns:
             True if all required resources are available, False otherwise.
+
+        Raises:
+            TypeError: If resource_pool is not a ResourcePool.
         """
+        pool = self._indexed(resource_pool)
         if not self._required_resources_names:
             return True
         for resource_name in self._required_resources_names:
-            if not any(r.name == resource_name and r.is_available_for_use() for r in resource_pool):
+            if not pool.is_available(resource_name, self.quantity_of(resource_name)):
+                if self._metrics is not None:
+                    self._metrics.record_contention(resource_name)
                 return False
         return True
\ No newline at end of file
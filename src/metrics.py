@@ -0,0 +1,257 @@
+"""
+File: metrics.py
+Purpose: Implements the Metrics collector for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the Metrics class and the timed_phase decorator. Executables and resources
+carry an optional Metrics reference; when a Process enables metrics it hands the same collector to
+its tasks and pool resources, which then record wall time per task phase (can_execute, assign,
+execute, release), allocations, contention and wait time per resource, and task outcomes. A
+process's own execute call spans those of its tasks, so it is recorded as the separate
+process_execute phase rather than counting that time twice. When no collector is attached each
+hook costs a single attribute check.
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+PHASES = ("can_execute", "assign", "execute", "release")
+
+def timed_phase(phase: str) -> Callable:
+    """Decorate an Executable method so its wall time is recorded as a task phase.
+
+    Args:
+        phase: The phase name to record under.
+
+    Returns:
+        A decorator that times the method only while the instance has a Metrics attached.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self._metrics
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                metrics.record_phase(self._name, phase, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+class Metrics:
+    """Thread-safe collector of per-task and per-resource execution metrics.
+
+    Demonstrates encapsulation: counters are updated through record_* methods and read
+    through snapshot() or to_prometheus().
+    """
+
+    def __init__(self, process_name: str):
+        """Initialize an empty Metrics collector.
+
+        Args:
+            process_name: The name of the process being measured (used as a label).
+        """
+        self._process_name = process_name
+        self._lock = threading.Lock()
+        self._phase_seconds: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self._phase_counts: Dict[str, int] = {phase: 0 for phase in PHASES}
+        self._task_phases: Dict[str, Dict[str, float]] = {}
+        self._resources: Dict[str, Dict[str, float]] = {}
+        self._skipped: Dict[str, int] = {}
+        self._completed = 0
+        self._failed = 0
+        self._cached = 0
+
+    @property
+    def process_name(self) -> str:
+        """Get the name of the measured process."""
+        return self._process_name
+
+    def record_phase(self, task_name: str, phase: str, seconds: float) -> None:
+        """Add wall time spent by a task in one phase.
+
+        Args:
+            task_name: The task's name.
+            phase: One of can_execute, assign, execute or release (process_execute for the
+                time a process spends running its tasks).
+            seconds: The elapsed wall time.
+        """
+        with self._lock:
+            self._phase_seconds[phase] = self._phase_seconds.get(phase, 0.0) + seconds
+            self._phase_counts[phase] = self._phase_counts.get(phase, 0) + 1
+            phases = self._task_phases.setdefault(task_name, {})
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def record_allocation(self, resource_name: str, amount: int) -> None:
+        """Count an allocation of a resource.
+
+        Args:
+            resource_name: The resource's name.
+            amount: The units allocated.
+        """
+        with self._lock:
+            counters = self._resource(resource_name)
+            counters["allocations"] += 1
+            counters["units_allocated"] += amount
+
+    def record_release(self, resource_name: str, amount: int) -> None:
+        """Count a release of a resource.
+
+        Args:
+            resource_name: The resource's name.
+            amount: The units released.
+        """
+        with self._lock:
+            counters = self._resource(resource_name)
+            counters["releases"] += 1
+            counters["units_released"] += amount
+
+    def record_contention(self, resource_name: str) -> None:
+        """Count a request that found a resource unavailable.
+
+        Args:
+            resource_name: The resource's name.
+        """
+        with self._lock:
+            self._resource(resource_name)["contentions"] += 1
+
+    def record_wait(self, resource_name: str, seconds: float) -> None:
+        """Add time a request spent waiting for a resource.
+
+        Args:
+            resource_name: The resource's name.
+            seconds: The elapsed wall time.
+        """
+        with self._lock:
+            self._resource(resource_name)["wait_seconds"] += seconds
+
+    def record_skip(self, task_name: str, reason: str) -> None:
+        """Count a skipped task.
+
+        Args:
+            task_name: The task's name.
+            reason: Why it was skipped.
+        """
+        with self._lock:
+            self._skipped[reason] = self._skipped.get(reason, 0) + 1
+
+    def record_outcome(self, task_name: str, succeeded: bool) -> None:
+        """Count a task that finished executing.
+
+        Args:
+            task_name: The task's name.
+            succeeded: False if the task raised an error.
+        """
+        with self._lock:
+            if succeeded:
+                self._completed += 1
+            else:
+                self._failed += 1
+
+    def record_cached(self, task_name: str) -> None:
+        """Count a task completed from the result cache without executing.
+
+        Args:
+            task_name: The task's name.
+        """
+        with self._lock:
+            self._cached += 1
+
+    @property
+    def skipped_count(self) -> int:
+        """Get the number of skipped tasks."""
+        return sum(self._skipped.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy the current values into plain dictionaries.
+
+        Returns:
+            Phase totals, per-task phase times, per-resource counters and task outcomes.
+        """
+        with self._lock:
+            return {
+                "process": self._process_name,
+                "phases": {phase: {"seconds": seconds, "count": self._phase_counts[phase]}
+                           for phase, seconds in self._phase_seconds.items()},
+                "tasks": {name: dict(phases) for name, phases in self._task_phases.items()},
+                "resources": {name: dict(counters) for name, counters in self._resources.items()},
+                "completed": self._completed,
+                "failed": self._failed,
+                "cached": self._cached,
+                "skipped": dict(self._skipped),
+            }
+
+    def reset(self) -> None:
+        """Clear every recorded value."""
+        with self._lock:
+            self._phase_seconds = {phase: 0.0 for phase in PHASES}
+            self._phase_counts = {phase: 0 for phase in PHASES}
+            self._task_phases.clear()
+            self._resources.clear()
+            self._skipped.clear()
+            self._completed = 0
+            self._failed = 0
+            self._cached = 0
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Per-task times are aggregated by phase to keep label cardinality bounded.
+
+        Returns:
+            The exposition text.
+        """
+        snapshot = self.snapshot()
+        process = self._escape(self._process_name)
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples: List[tuple]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join([f'process="{process}"'] + [f'{key}="{self._escape(str(val))}"'
+                                                                 for key, val in labels])
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        phases = snapshot["phases"]
+        family("process_task_phase_seconds_total", "counter", "Wall time spent by tasks per phase.",
+               [((("phase", phase),), values["seconds"]) for phase, values in phases.items()])
+        family("process_task_phase_calls_total", "counter", "Number of timed calls per phase.",
+               [((("phase", phase),), values["count"]) for phase, values in phases.items()])
+        resources = snapshot["resources"]
+        for counter, help_text in (("allocations", "Number of allocations per resource."),
+                                   ("units_allocated", "Units allocated per resource."),
+                                   ("releases", "Number of releases per resource."),
+                                   ("contentions", "Requests that found the resource unavailable."),
+                                   ("wait_seconds", "Time spent waiting for the resource.")):
+            family(f"process_resource_{counter}_total", "counter", help_text,
+                   [((("resource", name),), values[counter]) for name, values in resources.items()])
+        family("process_tasks_completed_total", "counter", "Tasks that executed successfully.",
+               [((), snapshot["completed"])])
+        family("process_tasks_failed_total", "counter", "Tasks that raised an error.", [((), snapshot["failed"])])
+        family("process_tasks_cached_total", "counter", "Tasks completed from the result cache.",
+               [((), snapshot["cached"])])
+        family("process_tasks_skipped_total", "counter", "Tasks that were skipped, by reason.",
+               [((("reason", reason),), count) for reason, count in snapshot["skipped"].items()])
+        return "\n".join(lines) + "\n"
+
+    def _resource(self, resource_name: str) -> Dict[str, float]:
+        """Get a resource's counters, creating them on first use (caller holds the lock)."""
+        counters = self._resources.get(resource_name)
+        if counters is None:
+            counters = self._resources[resource_name] = {"allocations": 0, "units_allocated": 0, "releases": 0,
+                                                         "units_released": 0, "contentions": 0,
+                                                         "wait_seconds": 0.0}
+        return counters
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a Prometheus label value."""
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
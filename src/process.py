@@ -9,11 +9,116 @@ License: MIT
 This module defines the Process class, inheriting from Executable to manage a sequence of tasks.
 It demonstrates composition and polymorphism in OOP, orchestrating tasks and resources in the
 compilation simulation for python-oop-review, showcasing hierarchical process management.
+Concurrent tasks run on a thread pool by default, or on a process pool for CPU-bound task bodies;
+either way resources are assigned and released by the parent process. Tasks are held in a list,
+a columnar TaskTable, or read lazily from a TaskSource stream; run_async runs a process from a
+coroutine, reading an async stream on the caller's event loop. A run can record its progress in
+a CheckpointJournal and be resumed from it after a crash.
 """
 
+import asyncio
+import heapq
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from enum import Enum
+from weakref import WeakKeyDictionary
+from src.checkpoint import CheckpointJournal
+from src.events import Event, EventType, MemorySink, NullSink, emit, get_sink, replay, set_sink
 from src.executable import Executable
+from src.metrics import Metrics, timed_phase
 from src.resource import Resource
-from typing import List
+from src.resource_pool import ResourcePool
+from src.resource_tracer import get_tracer
+from src.result_cache import ResultCache
+from src.retry_policy import RetryPolicy
+from src.task_source import TaskSource
+from src.task_table import TaskTable
+from src.wait_queue import WaitQueue
+from typing import AsyncIterable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+class ExecutionBackend(Enum):
+    """Enumeration defining where concurrent task bodies run."""
+    THREAD = "thread"
+    PROCESS = "process"
+
+def _execute_in_worker(task: Executable, capture: bool) -> Tuple[List[Event], Optional[Exception], float]:
+    """Execute a pickled task in a worker process (process-pool entry point).
+
+    Args:
+        task: A copy of the task, holding snapshots of its assigned resources.
+        capture: Whether to record the events the task emits so the parent can replay them.
+
+    Returns:
+        The captured events, the exception the task raised (or None) and the seconds it took.
+    """
+    sink = MemorySink() if capture else NullSink()
+    previous = set_sink(sink)
+    error: Optional[Exception] = None
+    start = time.perf_counter()
+    try:
+        task.execute()
+    except Exception as e:
+        error = e
+    finally:
+        set_sink(previous)
+    return (sink.events if capture else []), error, time.perf_counter() - start
+
+class Schedule:
+    """Critical-path ordering of a process's task graph.
+
+    Demonstrates encapsulation of the scheduling results computed by Process.schedule.
+    """
+
+    def __init__(self, order: List[Executable], bottom_levels: Dict[int, int], makespan: int,
+                 critical_path: List[Executable]):
+        """Initialize a Schedule.
+
+        Args:
+            order: Tasks in the order a list scheduler starts them.
+            bottom_levels: Longest remaining path (in time units) from each task, keyed by id(task).
+            makespan: Time units from the first start to the last finish.
+            critical_path: The longest dependency chain through the graph.
+        """
+        self._order = order
+        self._bottom_levels = bottom_levels
+        self._makespan = makespan
+        self._critical_path = critical_path
+
+    @property
+    def order(self) -> List[Executable]:
+        """Get the tasks in start order."""
+        return self._order
+
+    @property
+    def makespan(self) -> int:
+        """Get the time units from the first start to the last finish."""
+        return self._makespan
+
+    @property
+    def critical_path(self) -> List[Executable]:
+        """Get the longest dependency chain through the graph."""
+        return self._critical_path
+
+    @property
+    def critical_path_length(self) -> int:
+        """Get the duration of the critical path, a lower bound for any makespan."""
+        if not self._critical_path:
+            return 0
+        return self._bottom_levels[id(self._critical_path[0])]
+
+    def priority(self, task: Executable) -> int:
+        """Get the longest remaining path from a task, including its own duration.
+
+        Args:
+            task: A task of the scheduled process.
+
+        Returns:
+            The task's bottom level in time units.
+        """
+        return self._bottom_levels[id(task)]
 
 class Process(Executable):
     """Concrete implementation of Executable for managing a sequence of tasks.
@@ -21,7 +126,13 @@ class Process(Executable):
     Demonstrates composition and polymorphism.
     """
 
-    def __init__(self, name: str, description: str, required_resources_names: List[str], duration_in_units: int):
+    __slots__ = ("_resource_pool", "_tasks", "_max_workers", "_backend", "_retry_policy", "_checkpoint", "_cache")
+
+    def __init__(self, name: str, description: str, required_resources_names: List[str], duration_in_units: int,
+                 max_workers: int = 1, dependencies: Optional[List[Executable]] = None,
+                 quantities: Optional[Dict[str, int]] = None,
+                 backend: Union[ExecutionBackend, str] = ExecutionBackend.THREAD,
+                 retry_policy: Optional[RetryPolicy] = None):
         """Initialize a Process to manage a sequence of tasks.
 
         Args:
@@ -29,10 +140,132 @@ class Process(Executable):
             description: A description of the process's purpose.
             required_resources_names: Names of resources required if acting as a task.
             duration_in_units: Duration of execution in time units.
+            max_workers: Number of tasks that may run at the same time (1 runs them sequentially).
+            dependencies: Entities that must complete before this process can start.
+            quantities: Units needed per required resource name if acting as a task.
+            backend: Where task bodies run: threads of this process, or worker processes
+                (tasks must then be picklable and their classes importable).
+            retry_policy: How tasks that lack resources wait and are retried (see
+                set_retry_policy).
+
+        Raises:
+            ValueError: If max_workers is not positive or backend is unknown.
+        """
+        super().__init__(name, description, required_resources_names, duration_in_units, dependencies, quantities)
+        if max_workers <= 0:
+            raise ValueError(f"Worker count for process '{name}' must be positive")
+        self._resource_pool = ResourcePool()
+        self._tasks: Union[List[Executable], TaskTable, TaskSource] = []
+        self._max_workers = max_workers
+        self._backend = ExecutionBackend(backend)
+        self._retry_policy = retry_policy
+        self._checkpoint: Optional[CheckpointJournal] = None
+        self._cache: Optional[ResultCache] = None
+
+    @property
+    def max_workers(self) -> int:
+        """Get the number of tasks that may run at the same time."""
+        return self._max_workers
+
+    @property
+    def backend(self) -> ExecutionBackend:
+        """Get where task bodies run."""
+        return self._backend
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Get the policy for tasks that lack resources, or None for the default behavior."""
+        return self._retry_policy
+
+    def set_retry_policy(self, policy: Optional[RetryPolicy]) -> None:
+        """Choose how tasks that lack resources wait and are retried.
+
+        Without a policy, a task waits (without limits) only for usable resources held by
+        running tasks of this process, and is skipped otherwise. A policy can bound attempts
+        and waiting time, add back-off and reorder waiting tasks; with a timeout, tasks also
+        wait for consumable capacity and, in sequential runs, for releases by other threads.
+
+        Args:
+            policy: The policy, or None to restore the default behavior.
+        """
+        self._retry_policy = policy
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """Get the cache of task results, or None if every task is executed."""
+        return self._cache
+
+    def set_result_cache(self, cache: Optional[ResultCache]) -> None:
+        """Complete unchanged deterministic tasks from a result cache instead of running them.
+
+        Before a task with a fingerprint gets resources, its cache key is looked up; on a
+        hit the task counts as completed without allocating resources or executing, and
+        every task that completes normally is stored. Nested processes use their own cache.
+
+        Args:
+            cache: The cache, or None to execute every task.
         """
-        super().__init__(name, description, required_resources_names, duration_in_units)
-        self._resource_pool: List[Resource] = []
-        self._tasks: List[Executable] = []
+        self._cache = cache
+
+    @property
+    def checkpoint(self) -> Optional[CheckpointJournal]:
+        """Get the journal that records the process's progress, or None if checkpointing is off."""
+        return self._checkpoint
+
+    def enable_checkpoints(self, path: str, every: int = 100, interval: Optional[float] = None) -> CheckpointJournal:
+        """Record the progress of every run in an append-only journal file.
+
+        A run started with run() replaces the file; resume() continues the run it records.
+
+        Args:
+            path: The journal file.
+            every: Completed tasks between two checkpoints.
+            interval: Seconds after which a completion triggers a checkpoint regardless of count.
+
+        Returns:
+            The journal.
+
+        Raises:
+            ValueError: If every or interval is not positive.
+        """
+        self._checkpoint = CheckpointJournal(path, every, interval)
+        return self._checkpoint
+
+    def disable_checkpoints(self) -> None:
+        """Stop recording progress."""
+        self._checkpoint = None
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """Get the attached metrics collector, or None if instrumentation is off."""
+        return self._metrics
+
+    def enable_metrics(self) -> Metrics:
+        """Turn on instrumentation for the process, its tasks and its pool resources.
+
+        Returns:
+            The collector receiving the measurements (the existing one if already enabled).
+        """
+        if self._metrics is None:
+            self.instrument(Metrics(self._name))
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        """Turn off instrumentation so the hooks cost nothing again."""
+        self.instrument(None)
+
+    def instrument(self, metrics: Optional[Metrics]) -> None:
+        """Attach a metrics collector to the process, its tasks and its pool resources.
+
+        Args:
+            metrics: The collector to attach, or None to detach.
+        """
+        super().instrument(metrics)
+        if isinstance(self._tasks, list):
+            for task in self._tasks:
+                task.instrument(metrics)
+        for resource in self._resource_pool:
+            resource.instrument(metrics)
 
     def add_resource(self, resource: Resource) -> None:
         """Add a resource to the process's resource pool.
@@ -40,55 +273,1097 @@ class Process(Executable):
         Args:
             resource: The resource to add.
         """
-        self._resource_pool.append(resource)
+        self._resource_pool.add(resource)
+        if self._metrics is not None:
+            resource.instrument(self._metrics)
+
+    def set_quota(self, name: str, units: int) -> None:
+        """Limit how many units of a resource this process may borrow from its parent process.
+
+        Args:
+            name: The resource name.
+            units: The maximum units borrowed at once (consumable units count once consumed).
+        """
+        self._resource_pool.set_quota(name, units)
+
+    def planned_duration(self) -> int:
+        """Get the duration schedulers should plan for this process when it runs as a task.
+
+        Returns:
+            The declared duration, or the makespan of its own schedule if that is longer.
+        """
+        if isinstance(self._tasks, TaskSource) or not len(self._tasks):
+            return self._duration_in_units
+        return max(self._duration_in_units, self.schedule().makespan)
+
+    def replenish_resource(self, name: str, amount: int) -> int:
+        """Restore consumed capacity of the consumable resources in the pool with a name.
+
+        Args:
+            name: The resource name to replenish.
+            amount: The capacity to restore.
+
+        Returns:
+            The capacity actually restored.
+        """
+        return self._resource_pool.replenish(name, amount)
 
     def add_task(self, task: Executable) -> None:
         """Add a task to the process's sequence.
 
+        A nested Process borrows from this process's resource pool for whatever its own
+        pool lacks, within the quotas set on it.
+
         Args:
-            task: The task to add.
+            task: The task to add (copied into the task table if the process uses one).
+
+        Raises:
+            TypeError: If the process uses a task table and the task is not a plain Task.
+            ValueError: If the process is added to itself, or reads its tasks from a stream.
         """
+        if isinstance(self._tasks, TaskSource):
+            raise ValueError(f"Process '{self._name}' reads its tasks from a stream; add them to the stream")
+        if isinstance(task, Process):
+            if task is self:
+                raise ValueError(f"Process '{self._name}' cannot contain itself")
+            if task._resource_pool.parent is None:
+                task._resource_pool.attach(self._resource_pool)
+        if isinstance(self._tasks, TaskTable):
+            self._tasks.add_task(task)
+            return
         self._tasks.append(task)
+        if self._metrics is not None:
+            task.instrument(self._metrics)
+
+    def use_task_table(self, table: TaskTable) -> None:
+        """Hold tasks in a columnar TaskTable instead of a list of objects.
+
+        Tasks are created from the table's rows when they run, so memory stays proportional
+        to the table rather than to one object per task. Tasks added so far are copied into it.
+
+        Args:
+            table: The table to use; later add_task calls append to it.
+
+        Raises:
+            TypeError: If a task added so far is not a plain Task.
+            ValueError: If a task added so far declares dependencies, or the process reads its
+                tasks from a stream.
+        """
+        if isinstance(self._tasks, TaskSource):
+            raise ValueError(f"Process '{self._name}' reads its tasks from a stream")
+        for task in self._tasks:
+            table.add_task(task)
+        self._tasks = table
+
+    def use_task_source(self, source: Union[TaskSource, Iterable[Executable], AsyncIterable]) -> TaskSource:
+        """Read tasks lazily from an iterator or async generator instead of holding them.
+
+        A task is pulled only when a worker is free and fewer than max_workers pulled tasks
+        are waiting for resources or dependencies, so a busy pool holds the stream back.
+        Finished tasks are dropped, so memory stays flat for unbounded streams. Dependencies
+        must refer to tasks that appeared earlier in the stream. A stream is read once, and it
+        cannot be scheduled, simulated or saved ahead of time. An async generator that awaits
+        objects of a running event loop must be run with run_async from that loop.
+
+        Args:
+            source: The stream, or any iterable or async iterable of tasks.
+
+        Returns:
+            The TaskSource being read (e.g., to check how many tasks were consumed).
+
+        Raises:
+            ValueError: If tasks were already added to the process.
+        """
+        if not isinstance(self._tasks, TaskSource) and len(self._tasks):
+            raise ValueError(f"Process '{self._name}' already holds tasks; stream them instead")
+        self._tasks = source if isinstance(source, TaskSource) else TaskSource(source)
+        return self._tasks
+
+    @property
+    def resource_pool(self) -> ResourcePool:
+        """Get the pool the process's tasks take their resources from."""
+        return self._resource_pool
+
+    @property
+    def task_table(self) -> Optional[TaskTable]:
+        """Get the table the tasks are held in, or None if they are objects or a stream."""
+        return self._tasks if isinstance(self._tasks, TaskTable) else None
+
+    def task_list(self) -> List[Executable]:
+        """Get the tasks as objects, creating them from the task table if there is one.
+
+        The list is the process's own when it holds task objects; it must not be modified.
+
+        Raises:
+            ValueError: If the process reads its tasks from a stream.
+        """
+        tasks = self._tasks
+        if isinstance(tasks, TaskSource):
+            raise ValueError(f"Process '{self._name}' reads its tasks from a stream; they are not known ahead of time")
+        if not isinstance(tasks, TaskTable):
+            return tasks
+        materialized = tasks.materialize()
+        if self._metrics is not None:
+            for task in materialized:
+                task.instrument(self._metrics)
+        return materialized
+
+    def schedule(self, max_workers: Optional[int] = None, tasks: Optional[List[Executable]] = None) -> Schedule:
+        """Order the task graph by critical path and compute its makespan.
+
+        Tasks are started as soon as their dependencies completed and a worker is free;
+        among ready tasks the one with the longest remaining path (in duration_in_units)
+        goes first. Nested processes count with their own makespan when it exceeds their
+        declared duration. Resource limits are not modeled here.
+
+        Args:
+            max_workers: Number of parallel workers to plan for (defaults to the process's).
+            tasks: The task objects to plan, as returned by task_list(); pass them when the
+                schedule's priorities must refer to objects already materialized from a task
+                table (defaults to a fresh task_list()).
 
+        Returns:
+            The resulting Schedule.
+
+        Raises:
+            ValueError: If a dependency is outside the process or the graph has a cycle.
+        """
+        workers = max_workers if max_workers is not None else self._max_workers
+        if workers <= 0:
+            raise ValueError(f"Worker count for process '{self._name}' must be positive")
+        return self._plan(self.task_list() if tasks is None else tasks, workers)
+
+    def _plan(self, tasks: List[Executable], workers: int) -> Schedule:
+        """Compute the Schedule of the given task objects for a number of workers (see schedule)."""
+        successors, indegree = self.dependency_graph(tasks)
+        topological = self.topological_indices(successors, indegree)
+        durations = [task.planned_duration() for task in tasks]
+        bottom = [0] * len(tasks)
+        for i in reversed(topological):
+            bottom[i] = durations[i] + max((bottom[j] for j in successors[i]), default=0)
+
+        remaining = list(indegree)
+        ready: List[Tuple[int, int]] = [(-bottom[i], i) for i in range(len(tasks)) if remaining[i] == 0]
+        heapq.heapify(ready)
+        running: List[Tuple[int, int]] = []
+        order: List[Executable] = []
+        now = 0
+        while ready or running:
+            while ready and len(running) < workers:
+                _, i = heapq.heappop(ready)
+                order.append(tasks[i])
+                heapq.heappush(running, (now + durations[i], i))
+            now, i = heapq.heappop(running)
+            finished = [i]
+            while running and running[0][0] == now:
+                finished.append(heapq.heappop(running)[1])
+            for i in finished:
+                for j in successors[i]:
+                    remaining[j] -= 1
+                    if remaining[j] == 0:
+                        heapq.heappush(ready, (-bottom[j], j))
+
+        critical_path: List[Executable] = []
+        roots = [i for i in range(len(tasks)) if indegree[i] == 0]
+        current = max(roots, key=lambda i: bottom[i], default=None)
+        while current is not None:
+            critical_path.append(tasks[current])
+            current = max(successors[current], key=lambda j: bottom[j], default=None)
+        return Schedule(order, {id(task): bottom[i] for i, task in enumerate(tasks)}, now, critical_path)
+
+    def dependency_graph(self, tasks: List[Executable]) -> Tuple[List[List[int]], List[int]]:
+        """Build successor lists and in-degrees over task indices.
+
+        Args:
+            tasks: The process's tasks as objects (see task_list).
+
+        Returns:
+            Per task index, the indices of the tasks that depend on it, and per task index,
+            the number of its dependencies.
+
+        Raises:
+            ValueError: If a task depends on an entity that is not part of the process.
+        """
+        index = {id(task): i for i, task in enumerate(tasks)}
+        successors: List[List[int]] = [[] for _ in tasks]
+        indegree = [0] * len(tasks)
+        for i, task in enumerate(tasks):
+            for dependency in task.dependencies:
+                j = index.get(id(dependency))
+                if j is None:
+                    raise ValueError(f"Task '{task.name}' depends on '{dependency.name}', "
+                                     f"which is not part of process '{self._name}'")
+                successors[j].append(i)
+                indegree[i] += 1
+        return successors, indegree
+
+    def topological_indices(self, successors: List[List[int]], indegree: List[int]) -> List[int]:
+        """Order task indices so dependencies come first, keeping insertion order among peers.
+
+        Args:
+            successors: Successor lists, as returned by dependency_graph.
+            indegree: Dependency counts, as returned by dependency_graph.
+
+        Returns:
+            Every task index, each after the indices of its dependencies.
+
+        Raises:
+            ValueError: If the dependency graph has a cycle.
+        """
+        remaining = list(indegree)
+        ready = deque(i for i in range(len(remaining)) if remaining[i] == 0)
+        order: List[int] = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for j in successors[i]:
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    ready.append(j)
+        if len(order) != len(remaining):
+            raise ValueError(f"Dependency cycle detected among tasks of process '{self._name}'")
+        return order
+
+    def _has_dependencies(self) -> bool:
+        """Check whether any task declares a dependency."""
+        if isinstance(self._tasks, TaskTable):
+            return self._tasks.has_dependencies()
+        return any(task.dependencies for task in self._tasks)
+
+    @timed_phase("process_execute")
     def execute(self) -> None:
         """Execute the process by running its sequence of tasks.
 
+        With metrics enabled, the call is timed as the process_execute phase, apart from the
+        execute phase of its tasks.
+
         Raises:
             RuntimeError: If resources are not properly assigned or tasks fail.
         """
         if self._required_resources_names and len(self._assigned_resources) != len(self._required_resources_names):
             raise RuntimeError(f"Resources not properly assigned for process '{self._name}'")
-        print(f"Executing process '{self._name}': {self._description} (Duration: {self._duration_in_units} units)")
+        emit(EventType.PROCESS_START, self._name, description=self._description, duration=self._duration_in_units)
         if self._assigned_resources:
             for resource in self._assigned_resources:
                 resource.use()
 
-        for task in self._tasks:
+        journal = self._checkpoint
+        if journal is not None and not journal.is_open:
+            journal.start(self._name, self._task_names(), self._resource_pool)
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.enter(self)
+        try:
+            if isinstance(self._tasks, TaskSource):
+                self._execute_stream()
+            elif self._max_workers > 1 or self._backend is ExecutionBackend.PROCESS:
+                self._execute_concurrently()
+            else:
+                self._execute_sequentially()
+        finally:
+            if tracer is not None:
+                tracer.leave(self)
+            if journal is not None:
+                journal.close((self,))
+
+    def _execute_sequentially(self) -> None:
+        """Run the tasks one after another, in insertion order unless dependencies require otherwise.
+
+        With a single worker every topological order has the same makespan, so insertion
+        order is kept among independent tasks. Rows of a task table without dependencies are
+        turned into tasks one at a time, and rows a resumed run already completed are not.
+        """
+        tasks = self._tasks
+        journal = self._checkpoint
+        has_dependencies = self._has_dependencies()
+        entries: Iterable[Tuple[int, Executable]]
+        if has_dependencies:
+            tasks = self.task_list()
+            successors, indegree = self.dependency_graph(tasks)
+            entries = [(i, tasks[i]) for i in self.topological_indices(successors, indegree)]
+        elif isinstance(tasks, TaskTable) and journal is not None:
+            entries = ((i, tasks.row(i)) for i in range(len(tasks)) if not journal.is_done(i))
+        else:
+            entries = enumerate(tasks)
+        streamed = isinstance(tasks, TaskTable) and self._metrics is not None
+        run = self._inline_run()
+        keys = self._cache_keys()
+        completed: Set[int] = set()
+        with _registered(run):
+            for position, task in entries:
+                if journal is not None and journal.is_done(position):
+                    completed.add(id(task))
+                    continue
+                if streamed:
+                    task.instrument(self._metrics)
+                blocker = self._failed_dependency(task, completed)
+                if blocker is not None:
+                    self.report_skip(task, "dependency", f"dependency '{blocker.name}' did not complete")
+                    continue
+                if self._run_inline(task, run, keys):
+                    if has_dependencies:
+                        completed.add(id(task))
+                    if journal is not None:
+                        journal.record(position)
+                        if journal.due:
+                            journal.checkpoint((self,))
+
+    def _execute_concurrently(self) -> None:
+        """Run every task whose resources are available at the same time on a worker pool.
+
+        Ready tasks are dispatched by critical-path priority. Tasks that wait on unfinished
+        dependencies are queued; tasks that lack resources wait in a WaitQueue, in line per
+        resource name, until a release of a name they need wakes them, within the limits of the
+        retry policy, and tasks that can never be satisfied are skipped. A task does not take
+        units of a name an earlier or higher-priority task is waiting for. With the process backend, task bodies run in
+        worker processes and their events are replayed here as each one finishes; nested
+        processes still run on threads so their pools stay in this process. Tasks a resumed run
+        already completed count as completed without running.
+        """
+        tasks = self.task_list()
+        schedule = self._plan(tasks, self._max_workers)
+        journal = self._checkpoint
+        positions = {id(task): i for i, task in enumerate(tasks)} if journal is not None else {}
+        keys = self._cache_keys()
+        pending: Deque[Executable] = deque(schedule.order)
+        completed: Set[int] = set()
+        finished: Set[int] = set()
+        if journal is not None and journal.completed:
+            completed.update(id(task) for i, task in enumerate(tasks) if journal.is_done(i))
+            finished.update(completed)
+            pending = deque(task for task in pending if id(task) not in completed)
+        with ExitStack() as stack:
+            dispatcher = _Dispatcher(self, stack, schedule.priority)
+            while pending or dispatcher.in_flight or dispatcher.parked:
+                for task, reason in dispatcher.retry_woken():
+                    self.report_skip(task, "resources", reason)
+                    finished.add(id(task))
+                waiting: Deque[Executable] = deque()
+                while pending:
+                    if not dispatcher.has_free_worker:
+                        # Every worker is busy: defer the rest without checking each task again.
+                        waiting.extend(pending)
+                        pending.clear()
+                        break
+                    task = pending.popleft()
+                    blocker = self._failed_dependency(task, completed, finished)
+                    if blocker is not None:
+                        self.report_skip(task, "dependency", f"dependency '{blocker.name}' did not complete")
+                        finished.add(id(task))
+                        continue
+                    if any(id(dependency) not in finished for dependency in task.dependencies):
+                        waiting.append(task)
+                        continue
+                    if keys is not None and self._from_cache(task, keys):
+                        finished.add(id(task))
+                        completed.add(id(task))
+                        if journal is not None:
+                            journal.record(positions[id(task)])
+                        continue
+                    reason = dispatcher.offer(task)
+                    if reason is not None:
+                        self.report_skip(task, "resources", reason)
+                        finished.add(id(task))
+                pending = waiting
+                for task, reason in dispatcher.stranded():
+                    self.report_skip(task, "resources", reason)
+                    finished.add(id(task))
+                for task, error in dispatcher.wait():
+                    finished.add(id(task))
+                    self.report_finish(task, error)
+                    if error is None:
+                        completed.add(id(task))
+                        if keys is not None:
+                            self._memoize(task, keys)
+                        if journal is not None:
+                            journal.record(positions[id(task)])
+                if journal is not None and journal.due:
+                    journal.checkpoint((self, *dispatcher.in_flight.values()))
+
+    def _execute_stream(self) -> None:
+        """Run tasks as the task source yields them, holding only a bounded window of them.
+
+        With one worker on the thread backend each task runs inline before the next one is
+        read. Otherwise a task is read only while a worker is free and fewer than max_workers
+        read tasks are waiting for dependencies or resources; tasks waiting for dependencies
+        are retried, in arrival order, whenever a running task finishes. Outcomes are kept per
+        task only while something still references it. Tasks are checkpointed by their position
+        in the stream, so a resumed run expects the same stream and passes over the tasks it
+        already completed.
+        """
+        source = self._tasks
+        journal = self._checkpoint
+        outcomes: "WeakKeyDictionary[Executable, bool]" = WeakKeyDictionary()
+        keys = self._cache_keys()
+        if self._max_workers == 1 and self._backend is ExecutionBackend.THREAD:
+            run = self._inline_run()
+            with _registered(run):
+                for task in source:
+                    position = source.consumed - 1
+                    if journal is not None and journal.is_done(position):
+                        outcomes[task] = True
+                        continue
+                    if self._metrics is not None:
+                        task.instrument(self._metrics)
+                    if self._streamed_blocker(task, outcomes, ()) is None:
+                        outcomes[task] = self._run_inline(task, run, keys)
+                        if outcomes[task] and journal is not None:
+                            journal.record(position)
+                            if journal.due:
+                                journal.checkpoint((self,))
+            return
+
+        waiting: Deque[Executable] = deque()
+        active: Set[int] = set()
+        positions: "WeakKeyDictionary[Executable, int]" = WeakKeyDictionary()
+        with ExitStack() as stack:
+            dispatcher = _Dispatcher(self, stack, lambda task: 0)
+            while True:
+                for task, reason in dispatcher.retry_woken():
+                    self.report_skip(task, "resources", reason)
+                    outcomes[task] = False
+                    active.discard(id(task))
+                retry, waiting = waiting, deque()
+                for task in retry:
+                    self._admit(task, outcomes, waiting, active, dispatcher, keys, positions)
+                while dispatcher.has_free_worker and len(waiting) + len(dispatcher.parked) < self._max_workers:
+                    task = next(source, None)
+                    if task is None:
+                        break
+                    if journal is not None:
+                        if journal.is_done(source.consumed - 1):
+                            outcomes[task] = True
+                            continue
+                        positions[task] = source.consumed - 1
+                    if self._metrics is not None:
+                        task.instrument(self._metrics)
+                    self._admit(task, outcomes, waiting, active, dispatcher, keys, positions)
+                for task, reason in dispatcher.stranded():
+                    self.report_skip(task, "resources", reason)
+                    outcomes[task] = False
+                    active.discard(id(task))
+                if not (dispatcher.in_flight or dispatcher.parked or waiting) and source.exhausted:
+                    return
+                for task, error in dispatcher.wait():
+                    active.discard(id(task))
+                    self.report_finish(task, error)
+                    outcomes[task] = error is None
+                    if error is None and keys is not None:
+                        self._memoize(task, keys)
+                    if error is None and journal is not None:
+                        journal.record(positions[task])
+                if journal is not None and journal.due:
+                    journal.checkpoint((self, *dispatcher.in_flight.values()))
+
+    def _admit(self, task: Executable, outcomes: "WeakKeyDictionary[Executable, bool]", waiting: Deque[Executable],
+               active: Set[int], dispatcher: "_Dispatcher",
+               keys: Optional["WeakKeyDictionary[Executable, Optional[str]]"],
+               positions: "WeakKeyDictionary[Executable, int]") -> None:
+        """Start a streamed task, complete it from the cache, queue it, or skip it (see _execute_stream)."""
+        if self._streamed_blocker(task, outcomes, active) is not None:
+            active.discard(id(task))
+            return
+        if any(outcomes.get(dependency) is None for dependency in task.dependencies):
+            waiting.append(task)
+            active.add(id(task))
+            return
+        if keys is not None and self._from_cache(task, keys):
+            outcomes[task] = True
+            active.discard(id(task))
+            if self._checkpoint is not None:
+                self._checkpoint.record(positions[task])
+            return
+        reason = dispatcher.offer(task)
+        if reason is None:
+            active.add(id(task))
+        else:
+            self.report_skip(task, "resources", reason)
+            outcomes[task] = False
+            active.discard(id(task))
+
+    def _streamed_blocker(self, task: Executable, outcomes: "WeakKeyDictionary[Executable, bool]",
+                          active: Union[Set[int], Tuple]) -> Optional[Executable]:
+        """Skip a streamed task whose dependency failed or never appeared earlier in the stream.
+
+        Args:
+            task: The streamed task.
+            outcomes: Whether each finished task completed.
+            active: Ids of tasks read but not finished yet.
+
+        Returns:
+            The dependency that prevents the task from running (the task was skipped), or None.
+        """
+        for dependency in task.dependencies:
+            outcome = outcomes.get(dependency)
+            if outcome is False:
+                message = f"dependency '{dependency.name}' did not complete"
+            elif outcome is None and id(dependency) not in active:
+                message = f"dependency '{dependency.name}' is not an earlier task of the stream"
+            else:
+                continue
+            self.report_skip(task, "dependency", message)
+            outcomes[task] = False
+            return dependency
+        return None
+
+    def _inline_run(self) -> "_Run":
+        """Describe a run that executes its tasks one at a time on the calling thread.
+
+        Nothing else of this process runs meanwhile, so only other threads sharing the pool
+        can free resources. Tasks therefore only get a WaitQueue under a retry policy with a
+        timeout, or in a nested process, whose parent may run other tasks meanwhile.
+        """
+        policy = self._retry_policy
+        if (policy is None or policy.timeout is None) and self._resource_pool.parent is None:
+            return _Run(self, {}, None)
+        return _Run(self, {}, WaitQueue(self._resource_pool, policy or RetryPolicy()))
+
+    def _run_inline(self, task: Executable, run: "_Run",
+                    keys: Optional["WeakKeyDictionary[Executable, Optional[str]]"] = None) -> bool:
+        """Run one task on the calling thread, waiting for its resources if allowed.
+
+        Args:
+            task: The task to run.
+            run: The inline run; without a queue, a task that lacks resources is skipped.
+            keys: Cache keys computed so far in this run, or None without a result cache.
+
+        Returns:
+            True if the task completed (possibly from the cache), False if it was skipped or failed.
+        """
+        if keys is not None and self._from_cache(task, keys):
+            return True
+        pool = self._resource_pool
+        parked = run.parked
+        patient = self._retry_policy is not None and self._retry_policy.timeout is not None
+        run.in_flight[None] = task
+        try:
+            while not task.try_assign_resources(pool):
+                reason: Optional[str] = "insufficient resources"
+                if parked is not None and self._can_wait(task, patient) and (patient or self._parent_progressing()):
+                    if not parked.park(task, self._missing(task), 0):
+                        reason = "gave up waiting for resources"
+                    else:
+                        reason = self._await_wake(task, run, patient)
+                        if reason is None:
+                            continue
+                self.report_skip(task, "resources", reason)
+                return False
+            entry = parked.dispatched(task) if parked is not None else None
+            if entry is not None and self._metrics is not None:
+                self._record_wait(entry)
             try:
-                if task.can_execute(self._resource_pool):
-                    task.assign_resources(self._resource_pool)
-                    print("  ", end="")
-                    task.execute()
-                    task.release_resources()
-                else:
-                    print(f"  Task '{task.name}' skipped: insufficient resources")
+                task.execute()
+                task.release_resources()
+                self.report_finish(task, None)
             except Exception as e:
-                print(f"  Error in '{task.name}': {e}")
+                task.release_resources()
+                self.report_finish(task, e)
+                return False
+            except BaseException:
+                # Interrupted (e.g., KeyboardInterrupt): the task runs again on resume, so what it
+                # consumed counts as left.
+                if self._checkpoint is not None:
+                    self._checkpoint.close((self, task))
+                raise
+        finally:
+            run.in_flight.clear()
+        if keys is not None:
+            self._memoize(task, keys)
+        return True
+
+    def _cache_keys(self) -> Optional["WeakKeyDictionary[Executable, Optional[str]]"]:
+        """Start the memo of cache keys for a run, or get None if there is no result cache."""
+        return WeakKeyDictionary() if self._cache is not None else None
+
+    def _from_cache(self, task: Executable, keys: "WeakKeyDictionary[Executable, Optional[str]]") -> bool:
+        """Complete a task from the result cache if it already succeeded with the same key.
+
+        Args:
+            task: The task about to be given resources.
+            keys: Cache keys computed so far in this run.
+
+        Returns:
+            True if the task was completed without allocating resources or executing.
+        """
+        key = task.cache_key(keys)
+        if key is None or self._cache.get(key) is None:
+            return False
+        emit(EventType.TASK_END, task.name, cached=True)
+        if self._metrics is not None:
+            self._metrics.record_cached(task.name)
+        return True
+
+    def _memoize(self, task: Executable, keys: "WeakKeyDictionary[Executable, Optional[str]]") -> None:
+        """Store the result of a task that completed, if it has a cache key."""
+        key = task.cache_key(keys)
+        if key is not None:
+            self._cache.put(key, {"task": task.name, "duration": task.duration_in_units})
+
+    def _await_wake(self, task: Executable, run: "_Run", patient: bool) -> Optional[str]:
+        """Block until a parked task is woken and due, its timeout passes, or nothing can free its resources.
+
+        Without a timeout the task waits only while an enclosing process runs other tasks;
+        the other running processes poke the queue whenever that may have changed.
+
+        Args:
+            task: The parked task.
+            run: The inline run whose queue it waits in.
+            patient: Whether it waits under a retry policy with a timeout.
+
+        Returns:
+            None if the task should retry, otherwise why it has to be skipped (it is no longer parked).
+        """
+        parked = run.parked
+        run.in_flight.clear()
+        _poke_runs(self)
+        try:
+            while True:
+                if task in parked.expire():
+                    return "timed out waiting for resources"
+                if parked.pop_due() is task:
+                    return None
+                if not patient and not self._parent_progressing():
+                    parked.dispatched(task)
+                    return "insufficient resources"
+                wait([parked.alarm()], timeout=parked.next_event())
+        finally:
+            run.in_flight[None] = task
+
+    def _parent_progressing(self) -> bool:
+        """Check whether an enclosing process runs a task that can free resources for this one's tasks.
+
+        Every running task counts except the processes this one is nested in, and nested
+        processes whose tasks all wait for resources themselves (see _progressing), so two
+        sibling processes never wait for each other.
+        """
+        child, pool = self, self._resource_pool.parent
+        while pool is not None:
+            run = _runs.get(pool)
+            if run is None:
+                return False
+            if any(task is not child and _progressing(task) for task in list(run.in_flight.copy().values())):
+                return True
+            child, pool = run.process, pool.parent
+        return False
+
+    def _executors(self, stack: ExitStack) -> Tuple[Executor, Optional[Executor]]:
+        """Open the thread pool, and the process pool for the process backend, on an exit stack."""
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=self._max_workers,
+                                                         thread_name_prefix=self._name))
+        workers: Optional[Executor] = None
+        if self._backend is ExecutionBackend.PROCESS:
+            workers = stack.enter_context(ProcessPoolExecutor(max_workers=self._max_workers))
+        return threads, workers
+
+    def report_skip(self, task: Executable, reason: str, message: str) -> None:
+        """Report a task that will not run, whether this process or another executor skipped it.
+
+        Args:
+            task: The skipped task.
+            reason: Short reason used as a metrics label (e.g., "dependency" or "resources").
+            message: Human-readable reason for the event.
+        """
+        emit(EventType.TASK_SKIP, task.name, reason=message)
+        if self._metrics is not None:
+            self._metrics.record_skip(task.name, reason)
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.skipped(task)
+
+    def report_finish(self, task: Executable, error: Optional[BaseException]) -> None:
+        """Report a task that ran, successfully or not, here or elsewhere (see replay_outcome).
+
+        Args:
+            task: The finished task.
+            error: The exception it raised, or None on success.
+        """
+        if error is None:
+            emit(EventType.TASK_END, task.name)
+        else:
+            emit(EventType.TASK_ERROR, task.name, error=str(error))
+        if self._metrics is not None:
+            self._metrics.record_outcome(task.name, error is None)
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.finished(task)
+
+    def _missing(self, task: Executable) -> List[str]:
+        """Name the required resources a task cannot get right now."""
+        pool = self._resource_pool
+        return [name for name in task.required_resources_names if not pool.is_available(name, task.quantity_of(name))]
+
+    def _record_wait(self, entry: Tuple[float, List[str]]) -> None:
+        """Charge the time a task spent blocked to the resources it lacked."""
+        since, names = entry
+        elapsed = time.monotonic() - since
+        for name in names:
+            self._metrics.record_wait(name, elapsed)
+
+    @staticmethod
+    def _failed_dependency(task: Executable, completed: Set[int],
+                           finished: Optional[Set[int]] = None) -> Optional[Executable]:
+        """Find a dependency of a task that finished without completing.
+
+        Args:
+            task: The task to check.
+            completed: Ids of tasks that completed successfully.
+            finished: Ids of tasks that are done either way; when omitted every dependency
+                is expected to have finished already.
+
+        Returns:
+            The first such dependency, or None.
+        """
+        for dependency in task.dependencies:
+            if id(dependency) not in completed and (finished is None or id(dependency) in finished):
+                return dependency
+        return None
+
+    @staticmethod
+    def _run_task(task: Executable) -> None:
+        """Execute a task whose resources are already assigned (thread-pool entry point)."""
+        task.execute()
+
+    def _submit(self, task: Executable, threads: Executor, workers: Optional[Executor],
+                remote: Set[Future]) -> Future:
+        """Start a task whose resources are assigned, in a worker process when possible.
+
+        Args:
+            task: The task to start.
+            threads: The thread pool, used for nested processes and the thread backend.
+            workers: The process pool, or None for the thread backend.
+            remote: Futures of tasks running in worker processes; the new one is added.
+
+        Returns:
+            The future of the running task.
+        """
+        if workers is None or isinstance(task, Process):
+            return threads.submit(self._run_task, task)
+        future = workers.submit(_execute_in_worker, task, get_sink().enabled)
+        remote.add(future)
+        return future
+
+    def replay_outcome(self, task: Executable,
+                       outcome: Tuple[List[Event], Optional[Exception], float]) -> Optional[Exception]:
+        """Replay the events and time of a task that ran in a worker process or on a worker node.
+
+        The task is not reported as finished; call report_finish with the returned exception.
+
+        Args:
+            task: The original task.
+            outcome: The events the task emitted, the exception it raised (or None) and the
+                seconds it took, as captured where it ran.
+
+        Returns:
+            The exception the task raised, or None.
+        """
+        events, error, seconds = outcome
+        replay(events)
+        if self._metrics is not None:
+            self._metrics.record_phase(task.name, "execute", seconds)
+        return error
+
+    def _can_wait(self, task: Executable, patient: bool = False) -> bool:
+        """Check whether a blocked task may become runnable once resources are released.
 
-    def run(self) -> None:
+        Args:
+            task: The task that could not be dispatched.
+            patient: Whether the task may wait for consumable capacity to be replenished
+                (only under a retry policy with a timeout).
+
+        Returns:
+            True if every unavailable resource it needs is a reusable (usable) resource with
+            enough slots, or, when patient, any resource the pool knows by name.
+        """
+        pool = self._resource_pool
+        for name in task.required_resources_names:
+            amount = task.quantity_of(name)
+            if not pool.is_available(name, amount) and not pool.has_reusable(name, amount) \
+                    and not (patient and name in pool):
+                return False
+        return True
+
+    def run(self, max_workers: Optional[int] = None, backend: Optional[Union[ExecutionBackend, str]] = None) -> None:
         """Run the process standalone, managing its own resource pool.
 
+        Args:
+            max_workers: If given, replaces the number of tasks that may run at the same time.
+            backend: If given, replaces where task bodies run.
+
         Raises:
+            ValueError: If max_workers is not positive or backend is unknown.
             RuntimeError: If insufficient resources are available to start.
         """
+        if max_workers is not None:
+            if max_workers <= 0:
+                raise ValueError(f"Worker count for process '{self._name}' must be positive")
+            self._max_workers = max_workers
+        if backend is not None:
+            self._backend = ExecutionBackend(backend)
         try:
-            if not self._required_resources_names or self.can_execute(self._resource_pool):
-                if self._required_resources_names:
-                    self.assign_resources(self._resource_pool)
-                self.execute()
-                self.release_resources()
-                print(f"Process '{self._name}' completed.")
+            if self.try_assign_resources(self._resource_pool):
+                try:
+                    self.execute()
+                finally:
+                    self.release_resources()
+                    tracer = get_tracer()
+                    if tracer is not None:
+                        tracer.finished(self)
+                emit(EventType.PROCESS_END, self._name)
             else:
                 raise RuntimeError(f"Insufficient resources in pool to start '{self._name}'")
         except Exception as e:
-            print(f"Error in process '{self._name}': {e}")
\ No newline at end of file
+            emit(EventType.PROCESS_ERROR, self._name, error=str(e))
+
+    async def run_async(self, max_workers: Optional[int] = None,
+                        backend: Optional[Union[ExecutionBackend, str]] = None) -> None:
+        """Run the process standalone from a coroutine, without blocking the event loop.
+
+        The run happens on a thread of the loop's default executor. An async task source is
+        read on the calling loop, so its generator may await objects bound to that loop (e.g.,
+        an asyncio.Queue fed by other coroutines). Cancelling the call stops waiting for the
+        run, not the run itself.
+
+        Args:
+            max_workers: If given, replaces the number of tasks that may run at the same time.
+            backend: If given, replaces where task bodies run.
+
+        Raises:
+            ValueError: If max_workers is not positive or backend is unknown.
+        """
+        loop = asyncio.get_running_loop()
+        source = self._tasks if isinstance(self._tasks, TaskSource) else None
+        if source is not None:
+            source.bind(loop)
+        done = loop.run_in_executor(None, self.run, max_workers, backend)
+        try:
+            await asyncio.shield(done)
+        finally:
+            if source is not None:
+                # A cancelled caller leaves the run reading on the loop until it ends.
+                if done.done():
+                    source.bind(None)
+                else:
+                    done.add_done_callback(lambda _: source.bind(None))
+
+    def resume(self, max_workers: Optional[int] = None, backend: Optional[Union[ExecutionBackend, str]] = None) -> int:
+        """Continue the run recorded in the checkpoint journal from its last checkpoint.
+
+        The process must have the definition it had when the journal was written (e.g.,
+        rebuilt with workflow.load), with its tasks in the same order; a streamed process must
+        be given the same stream. Tasks completed before the last checkpoint are not run again,
+        the consumable resources of the pool get back the capacity recorded there, and the
+        remaining tasks are run as run() would, appending to the same journal.
+
+        Args:
+            max_workers: If given, replaces the number of tasks that may run at the same time.
+            backend: If given, replaces where task bodies run.
+
+        Returns:
+            The number of tasks that were already completed.
+
+        Raises:
+            ValueError: If checkpoints are not enabled, or the journal is malformed or belongs
+                to a different process definition or task order.
+            OSError: If the journal cannot be read.
+        """
+        if self._checkpoint is None:
+            raise ValueError(f"Process '{self._name}' has no checkpoint journal to resume from")
+        journal = self._checkpoint
+        restored = journal.restore(self._name, self._task_names(), self._resource_pool)
+        try:
+            self.run(max_workers, backend)
+        finally:
+            journal.close()
+        return restored
+
+    def _task_names(self) -> Optional[Iterable[str]]:
+        """Get the task names in process order, or None if the tasks are streamed."""
+        tasks = self._tasks
+        if isinstance(tasks, TaskSource):
+            return None
+        if isinstance(tasks, TaskTable):
+            return (tasks.name(row) for row in range(len(tasks)))
+        return (task.name for task in tasks)
+
+class _Dispatcher:
+    """Running tasks, waiting tasks and worker pools of one concurrent run of a Process.
+
+    Demonstrates composition: the process's concurrent loops delegate starting, parking and
+    collecting tasks to it.
+    """
+
+    def __init__(self, process: Process, stack: ExitStack, priority: Callable[[Executable], int]):
+        """Initialize a _Dispatcher and open its worker pools.
+
+        Args:
+            process: The process whose tasks are dispatched.
+            stack: The exit stack that closes the worker pools.
+            priority: Default rank of a waiting task (higher is retried first).
+        """
+        self._process = process
+        self._policy = process.retry_policy or RetryPolicy()
+        self._threads, self._workers = process._executors(stack)
+        self._priority = priority
+        self._remote: Set[Future] = set()
+        self.in_flight: Dict[Future, Executable] = {}
+        self.parked = WaitQueue(process._resource_pool, self._policy)
+        stack.enter_context(_registered(_Run(process, self.in_flight, self.parked)))
+        stack.push(self._interrupted)
+
+    def _interrupted(self, kind: Optional[type], error: Optional[BaseException], trace: object) -> None:
+        """Close the journal of a run cut short by an exception (exit-stack callback).
+
+        It runs before the worker pools shut down; tasks still in flight hold their resources
+        and will run again on resume, so their consumed capacity is checkpointed as available.
+        """
+        journal = self._process.checkpoint
+        if kind is not None and journal is not None:
+            journal.close((self._process, *self.in_flight.values()))
+
+    @property
+    def has_free_worker(self) -> bool:
+        """Check whether another task may start now."""
+        return len(self.in_flight) < self._process.max_workers
+
+    def offer(self, task: Executable) -> Optional[str]:
+        """Start a task whose dependencies completed, or make it wait for resources.
+
+        Args:
+            task: The task to start.
+
+        Returns:
+            None if the task started or waits, otherwise why it has to be skipped.
+        """
+        process = self._process
+        priority = self._priority(task)
+        # Names a task ranked ahead of this one waits for are left to it, even if units are free.
+        ahead = self.parked.queued_ahead(task, priority)
+        if not ahead and task.try_assign_resources(process._resource_pool):
+            entry = self.parked.dispatched(task)
+            if entry is not None and process.metrics is not None:
+                process._record_wait(entry)
+            self.in_flight[process._submit(task, self._threads, self._workers, self._remote)] = task
+            return None
+        patient = self._policy.timeout is not None
+        if ahead or ((self.in_flight or patient or process._parent_progressing()) and process._can_wait(task, patient)):
+            if self.parked.park(task, [*ahead, *process._missing(task)], priority, not ahead):
+                return None
+            return "gave up waiting for resources"
+        self.parked.dispatched(task)
+        return "insufficient resources"
+
+    def retry_woken(self) -> List[Tuple[Executable, str]]:
+        """Offer woken tasks their resources again, highest priority first, while workers are free.
+
+        Returns:
+            The tasks that have to be skipped now, with the reason.
+        """
+        skipped: List[Tuple[Executable, str]] = []
+        while self.has_free_worker:
+            task = self.parked.pop_due()
+            if task is None:
+                break
+            reason = self.offer(task)
+            if reason is not None:
+                skipped.append((task, reason))
+        return skipped
+
+    def stranded(self) -> List[Tuple[Executable, str]]:
+        """Remove waiting tasks that timed out, or that nothing running can release resources for.
+
+        In a nested process, tasks running in the enclosing processes count as well.
+
+        Returns:
+            The tasks that have to be skipped now, with the reason.
+        """
+        skipped = [(task, "timed out waiting for resources") for task in self.parked.expire()]
+        if self.parked and not self.in_flight and self._policy.timeout is None \
+                and not self._process._parent_progressing():
+            skipped.extend((task, "insufficient resources") for task in self.parked.drain())
+        if skipped:
+            _poke_runs(self._process)
+        return skipped
+
+    def wait(self) -> List[Tuple[Executable, Optional[BaseException]]]:
+        """Block until a task finishes, a waiting task is woken, or a back-off or timeout ends.
+
+        Finished tasks release their resources here, which wakes the tasks waiting for them.
+
+        Returns:
+            The finished tasks with the exception each raised (None on success).
+        """
+        waitables: List[Future] = list(self.in_flight)
+        if self.parked and self.has_free_worker:
+            waitables.append(self.parked.alarm())
+        if not waitables:
+            return []
+        done, _ = wait(waitables, timeout=self.parked.next_event(), return_when=FIRST_COMPLETED)
+        finished: List[Tuple[Executable, Optional[BaseException]]] = []
+        for future in done:
+            task = self.in_flight.pop(future, None)
+            if task is None:
+                continue
+            task.release_resources()
+            error = future.exception()
+            if future in self._remote:
+                self._remote.discard(future)
+                if error is None:
+                    error = self._process.replay_outcome(task, future.result())
+            finished.append((task, error))
+        if finished:
+            _poke_runs(self._process)
+        return finished
+
+class _Run:
+    """The tasks a process is running and the queue its blocked tasks wait in, while it runs.
+
+    Demonstrates encapsulation of what a run shares with the processes nested in it.
+    """
+
+    __slots__ = ("process", "in_flight", "parked")
+
+    def __init__(self, process: Process, in_flight: Dict[Optional[Future], Executable], parked: Optional[WaitQueue]):
+        self.process = process
+        # Keyed by future for concurrent runs; an inline run keeps its task under None unless it waits.
+        self.in_flight = in_flight
+        self.parked = parked
+
+# Runs in progress, by the pool of their process, so nested processes can find their parent's run.
+_runs: "WeakKeyDictionary[ResourcePool, _Run]" = WeakKeyDictionary()
+_runs_lock = threading.Lock()
+
+@contextmanager
+def _registered(run: _Run) -> Iterator[None]:
+    """Make a run visible to the processes nested in it, and to its siblings, while it lasts."""
+    with _runs_lock:
+        _runs[run.process.resource_pool] = run
+    _poke_runs(run.process)
+    try:
+        yield
+    finally:
+        with _runs_lock:
+            _runs.pop(run.process.resource_pool, None)
+
+def _poke_runs(process: Process) -> None:
+    """Poke the queues of the other runs, whose tasks may wait only because of what this process runs."""
+    with _runs_lock:
+        runs = list(_runs.values())
+    for run in runs:
+        if run.process is not process and run.parked is not None:
+            run.parked.poke()
+
+def _progressing(task: Executable) -> bool:
+    """Check whether a running task will finish without waiting for resources held by other running tasks.
+
+    A nested process counts while it starts or finishes, while tasks wait in its queue under a
+    retry policy with a timeout, and while one of its own running tasks counts.
+    """
+    if not isinstance(task, Process):
+        return True
+    run = _runs.get(task.resource_pool)
+    if run is None:
+        return True
+    policy = task.retry_policy
+    if policy is not None and policy.timeout is not None and run.parked:
+        return True
+    return any(_progressing(other) for other in list(run.in_flight.copy().values()))
@@ -9,11 +9,19 @@ License: MIT
 This module provides the Resource abstract base class, illustrating abstraction in OOP.
 It serves as the foundation for ConsumableResource and UsableResource, defining a common
 interface for resource management in the process simulation, including allocation,
-release, and usage tracking.
+release, and usage tracking. A resource can report units given back to a callback, which is how
+its ResourcePool learns about releases and replenishments made on the resource directly.
 """
 
+import sys
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.metrics import Metrics
 
 class ResourceType(Enum):
     """Enumeration defining resource types."""
@@ -26,6 +34,8 @@ class Resource(ABC):
     This class defines the interface for resources, demonstrating abstraction.
     """
 
+    __slots__ = ("_name", "_is_available", "_resource_type", "_lock", "_metrics", "_freed_callback")
+
     def __init__(self, name: str, resource_type: ResourceType):
         """Initialize a Resource with a name and type.
 
@@ -33,9 +43,13 @@ class Resource(ABC):
             name: The unique identifier for the resource.
             resource_type: The type of resource (Consumable or Usable).
         """
-        self._name = name
+        self._name = sys.intern(name)
         self._is_available = True
         self._resource_type = resource_type
+        self._lock = threading.Lock()
+        self._metrics: Optional["Metrics"] = None
+        # (weak reference to the object, function) of a bound method, so calling it stays cheap.
+        self._freed_callback: Optional[Tuple[weakref.ref, Callable[[Any, "Resource"], None]]] = None
 
     @property
     def name(self) -> str:
@@ -47,6 +61,67 @@ class Resource(ABC):
         """Get the resource type."""
         return self._resource_type
 
+    def instrument(self, metrics: Optional["Metrics"]) -> None:
+        """Attach a metrics collector to the resource, or detach it with None.
+
+        Args:
+            metrics: The collector that records allocations, releases and waits.
+        """
+        self._metrics = metrics
+
+    @property
+    def freed_callback(self) -> Optional[Callable[["Resource"], None]]:
+        """Get the callback told when units are given back, or None (also once its owner is gone)."""
+        if self._freed_callback is None:
+            return None
+        reference, function = self._freed_callback
+        owner = reference()
+        return None if owner is None else function.__get__(owner)
+
+    def set_freed_callback(self, callback: Optional[Callable[["Resource"], None]]) -> None:
+        """Report every release or replenishment of the resource to a callback.
+
+        The callback is held weakly, so the object it belongs to (e.g., the owning pool) is not
+        kept alive by the resource. It is called with the resource, without the resource's lock.
+
+        Args:
+            callback: A bound method, or None to stop reporting.
+        """
+        self._freed_callback = None if callback is None else (weakref.ref(callback.__self__), callback.__func__)
+
+    def reports_to(self, owner: object) -> bool:
+        """Check whether the freed callback is a method of the given object."""
+        return self._freed_callback is not None and self._freed_callback[0]() is owner
+
+    def _freed(self) -> None:
+        """Tell the freed callback that units were given back (caller must not hold the lock)."""
+        if self._freed_callback is not None:
+            reference, function = self._freed_callback
+            owner = reference()
+            if owner is not None:
+                function(owner, self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Copy the resource's state for pickling, without its lock, metrics collector or freed callback.
+
+        An unpickled resource (e.g., in a worker process) is a snapshot: allocating or
+        releasing it does not change the original. Attributes of subclasses that do not
+        declare __slots__ are copied as well.
+        """
+        state = dict(getattr(self, "__dict__", ()))
+        state.update((slot, getattr(self, slot)) for cls in type(self).__mro__
+                     for slot in getattr(cls, "__slots__", ()) if hasattr(self, slot))
+        state["_lock"] = None
+        state["_metrics"] = None
+        state["_freed_callback"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled resource with a fresh lock."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._lock = threading.Lock()
+
     @abstractmethod
     def is_available_for_use(self) -> bool:
         """Check if the resource is available for allocation.
@@ -57,17 +132,36 @@ class Resource(ABC):
         pass
 
     @abstractmethod
-    def allocate(self) -> None:
+    def can_allocate(self, amount: int = 1) -> bool:
+        """Check if the given amount of the resource can be allocated right now.
+
+        Args:
+            amount: The number of units (slots or capacity) requested.
+
+        Returns:
+            True if allocate(amount) would succeed, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def allocate(self, amount: int = 1) -> None:
         """Allocate the resource for use.
 
+        Args:
+            amount: The number of units (slots or capacity) to allocate.
+
         Raises:
             RuntimeError: If the resource cannot be allocated.
         """
         pass
 
     @abstractmethod
-    def release(self) -> None:
-        """Release the resource after use."""
+    def release(self, amount: int = 1) -> None:
+        """Release the resource after use.
+
+        Args:
+            amount: The number of units that were allocated.
+        """
         pass
 
     @abstractmethod
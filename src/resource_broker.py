@@ -0,0 +1,339 @@
+"""
+File: resource_broker.py
+Purpose: Implements the ResourceBroker and BrokerClient classes for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the ResourceBroker class, a socket service that owns the authoritative
+ResourcePool when a Process is spread over several machines, and the BrokerClient class that
+talks to it. Clients never hold resources themselves: they lease them. A single request can
+release any number of leases and reserve any number of all-or-nothing demands, so a worker
+returns the resources of its last batch of tasks and obtains those of the next batch in one
+round trip. Granted leases carry snapshots of the reserved resources, as a task executed in a
+worker process would. Leases still held when the connection that took them closes (e.g., because
+the worker crashed) are released by the broker.
+
+Messages are length-prefixed pickles, like the ones exchanged with process pool workers, so the
+broker must only be reachable by trusted clients; it binds to localhost by default.
+"""
+
+import pickle
+import queue
+import socket
+import socketserver
+import struct
+import threading
+from src.resource import Resource, ResourceType
+from src.resource_pool import ResourcePool
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+Address = Tuple[str, int]
+Demand = Sequence[Tuple[str, int]]
+# A granted lease (lease id, reserved resources) or a refusal (whether it can be granted later, missing name).
+Grant = Union[Tuple[int, List[Resource]], Tuple[None, bool, str]]
+
+_LENGTH = struct.Struct("<I")
+
+def send_message(connection: socket.socket, message: Any) -> None:
+    """Send one length-prefixed, pickled message.
+
+    Args:
+        connection: A connected socket.
+        message: Any picklable value.
+    """
+    data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    connection.sendall(_LENGTH.pack(len(data)) + data)
+
+def receive_message(connection: socket.socket) -> Any:
+    """Receive one message sent with send_message.
+
+    Args:
+        connection: A connected socket.
+
+    Returns:
+        The unpickled value.
+
+    Raises:
+        ConnectionError: If the peer closed the connection.
+    """
+    (length,) = _LENGTH.unpack(_receive_exactly(connection, _LENGTH.size))
+    return pickle.loads(_receive_exactly(connection, length))
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from a socket."""
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = connection.recv(min(size - len(chunks), 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        chunks += chunk
+    return bytes(chunks)
+
+class ResourceBroker:
+    """Socket service that leases the resources of a pool to remote clients.
+
+    Demonstrates encapsulation: the pool and its leases are only reachable through the
+    broker's request protocol.
+    """
+
+    def __init__(self, pool: ResourcePool, host: str = "127.0.0.1", port: int = 0):
+        """Initialize a ResourceBroker and bind its socket.
+
+        Args:
+            pool: The authoritative pool; nothing else should allocate from it meanwhile.
+            host: The interface to listen on.
+            port: The port to listen on (0 picks a free one; see address).
+        """
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._leases: Dict[int, Tuple[List[Resource], List[int]]] = {}
+        self._next_lease = 1
+        self._thread: Optional[threading.Thread] = None
+        broker = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                broker._serve(self.request)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.server_bind()
+        self._server.server_activate()
+
+    @property
+    def address(self) -> Address:
+        """Get the (host, port) clients connect to."""
+        return self._server.server_address[:2]
+
+    @property
+    def pool(self) -> ResourcePool:
+        """Get the authoritative pool."""
+        return self._pool
+
+    @property
+    def lease_count(self) -> int:
+        """Get the number of leases currently held by clients."""
+        return len(self._leases)
+
+    def start(self) -> "ResourceBroker":
+        """Serve requests on a background thread.
+
+        Returns:
+            The broker, for chaining.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name="ResourceBroker",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until stop() is called from another one."""
+        self._server.serve_forever(0.05)
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket; leases still held stay allocated."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ResourceBroker":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def exchange(self, releases: Sequence[int], demands: Sequence[Demand],
+                 owned: Optional[Set[int]] = None) -> List[Grant]:
+        """Release leases, then try to reserve each demand, all or nothing per demand.
+
+        Args:
+            releases: Ids of leases to release; unknown ids are ignored.
+            demands: (name, amount) pairs per requested lease.
+            owned: Lease ids of the calling connection; updated with the changes.
+
+        Returns:
+            Per demand, (lease id, snapshots of the reserved resources) if it was granted,
+            otherwise (None, whether releasing held slots could satisfy it later, the name
+            of the first resource that is unavailable).
+        """
+        pool = self._pool
+        for lease in releases:
+            with self._lock:
+                held = self._leases.pop(lease, None)
+            if owned is not None:
+                owned.discard(lease)
+            if held is not None:
+                for resource, amount in zip(*held):
+                    pool.release(resource, amount)
+        grants: List[Grant] = []
+        for demand in demands:
+            reserved = pool.reserve(demand) if demand else []
+            if reserved is None:
+                missing = [(name, amount) for name, amount in demand if not pool.is_available(name, amount)]
+                name = missing[0][0] if missing else demand[0][0]
+                grants.append((None, all(pool.has_reusable(name, amount) for name, amount in missing), name))
+                continue
+            with self._lock:
+                lease = self._next_lease
+                self._next_lease += 1
+                self._leases[lease] = (reserved, [amount for _, amount in demand])
+            if owned is not None:
+                owned.add(lease)
+            grants.append((lease, reserved))
+        return grants
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """Describe the capacity of every resource in the pool, per name.
+
+        Returns:
+            For usable resources their capacity and slots in use, for consumable ones
+            their total and remaining capacity (summed over resources of the same name).
+        """
+        status: Dict[str, Dict[str, int]] = {}
+        for resource in self._pool:
+            entry = status.setdefault(resource.name, {})
+            if resource.resource_type is ResourceType.USABLE:
+                entry["capacity"] = entry.get("capacity", 0) + resource.capacity
+                entry["in_use"] = entry.get("in_use", 0) + resource.in_use
+            else:
+                entry["total"] = entry.get("total", 0) + resource.total_capacity
+                entry["remaining"] = entry.get("remaining", 0) + resource.remaining_capacity
+        return status
+
+    def _serve(self, connection: socket.socket) -> None:
+        """Answer the requests of one connection, releasing its leases when it closes.
+
+        Requests are ("exchange", releases, demands) and ("status",).
+        """
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        owned: Set[int] = set()
+        try:
+            while True:
+                try:
+                    request = receive_message(connection)
+                except (ConnectionError, OSError):
+                    return
+                if request[0] == "exchange":
+                    reply: Any = self.exchange(request[1], request[2], owned)
+                elif request[0] == "status":
+                    reply = self.status()
+                else:
+                    reply = ValueError(f"Unknown broker request '{request[0]}'")
+                send_message(connection, reply)
+        finally:
+            if owned:
+                self.exchange(list(owned), [])
+
+class BrokerClient:
+    """Thread-safe client of a ResourceBroker with a pool of reusable connections.
+
+    Demonstrates composition: callers exchange leases without managing sockets, and
+    concurrent callers each borrow their own connection.
+    """
+
+    def __init__(self, address: Address, max_connections: int = 4, timeout: Optional[float] = None):
+        """Initialize a BrokerClient; connections are opened on first use.
+
+        Args:
+            address: The broker's (host, port).
+            max_connections: Connections kept open for reuse; further concurrent requests
+                wait for one of them.
+            timeout: Seconds to wait for a connection or a reply (None waits indefinitely).
+
+        Raises:
+            ValueError: If max_connections is not positive.
+        """
+        if max_connections <= 0:
+            raise ValueError("A broker client needs at least one connection")
+        self._address = tuple(address)
+        self._timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: "queue.LifoQueue[socket.socket]" = queue.LifoQueue()
+        self._closed = False
+
+    @property
+    def address(self) -> Address:
+        """Get the broker's (host, port)."""
+        return self._address
+
+    def exchange(self, releases: Sequence[int], demands: Sequence[Demand]) -> List[Grant]:
+        """Release leases and reserve demands in one round trip (see ResourceBroker.exchange).
+
+        Leases taken on a connection are released by the broker if that connection closes,
+        so a client must release its leases before close().
+
+        Args:
+            releases: Ids of leases to release.
+            demands: (name, amount) pairs per requested lease.
+
+        Returns:
+            Per demand, a granted lease or a refusal.
+
+        Raises:
+            ConnectionError: If the broker cannot be reached.
+        """
+        return self._request(("exchange", list(releases), [list(demand) for demand in demands]))
+
+    def reserve(self, demands: Sequence[Demand]) -> List[Grant]:
+        """Reserve demands in one round trip; see exchange."""
+        return self.exchange((), demands)
+
+    def release(self, leases: Sequence[int]) -> None:
+        """Release leases in one round trip; see exchange."""
+        if leases:
+            self.exchange(leases, ())
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """Get the broker's capacity per resource name (see ResourceBroker.status)."""
+        return self._request(("status",))
+
+    def close(self) -> None:
+        """Close every idle connection; the broker releases the leases taken on them."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self) -> "BrokerClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, request: Any) -> Any:
+        """Send a request on an idle connection (or a new one) and return the reply.
+
+        Connections are only closed on errors and by close(), since the broker releases the
+        leases of a connection that closes.
+        """
+        if not self._slots.acquire(timeout=-1 if self._timeout is None else self._timeout):
+            raise ConnectionError(f"No connection to the resource broker at {self._address} became free")
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = socket.create_connection(self._address, timeout=self._timeout)
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                send_message(connection, request)
+                reply = receive_message(connection)
+            except BaseException:
+                connection.close()
+                raise
+            if self._closed:
+                connection.close()
+            else:
+                self._idle.put(connection)
+        finally:
+            self._slots.release()
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
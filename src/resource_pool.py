@@ -0,0 +1,512 @@
+"""
+File: resource_pool.py
+Purpose: Implements the ResourcePool class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the ResourcePool class, an indexed container for the resources owned by a
+Process. It keeps a name-to-resources index and a per-name free list so that executables can
+look up, allocate and check availability of resources without scanning the whole pool. A pool can
+have a parent: names that are missing or exhausted locally are borrowed from the parent, up to a
+per-name quota, so nested processes can share one budget. The pool also remembers, per name, the
+smallest request it last had to refuse, so repeated requests that cannot succeed are refused in
+O(1) until a release or replenishment makes more units available. The same events wake the
+per-name watchers of blocked requests, so waiting tasks never have to poll the pool. The pool
+registers itself as the freed callback of the resources it adds (unless another live pool already
+did), so releasing or replenishing one of them directly, without going through the pool, also
+returns it to the free list; such a release is not deducted from a borrowing quota, though.
+"""
+
+import itertools
+import threading
+from src.resource import Resource, ResourceType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+_watch_tokens = itertools.count(1)
+
+class ResourcePool:
+    """Indexed pool of resources with a per-name free list.
+
+    Demonstrates encapsulation of the lookup structures behind a small interface. All
+    operations are guarded by a re-entrant lock so the pool can be shared between threads;
+    pools in one hierarchy share a single lock so reservations spanning levels stay atomic.
+    """
+
+    def __init__(self, resources: Optional[Iterable[Resource]] = None, parent: Optional["ResourcePool"] = None,
+                 quotas: Optional[Dict[str, int]] = None):
+        """Initialize a ResourcePool, optionally filled with resources.
+
+        Args:
+            resources: Resources to add to the pool, in order.
+            parent: Pool to borrow from when a name is missing or exhausted locally.
+            quotas: Maximum units borrowed from the parent per resource name.
+        """
+        self._resources: List[Resource] = []
+        self._by_name: Dict[str, List[Resource]] = {}
+        self._free: Dict[str, List[Resource]] = {}
+        self._free_index: Dict[int, int] = {}
+        self._owned_ids: Set[int] = set()
+        self._parent: Optional[ResourcePool] = None
+        self._children: List[ResourcePool] = []
+        self._quotas: Dict[str, int] = {}
+        self._borrowed: Dict[str, int] = {}
+        self._shortfall: Dict[str, int] = {}
+        self._watchers: Dict[str, Set[int]] = {}
+        self._watches: Dict[int, Tuple[Tuple[str, ...], Callable[[], None]]] = {}
+        self._lock = threading.RLock()
+        if parent is not None:
+            self.attach(parent)
+        for name, units in (quotas or {}).items():
+            self.set_quota(name, units)
+        if resources is not None:
+            for resource in resources:
+                self.add(resource)
+
+    @classmethod
+    def of(cls, resource_pool: "Iterable[Resource]") -> "ResourcePool":
+        """Return the given pool itself, or an indexed pool built from a plain iterable.
+
+        Executables only accept ResourcePool instances, so a list of resources is indexed
+        once here rather than on every lookup.
+
+        Args:
+            resource_pool: A ResourcePool or any iterable of resources (e.g., a list).
+
+        Returns:
+            A ResourcePool view of the resources.
+        """
+        if isinstance(resource_pool, ResourcePool):
+            return resource_pool
+        return cls(resource_pool)
+
+    def add(self, resource: Resource) -> None:
+        """Add a resource to the pool.
+
+        Args:
+            resource: The resource to add.
+        """
+        with self._lock:
+            self._resources.append(resource)
+            self._owned_ids.add(id(resource))
+            self._by_name.setdefault(resource.name, []).append(resource)
+            self._free.setdefault(resource.name, [])
+            if resource.freed_callback is None:
+                resource.set_freed_callback(self._resource_freed)
+            if resource.is_available_for_use():
+                self._push_free(resource)
+            self._invalidate(resource.name)
+
+    def _resource_freed(self, resource: Resource) -> None:
+        """Return a resource to the free list after units of it were given back (freed callback)."""
+        with self._lock:
+            if resource.is_available_for_use() and resource.name in self._free:
+                self._push_free(resource)
+            self._invalidate(resource.name)
+
+    @property
+    def parent(self) -> Optional["ResourcePool"]:
+        """Get the pool this one borrows from, if any."""
+        return self._parent
+
+    def attach(self, parent: "ResourcePool") -> None:
+        """Borrow from a parent pool when a name is missing or exhausted locally.
+
+        Args:
+            parent: The pool to borrow from.
+
+        Raises:
+            ValueError: If the parent is this pool or one of its descendants.
+            RuntimeError: If the pool currently holds units borrowed from another parent.
+        """
+        ancestor: Optional[ResourcePool] = parent
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError("A resource pool cannot borrow from itself or its descendants")
+            ancestor = ancestor._parent
+        with self._lock:
+            if any(self._borrowed.values()):
+                raise RuntimeError("Cannot change the parent of a pool that holds borrowed resources")
+            if self._parent is not None:
+                self._parent._children.remove(self)
+            self._parent = parent
+            parent._children.append(self)
+            self._share_lock(parent._lock)
+            self._invalidate(None)
+
+    def _share_lock(self, lock: "threading.RLock") -> None:
+        """Use the given lock for this pool and every pool that borrows from it."""
+        self._lock = lock
+        for child in self._children:
+            child._share_lock(lock)
+
+    def set_quota(self, name: str, units: int) -> None:
+        """Limit how many units of a name may be borrowed from the parent.
+
+        Usable slots count while they are held; consumable capacity counts once consumed.
+
+        Args:
+            name: The resource name.
+            units: The maximum units borrowed (0 forbids borrowing).
+
+        Raises:
+            ValueError: If units is negative.
+        """
+        if units < 0:
+            raise ValueError(f"Quota for resource '{name}' cannot be negative")
+        with self._lock:
+            self._quotas[name] = units
+            self._invalidate(name)
+
+    def quota(self, name: str) -> Optional[int]:
+        """Get the borrowing quota for a name, or None if borrowing is unlimited."""
+        return self._quotas.get(name)
+
+    @property
+    def quotas(self) -> Dict[str, int]:
+        """Get a copy of every borrowing quota, keyed by resource name."""
+        return dict(self._quotas)
+
+    def borrowed(self, name: str) -> int:
+        """Get the units of a name currently counted against its quota."""
+        return self._borrowed.get(name, 0)
+
+    def get(self, name: str) -> List[Resource]:
+        """Get every resource registered under a name.
+
+        Args:
+            name: The resource name to look up.
+
+        Returns:
+            The resources with that name, in insertion order (empty if none).
+        """
+        return list(self._by_name.get(name, ()))
+
+    def find_available(self, name: str, amount: int = 1) -> Optional[Resource]:
+        """Find a resource with the given name that can serve an allocation.
+
+        Resources that stopped being available since they were freed are dropped from the
+        free list lazily, and resources a reservation exhausts are swapped out of it in O(1),
+        so repeated lookups and reservations are O(1) amortized.
+
+        Args:
+            name: The resource name to look up.
+            amount: The number of units (slots or capacity) the allocation needs.
+
+        Returns:
+            A resource that can allocate amount units, or None if there is none.
+        """
+        with self._lock:
+            if self._refused(name, amount):
+                return None
+            resource = self._find(name, amount, {}, {})
+            if resource is None:
+                self._remember_refusal(name, amount)
+            return resource
+
+    def _find(self, name: str, amount: int, planned: Dict[int, int],
+              borrowing: Dict[Tuple["ResourcePool", str], int]) -> Optional[Resource]:
+        """Find a free resource that can serve amount units on top of those already planned.
+
+        Local resources are preferred; otherwise the parent is asked, within the quota.
+
+        Args:
+            name: The resource name to look up.
+            amount: The number of units needed.
+            planned: Units already promised per resource id within the same reservation.
+            borrowing: Units already planned to be borrowed per (pool, name) in the reservation;
+                updated when the parent serves the request.
+
+        Returns:
+            A suitable resource, or None if there is none.
+        """
+        free = self._free.get(name)
+        while free and not free[-1].is_available_for_use():
+            del self._free_index[id(free.pop())]
+        for resource in reversed(free or ()):
+            if resource.can_allocate(planned.get(id(resource), 0) + amount):
+                return resource
+        if self._parent is None:
+            return None
+        key = (self, name)
+        quota = self._quotas.get(name)
+        if quota is not None and self._borrowed.get(name, 0) + borrowing.get(key, 0) + amount > quota:
+            return None
+        resource = self._parent._find(name, amount, planned, borrowing)
+        if resource is not None:
+            borrowing[key] = borrowing.get(key, 0) + amount
+        return resource
+
+    def is_available(self, name: str, amount: int = 1) -> bool:
+        """Check whether a resource with the given name can be allocated.
+
+        Args:
+            name: The resource name to check.
+            amount: The number of units (slots or capacity) needed.
+
+        Returns:
+            True if an available resource exists, False otherwise.
+        """
+        return self.find_available(name, amount) is not None
+
+    def acquire(self, name: str, amount: int = 1) -> Optional[Resource]:
+        """Allocate an available resource with the given name.
+
+        Args:
+            name: The resource name to allocate.
+            amount: The number of units (slots or capacity) to allocate.
+
+        Returns:
+            The allocated resource, or None if none is available.
+        """
+        reserved = self.reserve([(name, amount)])
+        return reserved[0] if reserved is not None else None
+
+    def reserve(self, demands: Iterable[Tuple[str, int]]) -> Optional[List[Resource]]:
+        """Allocate several resources at once, all or nothing.
+
+        Every demand is matched to a resource before anything is allocated, so a request
+        that cannot be met in full leaves the pool untouched.
+
+        Args:
+            demands: (name, amount) pairs; a name may appear more than once.
+
+        Returns:
+            The allocated resources, one per demand in order, or None if any demand
+            cannot be met.
+        """
+        demands = list(demands)
+        with self._lock:
+            for name, amount in demands:
+                if self._refused(name, amount):
+                    return None
+            planned: Dict[int, int] = {}
+            borrowing: Dict[Tuple[ResourcePool, str], int] = {}
+            chosen: List[Resource] = []
+            requested: Set[str] = set()
+            for name, amount in demands:
+                resource = self._find(name, amount, planned, borrowing)
+                if resource is None:
+                    if name not in requested:
+                        self._remember_refusal(name, amount)
+                    return None
+                requested.add(name)
+                planned[id(resource)] = planned.get(id(resource), 0) + amount
+                chosen.append(resource)
+            allocated = 0
+            try:
+                for resource, (_, amount) in zip(chosen, demands):
+                    resource.allocate(amount)
+                    allocated += 1
+            except RuntimeError:
+                # Allocated behind the pool's back since the check; undo what was taken. Releasing
+                # a consumable does not give its capacity back, so it is replenished instead.
+                for resource, (_, amount) in zip(chosen[:allocated], demands):
+                    if resource.resource_type is ResourceType.CONSUMABLE:
+                        resource.replenish(amount)
+                    else:
+                        resource.release(amount)
+                return None
+            for resource in chosen:
+                if not resource.is_available_for_use():
+                    self._owner(resource)._drop_free(resource)
+            for (pool, name), amount in borrowing.items():
+                pool._borrowed[name] = pool._borrowed.get(name, 0) + amount
+            return chosen
+
+    def release(self, resource: Resource, amount: int = 1) -> None:
+        """Release a resource and return it to the free list if it can be reused.
+
+        Args:
+            resource: The resource to release.
+            amount: The number of units that were allocated.
+        """
+        with self._lock:
+            owner = self._owner(resource)
+            resource.release(amount)
+            # A usable resource reports the release to its owner, which already took it back.
+            told = resource.reports_to(owner)
+            if not told and resource.is_available_for_use() and resource.name in owner._free:
+                owner._push_free(resource)
+            if resource.resource_type is ResourceType.USABLE:
+                pool = self
+                while pool is not owner:
+                    pool._borrowed[resource.name] = max(pool._borrowed.get(resource.name, 0) - amount, 0)
+                    pool = pool._parent
+            if not told:
+                owner._invalidate(resource.name)
+
+    def _refused(self, name: str, amount: int) -> bool:
+        """Check the refusal cache: True if a request this large was refused since the last release."""
+        shortfall = self._shortfall.get(name)
+        return shortfall is not None and amount >= shortfall
+
+    def _remember_refusal(self, name: str, amount: int) -> None:
+        """Record that a request for amount units of a name cannot be met right now."""
+        shortfall = self._shortfall.get(name)
+        if shortfall is None or amount < shortfall:
+            self._shortfall[name] = amount
+
+    def _invalidate(self, name: Optional[str]) -> None:
+        """Forget refusals for a name (or all names) here and in every pool that borrows from this one.
+
+        Only operations that can make units available (add, release, replenish, quota and
+        parent changes) invalidate; allocations can only turn a refusal into a correct one.
+        """
+        if name is None:
+            self._shortfall.clear()
+        else:
+            self._shortfall.pop(name, None)
+        if self._watches:
+            self._notify(name)
+        for child in self._children:
+            child._invalidate(name)
+
+    def watch(self, names: Iterable[str], callback: Callable[[], None]) -> int:
+        """Ask to be told once when any of the given names may have units available again.
+
+        The callback runs at most once, on the first add, release, replenishment, quota or
+        parent change that affects one of the names (also when it happens in an ancestor
+        pool). It runs while the pool's lock is held, so it must only record the wake-up.
+
+        Args:
+            names: The resource names the caller is waiting for.
+            callback: Called without arguments when one of them may be available.
+
+        Returns:
+            A token for unwatch().
+        """
+        token = next(_watch_tokens)
+        names = tuple(dict.fromkeys(names))
+        with self._lock:
+            self._watches[token] = (names, callback)
+            for name in names:
+                self._watchers.setdefault(name, set()).add(token)
+        return token
+
+    def unwatch(self, token: int) -> None:
+        """Cancel a watch that has not fired yet (no effect otherwise).
+
+        Args:
+            token: The token returned by watch().
+        """
+        with self._lock:
+            names, _ = self._watches.pop(token, ((), None))
+            for name in names:
+                watchers = self._watchers.get(name)
+                if watchers is not None:
+                    watchers.discard(token)
+                    if not watchers:
+                        del self._watchers[name]
+
+    def _notify(self, name: Optional[str]) -> None:
+        """Fire and remove the watches on a name, or on every name (caller holds the lock)."""
+        tokens = list(self._watches) if name is None else list(self._watchers.get(name, ()))
+        for token in tokens:
+            _, callback = self._watches[token]
+            self.unwatch(token)
+            callback()
+
+    def _owner(self, resource: Resource) -> "ResourcePool":
+        """Find the pool in this one's ancestry that holds a resource (self if none does)."""
+        pool: Optional[ResourcePool] = self
+        while pool is not None:
+            if id(resource) in pool._owned_ids:
+                return pool
+            pool = pool._parent
+        return self
+
+    def replenish(self, name: str, amount: int) -> int:
+        """Restore consumed capacity of the consumable resources registered under a name.
+
+        Resources are topped up in insertion order until amount is used up.
+
+        Args:
+            name: The resource name to replenish.
+            amount: The capacity to restore.
+
+        Returns:
+            The capacity actually restored.
+
+        Raises:
+            ValueError: If amount is not positive.
+        """
+        if amount <= 0:
+            raise ValueError(f"Amount replenished for resource '{name}' must be positive")
+        restored = 0
+        with self._lock:
+            for resource in self._by_name.get(name, ()):
+                if restored == amount:
+                    break
+                if resource.resource_type is ResourceType.CONSUMABLE:
+                    restored += resource.replenish(amount - restored)
+                    if resource.is_available_for_use():
+                        self._push_free(resource)
+            self._invalidate(name)
+        return restored
+
+    def restore(self, resource: Resource, remaining: int) -> None:
+        """Set the remaining capacity of one of the pool's own consumable resources.
+
+        Args:
+            resource: The consumable resource, registered in this pool.
+            remaining: The capacity left.
+
+        Raises:
+            ValueError: If the resource is not a consumable of this pool or remaining is out of range.
+        """
+        if resource.resource_type is not ResourceType.CONSUMABLE or id(resource) not in self._owned_ids:
+            raise ValueError(f"Resource '{resource.name}' is not a consumable resource of this pool")
+        with self._lock:
+            resource.restore(remaining)
+            if resource.is_available_for_use():
+                self._push_free(resource)
+            self._invalidate(resource.name)
+
+    def _push_free(self, resource: Resource) -> None:
+        """Put a resource on its name's free list unless it is already there."""
+        if id(resource) not in self._free_index:
+            free = self._free[resource.name]
+            self._free_index[id(resource)] = len(free)
+            free.append(resource)
+
+    def _drop_free(self, resource: Resource) -> None:
+        """Take a resource off its name's free list, moving the last entry into its place."""
+        index = self._free_index.pop(id(resource), None)
+        if index is None:
+            return
+        free = self._free[resource.name]
+        last = free.pop()
+        if last is not resource:
+            free[index] = last
+            self._free_index[id(last)] = index
+
+    def has_reusable(self, name: str, amount: int = 1) -> bool:
+        """Check whether a name is served by a reusable (usable) resource large enough for a request.
+
+        Resources of the parent count as long as the quota allows the request.
+
+        Args:
+            name: The resource name to check.
+            amount: The number of slots the request needs.
+
+        Returns:
+            True if releasing held slots could make the request satisfiable again.
+        """
+        if any(r.resource_type is ResourceType.USABLE and r.capacity >= amount
+               for r in self._by_name.get(name, ())):
+            return True
+        if self._parent is None:
+            return False
+        quota = self._quotas.get(name)
+        return (quota is None or quota >= amount) and self._parent.has_reusable(name, amount)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name or (self._parent is not None and name in self._parent)
+
+    def __iter__(self) -> Iterator[Resource]:
+        return iter(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
@@ -0,0 +1,468 @@
+"""
+File: resource_tracer.py
+Purpose: Implements the ResourceTracer debug mode for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the ResourceTracer class, a debug mode that follows every resource an
+executable holds. While a tracer is enabled (see enable_tracing), executables report each
+assignment, refusal and release to it, and processes report the tasks they finish or skip. The
+tracer then knows which executable holds which resources and since when, and from that it derives:
+
+- leaks: releases that raised, and executables that finished or were assigned again while still
+  holding resources; each one is also emitted as a warning event instead of passing silently;
+- hold times per resource name, and waits from a refused request to its assignment, as
+  percentiles over a bounded random sample;
+- the acquisition order: an edge from resource a to resource b whenever an executable acquires b
+  while a is held by an enclosing process running on the same thread. A cycle in that graph
+  (including a process holding a resource its own tasks request) is a potential deadlock, even
+  if the run that produced the edges did not stall.
+
+With no tracer enabled every hook costs one function call.
+"""
+
+import random
+import threading
+import time
+from src.events import EventType, emit
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.executable import Executable
+    from src.resource import Resource
+
+PERCENTILES = (50, 90, 99)
+
+class _Durations:
+    """Count, total and maximum of a series of durations, with a bounded random sample for percentiles."""
+
+    __slots__ = ("count", "total", "maximum", "sample")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.sample: List[float] = []
+
+    def add(self, seconds: float, limit: int, rng: random.Random) -> None:
+        """Record a duration, keeping a uniform sample of at most limit values."""
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        if len(self.sample) < limit:
+            self.sample.append(seconds)
+        else:
+            slot = rng.randrange(self.count)
+            if slot < limit:
+                self.sample[slot] = seconds
+
+    def summary(self) -> Dict[str, float]:
+        """Summarize the durations as count, mean, percentiles and maximum."""
+        ordered = sorted(self.sample)
+        result: Dict[str, float] = {"count": self.count, "mean": self.total / self.count if self.count else 0.0}
+        for percentile in PERCENTILES:
+            result[f"p{percentile}"] = (ordered[min(len(ordered) - 1, len(ordered) * percentile // 100)]
+                                        if ordered else 0.0)
+        result["max"] = self.maximum
+        return result
+
+class ResourceTracer:
+    """Debug-mode record of resource holds, leaks, hold times and acquisition order.
+
+    Demonstrates encapsulation: executables and processes only report what they do through
+    the hook methods, and the findings are read through snapshot() and report().
+    """
+
+    def __init__(self, sample_size: int = 10000):
+        """Initialize a ResourceTracer.
+
+        Args:
+            sample_size: Durations kept per resource name for percentiles.
+
+        Raises:
+            ValueError: If sample_size is not positive.
+        """
+        if sample_size <= 0:
+            raise ValueError("Sample size of a resource tracer must be positive")
+        self._sample_size = sample_size
+        self._lock = threading.Lock()
+        self._rng = random.Random(0)
+        self._local = threading.local()
+        # id(executable) -> (executable, [resource, amount, acquired at]...)
+        self._holds: Dict[int, Tuple["Executable", List[list]]] = {}
+        self._refused: Dict[int, Tuple[float, str]] = {}
+        self._hold_times: Dict[str, _Durations] = {}
+        self._wait_times: Dict[str, _Durations] = {}
+        self._refusals: Dict[str, int] = {}
+        self._leaks: List[Dict[str, Any]] = []
+        # held name -> acquired name -> [count, holder name, acquirer name]
+        self._order: Dict[str, Dict[str, list]] = {}
+
+    def enter(self, executable: "Executable") -> None:
+        """Note that an executable starts running its own tasks on the calling thread.
+
+        Acquisitions on this thread until leave() are ordered after the resources it holds.
+
+        Args:
+            executable: The running process.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(executable)
+
+    def leave(self, executable: "Executable") -> None:
+        """Note that an executable stopped running its tasks on the calling thread.
+
+        Args:
+            executable: The process passed to enter().
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack and stack[-1] is executable:
+            stack.pop()
+
+    def acquired(self, executable: "Executable", resources: Sequence["Resource"]) -> None:
+        """Record the resources assigned to an executable.
+
+        Args:
+            executable: The executable that got its resources.
+            resources: The assigned resources.
+        """
+        now = time.monotonic()
+        enclosing = list(getattr(self._local, "stack", ()))
+        with self._lock:
+            previous = self._holds.pop(id(executable), None)
+            if previous is not None:
+                self._leak(previous[0], previous[1], now, "assigned again without releasing")
+            if not resources:
+                self._refused.pop(id(executable), None)
+                return
+            self._holds[id(executable)] = (executable, [[resource, executable.quantity_of(resource.name), now]
+                                                        for resource in resources])
+            refused = self._refused.pop(id(executable), None)
+            if refused is not None:
+                self._durations(self._wait_times, refused[1]).add(now - refused[0], self._sample_size, self._rng)
+            for holder in enclosing:
+                entry = self._holds.get(id(holder))
+                if entry is None or holder is executable:
+                    continue
+                for hold in entry[1]:
+                    edges = self._order.setdefault(hold[0].name, {})
+                    for resource in resources:
+                        edge = edges.get(resource.name)
+                        if edge is None:
+                            edges[resource.name] = [1, holder.name, executable.name]
+                        else:
+                            edge[0] += 1
+
+    def refused(self, executable: "Executable", resource_name: str) -> None:
+        """Record a request the pool could not satisfy.
+
+        The wait until the executable is assigned its resources is charged to resource_name.
+
+        Args:
+            executable: The executable that was refused.
+            resource_name: The first required resource that was unavailable.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._refusals[resource_name] = self._refusals.get(resource_name, 0) + 1
+            self._refused.setdefault(id(executable), (now, resource_name))
+
+    def released(self, executable: "Executable", resource: "Resource",
+                 error: Optional[BaseException] = None) -> None:
+        """Record the release of one resource held by an executable.
+
+        Args:
+            executable: The executable that held it.
+            resource: The released resource.
+            error: The exception the release raised, which leaks the resource, or None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._holds.get(id(executable))
+            if entry is None:
+                return
+            holds = entry[1]
+            for i, hold in enumerate(holds):
+                if hold[0] is resource:
+                    del holds[i]
+                    break
+            else:
+                return
+            if not holds:
+                del self._holds[id(executable)]
+            if error is None:
+                self._durations(self._hold_times, resource.name).add(now - hold[2], self._sample_size, self._rng)
+            else:
+                self._leak(executable, [hold], now, f"release failed: {error}")
+
+    def finished(self, executable: "Executable") -> None:
+        """Check that an executable that finished running no longer holds resources.
+
+        Args:
+            executable: The finished task or process.
+        """
+        with self._lock:
+            self._refused.pop(id(executable), None)
+            entry = self._holds.pop(id(executable), None)
+            if entry is not None:
+                self._leak(executable, entry[1], time.monotonic(), "finished without releasing")
+
+    def skipped(self, executable: "Executable") -> None:
+        """Forget the pending wait of an executable that will not run.
+
+        Args:
+            executable: The skipped task or process.
+        """
+        with self._lock:
+            self._refused.pop(id(executable), None)
+
+    @property
+    def leaks(self) -> List[Dict[str, Any]]:
+        """Get the leaked holds found so far, oldest first."""
+        with self._lock:
+            return [dict(leak) for leak in self._leaks]
+
+    def held(self) -> List[Dict[str, Any]]:
+        """List the resources held right now, by running tasks or by ones that never finished.
+
+        Returns:
+            One entry per held resource, with the holder and how long it has been held.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [self._describe(executable, hold, now) for executable, holds in self._holds.values()
+                    for hold in holds]
+
+    def hold_times(self) -> Dict[str, Dict[str, float]]:
+        """Summarize how long each resource name was held, in seconds.
+
+        Returns:
+            Count, mean, p50, p90, p99 and max per resource name.
+        """
+        with self._lock:
+            return {name: durations.summary() for name, durations in self._hold_times.items()}
+
+    def contention(self) -> Dict[str, Dict[str, float]]:
+        """Summarize refused requests and the waits they caused, per resource name.
+
+        Returns:
+            The number of refusals and the wait count, mean, percentiles and max in seconds.
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, float]] = {}
+            for name in sorted(set(self._refusals) | set(self._wait_times)):
+                durations = self._wait_times.get(name) or _Durations()
+                result[name] = {"refusals": self._refusals.get(name, 0), **durations.summary()}
+            return result
+
+    def acquisition_order(self) -> Dict[Tuple[str, str], int]:
+        """Get how often each resource name was acquired while another one was held.
+
+        Returns:
+            The number of acquisitions per (held name, acquired name) edge.
+        """
+        with self._lock:
+            return {(held, acquired): edge[0] for held, edges in self._order.items()
+                    for acquired, edge in edges.items()}
+
+    def potential_deadlocks(self) -> List[Dict[str, Any]]:
+        """Find cycles in the acquisition order.
+
+        Every strongly connected group of resource names yields one cycle; a name acquired
+        while it is already held by an enclosing process forms a cycle of its own.
+
+        Returns:
+            Per cycle, the resource names (the first repeated at the end) and, per edge, an
+            example of the holder and the executable that acquired the next name.
+        """
+        with self._lock:
+            order = {held: dict(edges) for held, edges in self._order.items()}
+        cycles: List[Dict[str, Any]] = []
+        for group in self._strongly_connected(order):
+            names = self._cycle(order, group)
+            if names is None:
+                continue
+            witnesses = [{"held": held, "acquired": acquired, "holder": order[held][acquired][1],
+                          "acquirer": order[held][acquired][2]} for held, acquired in zip(names, names[1:])]
+            cycles.append({"cycle": names, "witnesses": witnesses})
+        return cycles
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy every finding into plain dictionaries.
+
+        Returns:
+            Hold times, contention, leaks, current holds and potential deadlock cycles.
+        """
+        return {"hold_times": self.hold_times(), "contention": self.contention(), "leaks": self.leaks,
+                "held": self.held(), "deadlocks": self.potential_deadlocks()}
+
+    def report(self) -> str:
+        """Format the findings as readable text.
+
+        Returns:
+            The report, one finding per line.
+        """
+        snapshot = self.snapshot()
+        lines = ["Resource hold times (ms):"]
+        for name, stats in sorted(snapshot["hold_times"].items()):
+            lines.append(f"  {name}: " + self._format_durations(stats))
+        lines.append("Contention (waits in ms):")
+        for name, stats in snapshot["contention"].items():
+            lines.append(f"  {name}: refusals={stats['refusals']} " + self._format_durations(stats))
+        lines.append(f"Leaks: {len(snapshot['leaks'])}")
+        for leak in snapshot["leaks"]:
+            lines.append(f"  '{leak['executable']}' leaked {leak['amount']} of '{leak['resource']}' after "
+                         f"{leak['held_seconds'] * 1000:.3f} ms: {leak['reason']}")
+        lines.append(f"Held now: {len(snapshot['held'])}")
+        for hold in snapshot["held"]:
+            lines.append(f"  '{hold['executable']}' holds {hold['amount']} of '{hold['resource']}' for "
+                         f"{hold['held_seconds'] * 1000:.3f} ms")
+        lines.append(f"Potential deadlocks: {len(snapshot['deadlocks'])}")
+        for cycle in snapshot["deadlocks"]:
+            examples = "; ".join(f"'{witness['acquirer']}' acquired {witness['acquired']} while "
+                                 f"'{witness['holder']}' held {witness['held']}" for witness in cycle["witnesses"])
+            lines.append(f"  {' -> '.join(cycle['cycle'])} ({examples})")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Forget every recorded value, including current holds."""
+        with self._lock:
+            self._holds.clear()
+            self._refused.clear()
+            self._hold_times.clear()
+            self._wait_times.clear()
+            self._refusals.clear()
+            self._leaks.clear()
+            self._order.clear()
+
+    def _leak(self, executable: "Executable", holds: List[list], now: float, reason: str) -> None:
+        """Record and report leaked holds (caller holds the lock)."""
+        for hold in holds:
+            leak = self._describe(executable, hold, now)
+            leak["reason"] = reason
+            self._leaks.append(leak)
+            emit(EventType.WARNING, executable.name,
+                 message=f"'{executable.name}' leaked {hold[1]} of resource '{hold[0].name}': {reason}")
+
+    @staticmethod
+    def _describe(executable: "Executable", hold: list, now: float) -> Dict[str, Any]:
+        """Describe one hold of an executable."""
+        return {"executable": executable.name, "resource": hold[0].name, "amount": hold[1],
+                "held_seconds": now - hold[2]}
+
+    @staticmethod
+    def _durations(table: Dict[str, _Durations], name: str) -> _Durations:
+        """Get the durations of a resource name, creating them on first use (caller holds the lock)."""
+        durations = table.get(name)
+        if durations is None:
+            durations = table[name] = _Durations()
+        return durations
+
+    @staticmethod
+    def _format_durations(stats: Dict[str, float]) -> str:
+        """Format a duration summary in milliseconds."""
+        values = " ".join(f"p{percentile}={stats[f'p{percentile}'] * 1000:.3f}" for percentile in PERCENTILES)
+        return f"count={stats['count']} mean={stats['mean'] * 1000:.3f} {values} max={stats['max'] * 1000:.3f}"
+
+    @staticmethod
+    def _strongly_connected(order: Dict[str, Dict[str, list]]) -> List[List[str]]:
+        """Group resource names into strongly connected components (iterative Tarjan)."""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
+        groups: List[List[str]] = []
+        for root in sorted(order):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(order.get(root, ()))))]
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(sorted(order.get(successor, ())))))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], index[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        group.append(member)
+                        if member == node:
+                            break
+                    groups.append(sorted(group))
+        return groups
+
+    @staticmethod
+    def _cycle(order: Dict[str, Dict[str, list]], group: List[str]) -> Optional[List[str]]:
+        """Find one cycle through the first name of a strongly connected group, or None if it has none."""
+        start = group[0]
+        if len(group) == 1:
+            return [start, start] if start in order.get(start, ()) else None
+        members = set(group)
+        parents: Dict[str, str] = {}
+        frontier = [start]
+        while frontier:
+            following: List[str] = []
+            for node in frontier:
+                for successor in sorted(order.get(node, ())):
+                    if successor == start:
+                        path = [start]
+                        while node != start:
+                            path.append(node)
+                            node = parents[node]
+                        return [start] + path[:0:-1] + [start]
+                    if successor in members and successor not in parents:
+                        parents[successor] = node
+                        following.append(successor)
+            frontier = following
+        return None
+
+_tracer: Optional[ResourceTracer] = None
+
+def get_tracer() -> Optional[ResourceTracer]:
+    """Get the tracer that currently records resource holds, or None if tracing is off."""
+    return _tracer
+
+def enable_tracing(tracer: Optional[ResourceTracer] = None) -> ResourceTracer:
+    """Turn on the debug mode, recording every resource hold in a tracer.
+
+    Args:
+        tracer: The tracer to record into (a new one if omitted).
+
+    Returns:
+        The active tracer.
+    """
+    global _tracer
+    _tracer = tracer if tracer is not None else ResourceTracer()
+    return _tracer
+
+def disable_tracing() -> Optional[ResourceTracer]:
+    """Turn off the debug mode.
+
+    Returns:
+        The tracer that was active, so its findings can still be read, or None.
+    """
+    global _tracer
+    previous, _tracer = _tracer, None
+    return previous
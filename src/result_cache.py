@@ -0,0 +1,236 @@
+"""
+File: result_cache.py
+Purpose: Implements the ResultCache class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the ResultCache class, a content-addressed store of task results used for
+incremental runs. Entries are addressed by an Executable's cache key, a digest of the task's
+definition, its input fingerprint and the keys of its dependencies, so a task whose inputs and
+upstream tasks are unchanged hits the cache and a Process completes it without allocating
+resources or executing it. Recent entries live in a bounded in-memory LRU tier; with a directory,
+every entry is also written to disk (one small file per key) so it survives across runs, and the
+disk tier can be bounded in bytes as well.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+class ResultCache:
+    """Two-tier, content-addressed cache of task results.
+
+    Demonstrates encapsulation: callers only get and put records by key, while the LRU
+    order, the files and their eviction stay internal.
+    """
+
+    def __init__(self, max_entries: int = 4096, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """Initialize a ResultCache.
+
+        Args:
+            max_entries: Entries kept in memory; the least recently used ones are evicted.
+            directory: Where entries are persisted across runs (None keeps them in memory only).
+            max_disk_bytes: Upper bound for the files in directory; the least recently used
+                ones are deleted beyond it (None leaves the disk tier unbounded).
+
+        Raises:
+            ValueError: If a bound is not positive, or max_disk_bytes is given without directory.
+        """
+        if max_entries <= 0:
+            raise ValueError("Result cache must hold at least one entry in memory")
+        if max_disk_bytes is not None and (max_disk_bytes <= 0 or directory is None):
+            raise ValueError("Disk bound of the result cache must be positive and needs a directory")
+        self._max_entries = max_entries
+        self._directory = directory
+        self._max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            if max_disk_bytes is not None:
+                self._disk_bytes = sum(os.path.getsize(path) for path in self._files())
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups that found an entry."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of lookups that found nothing."""
+        return self._misses
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Get the directory of the disk tier, or None if there is none."""
+        return self._directory
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up the record stored under a key, checking memory before disk.
+
+        A record found on disk is promoted to the memory tier.
+
+        Args:
+            key: The cache key (see Executable.cache_key).
+
+        Returns:
+            The record, or None on a miss.
+        """
+        with self._lock:
+            record = self._memory.get(key)
+            if record is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return record
+        record = self._read(key)
+        with self._lock:
+            if record is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._remember(key, record)
+        return record
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        """Store a record under a key in both tiers.
+
+        Args:
+            key: The cache key.
+            record: A JSON-serializable description of the result.
+        """
+        with self._lock:
+            self._remember(key, record)
+        if self._directory is not None:
+            self._write(key, record)
+
+    def discard(self, key: str) -> None:
+        """Remove the entry stored under a key from both tiers.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+        if self._directory is not None:
+            path = self._path(key)
+            size = os.path.getsize(path) if self._max_disk_bytes is not None and os.path.exists(path) else 0
+            if self._remove(path) and size:
+                with self._lock:
+                    self._disk_bytes -= size
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers and reset the hit counters."""
+        with self._lock:
+            self._memory.clear()
+            self._hits = 0
+            self._misses = 0
+            self._disk_bytes = 0
+        if self._directory is not None:
+            for path in list(self._files()):
+                self._remove(path)
+
+    def _remember(self, key: str, record: Dict[str, Any]) -> None:
+        """Insert into the memory tier, evicting the least recently used entry (caller holds the lock)."""
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        """Get the file of a key, fanned out over subdirectories named by its first two characters."""
+        return os.path.join(self._directory, key[:2], key[2:] + ".json")
+
+    def _files(self) -> Iterable[str]:
+        """List the entry files of the disk tier."""
+        for entry in os.scandir(self._directory):
+            if entry.is_dir():
+                for file in os.scandir(entry.path):
+                    if file.name.endswith(".json"):
+                        yield file.path
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a record from disk, marking it as recently used."""
+        if self._directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                record = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return record
+
+    def _write(self, key: str, record: Dict[str, Any]) -> None:
+        """Write a record to disk atomically, then enforce the disk bound."""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        previous = os.path.getsize(path) if self._max_disk_bytes is not None and os.path.exists(path) else 0
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+        if self._max_disk_bytes is not None:
+            with self._lock:
+                self._disk_bytes += len(data) - previous
+                over = self._disk_bytes > self._max_disk_bytes
+            if over:
+                self._evict_files()
+
+    def _evict_files(self) -> None:
+        """Delete the least recently used files until the disk tier is below 90% of its bound."""
+        entries = sorted(((os.stat(path), path) for path in self._files()), key=lambda entry: entry[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in entries)
+        target = self._max_disk_bytes * 0.9
+        for stat, path in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= stat.st_size
+        with self._lock:
+            self._disk_bytes = total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Delete a file if it still exists."""
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+def file_fingerprint(paths: Iterable[str]) -> str:
+    """Digest the names and contents of input files, for use as a task fingerprint.
+
+    Args:
+        paths: The files a task reads.
+
+    Returns:
+        A hex digest that changes whenever a file's content changes.
+
+    Raises:
+        OSError: If a file cannot be read.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.encode("utf-8") + b"\0")
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,101 @@
+"""
+File: retry_policy.py
+Purpose: Implements the RetryPolicy class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the RetryPolicy class, which tells a Process how to treat tasks that find
+their resources unavailable: how many times to retry them, how long to back off between retries,
+how long they may wait in total and in which order waiting tasks are retried.
+"""
+
+from src.executable import Executable
+from typing import Callable, Optional
+
+class RetryPolicy:
+    """Limits and ordering for tasks waiting on resources.
+
+    Demonstrates encapsulation of the retry rules consulted by Process and WaitQueue.
+    """
+
+    def __init__(self, max_attempts: Optional[int] = None, delay: float = 0.0, backoff: float = 2.0,
+                 max_delay: float = 1.0, timeout: Optional[float] = None,
+                 priority: Optional[Callable[[Executable], int]] = None):
+        """Initialize a RetryPolicy.
+
+        Args:
+            max_attempts: Maximum allocation attempts per task, including the first one
+                (None retries until the task runs or times out).
+            delay: Seconds to wait before the first retry of a woken task.
+            backoff: Factor applied to the delay after every failed retry.
+            max_delay: Upper bound for the delay in seconds.
+            timeout: Seconds a task may wait in total (None waits as long as running tasks may
+                still release what it needs).
+            priority: Ranks waiting tasks; higher values are retried first (defaults to the
+                process's critical-path priority).
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("Retry attempts must be at least 1")
+        if delay < 0 or max_delay < 0:
+            raise ValueError("Retry delays cannot be negative")
+        if backoff < 1:
+            raise ValueError("Retry backoff factor must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Retry timeout must be positive")
+        self._max_attempts = max_attempts
+        self._delay = delay
+        self._backoff = backoff
+        self._max_delay = max_delay
+        self._timeout = timeout
+        self._priority = priority
+
+    @property
+    def max_attempts(self) -> Optional[int]:
+        """Get the maximum allocation attempts per task, or None if unlimited."""
+        return self._max_attempts
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Get the seconds a task may wait in total, or None if unlimited."""
+        return self._timeout
+
+    def allows(self, attempts: int) -> bool:
+        """Check whether a task that failed this many attempts may try again.
+
+        Args:
+            attempts: The failed allocation attempts so far.
+
+        Returns:
+            True if another attempt is allowed.
+        """
+        return self._max_attempts is None or attempts < self._max_attempts
+
+    def delay_before(self, attempt: int) -> float:
+        """Get the back-off before a retry.
+
+        Args:
+            attempt: The number of failed attempts so far (1 for the first retry).
+
+        Returns:
+            The delay in seconds, growing geometrically up to max_delay.
+        """
+        if attempt <= 0 or self._delay == 0:
+            return 0.0
+        return min(self._delay * self._backoff ** (attempt - 1), self._max_delay)
+
+    def priority_of(self, task: Executable, default: int) -> int:
+        """Rank a waiting task.
+
+        Args:
+            task: The waiting task.
+            default: The rank used when the policy has no priority function.
+
+        Returns:
+            The task's rank; higher values are retried first.
+        """
+        return default if self._priority is None else self._priority(task)
@@ -0,0 +1,274 @@
+"""
+File: simulation.py
+Purpose: Implements a discrete-event simulation engine for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the Simulation and SimulationResult classes. A Simulation replays a Process
+on a virtual clock driven by a heap-based event queue: tasks start when their dependencies have
+completed and their resources are free, usable resource slots are held for duration_in_units and
+consumable resources are drawn down. Nothing is executed and the real resources are not touched,
+so the engine can predict start and end times, makespan and utilization for very large processes.
+"""
+
+import heapq
+from src.executable import Executable
+from src.resource import ResourceType
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.process import Process
+
+class SimulationResult:
+    """Timeline produced by a Simulation run.
+
+    Demonstrates encapsulation of the simulated start and end times.
+    """
+
+    def __init__(self, tasks: List[Executable], starts: List[Optional[int]], ends: List[Optional[int]],
+                 makespan: int, utilization: Dict[str, float]):
+        """Initialize a SimulationResult.
+
+        Args:
+            tasks: The simulated tasks, in process order.
+            starts: Start time of each task, or None if it was skipped.
+            ends: End time of each task, or None if it was skipped.
+            makespan: Time of the last task completion.
+            utilization: Fraction of each resource's capacity used over the makespan.
+        """
+        self._tasks = tasks
+        self._starts = starts
+        self._ends = ends
+        self._makespan = makespan
+        self._utilization = utilization
+        self._index: Optional[Dict[int, int]] = None
+
+    @property
+    def makespan(self) -> int:
+        """Get the time of the last task completion."""
+        return self._makespan
+
+    @property
+    def utilization(self) -> Dict[str, float]:
+        """Get the fraction of each resource's capacity used over the makespan.
+
+        Usable resources report busy slot-time over available slot-time; consumable
+        resources report the share of their total capacity that was consumed.
+        """
+        return self._utilization
+
+    @property
+    def skipped(self) -> List[Executable]:
+        """Get the tasks that could never start."""
+        return [task for task, start in zip(self._tasks, self._starts) if start is None]
+
+    def timeline(self) -> List[Tuple[Executable, int, int]]:
+        """Get (task, start, end) for every task that ran, ordered by start time.
+
+        Returns:
+            The simulated timeline.
+        """
+        entries = [(task, start, end) for task, start, end in zip(self._tasks, self._starts, self._ends)
+                   if start is not None]
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+
+    def start_time(self, task: Executable) -> Optional[int]:
+        """Get the simulated start time of a task, or None if it was skipped."""
+        return self._starts[self._position(task)]
+
+    def end_time(self, task: Executable) -> Optional[int]:
+        """Get the simulated end time of a task, or None if it was skipped."""
+        return self._ends[self._position(task)]
+
+    def _position(self, task: Executable) -> int:
+        """Find a task's index, building the lookup table on first use."""
+        if self._index is None:
+            self._index = {id(t): i for i, t in enumerate(self._tasks)}
+        return self._index[id(task)]
+
+class Simulation:
+    """Discrete-event simulation of a Process against its resource pool.
+
+    Demonstrates composition: the engine reads the process's tasks and pool without changing them.
+    """
+
+    def __init__(self, process: "Process", capacities: Optional[Dict[str, int]] = None,
+                 max_workers: Optional[int] = None):
+        """Initialize a Simulation.
+
+        Args:
+            process: The process to simulate.
+            capacities: Overrides the simulated capacity per resource name (slots for usable
+                resources, units for consumable ones).
+            max_workers: Number of tasks that may run at once (defaults to the process's;
+                0 means limited by resources only).
+        """
+        self._process = process
+        self._capacities = dict(capacities or {})
+        self._max_workers = process.max_workers if max_workers is None else max_workers
+
+    def run(self) -> SimulationResult:
+        """Simulate the process and return its timeline.
+
+        Returns:
+            The SimulationResult.
+
+        Raises:
+            RuntimeError: If the pool cannot satisfy the process's own requirements.
+            ValueError: If the task graph is invalid.
+        """
+        process = self._process
+        tasks = process.task_list()
+        count = len(tasks)
+        successors, indegree = process.dependency_graph(tasks)
+        topological = process.topological_indices(successors, indegree)
+        durations = [task.planned_duration() for task in tasks]
+        bottom = [0] * count
+        for i in reversed(topological):
+            bottom[i] = durations[i] + max((bottom[j] for j in successors[i]), default=0)
+
+        usable, consumable = self._initial_capacities()
+        slots = dict(usable)
+        total_consumable = dict(consumable)
+        busy: Dict[str, int] = {name: 0 for name in usable}
+
+        for name, amount in process.demand():
+            if usable.get(name, 0) >= amount:
+                usable[name] -= amount
+            elif consumable.get(name, 0) >= amount:
+                consumable[name] -= amount
+            else:
+                raise RuntimeError(f"Insufficient resources in pool to start '{process.name}'")
+        held = {name: slots[name] - usable[name] for name in slots}
+
+        demand_cache: Dict[tuple, List[Tuple[str, int]]] = {}
+        demands: List[List[Tuple[str, int]]] = []
+        for task in tasks:
+            key: tuple = tuple(task.required_resources_names)
+            if task.required_quantities:
+                key = (key, tuple(task.required_quantities.items()))
+            demand = demand_cache.get(key)
+            if demand is None:
+                demand = demand_cache[key] = task.demand()
+            demands.append(demand)
+
+        # Heap entries are single integers (priority * count + index) so comparisons stay cheap.
+        heappush, heappop = heapq.heappush, heapq.heappop
+        stride = count or 1
+        top = max(bottom, default=0)
+        keys = [(top - level) * stride + i for i, level in enumerate(bottom)]
+        starts: List[Optional[int]] = [None] * count
+        ends: List[Optional[int]] = [None] * count
+        remaining = list(indegree)
+        skipped = [False] * count
+        ready: List[int] = [keys[i] for i in range(count) if remaining[i] == 0]
+        heapq.heapify(ready)
+        waiters: Dict[str, List[int]] = {name: [] for name in usable}
+        events: List[int] = []
+        limit = self._max_workers or stride
+        running = 0
+        now = 0
+
+        def resolve(i: int) -> None:
+            """Release successors of a finished or skipped task."""
+            for j in successors[i]:
+                if skipped[i]:
+                    skipped[j] = True
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    heappush(ready, keys[j])
+
+        def dispatch() -> None:
+            """Start ready tasks while workers and resources allow."""
+            nonlocal running
+            while ready and running < limit:
+                key = heappop(ready)
+                i = key % stride
+                if skipped[i]:
+                    resolve(i)
+                    continue
+                blocker = None
+                for name, amount in demands[i]:
+                    if name in usable:
+                        if usable[name] < amount:
+                            if slots[name] - held[name] < amount:
+                                blocker = ""
+                                break
+                            blocker = blocker or name
+                    elif consumable.get(name, 0) < amount:
+                        blocker = ""
+                        break
+                if blocker == "":
+                    skipped[i] = True
+                    resolve(i)
+                elif blocker is not None:
+                    heappush(waiters[blocker], key)
+                else:
+                    duration = durations[i]
+                    for name, amount in demands[i]:
+                        if name in usable:
+                            usable[name] -= amount
+                            busy[name] += amount * duration
+                        else:
+                            consumable[name] -= amount
+                    starts[i] = now
+                    ends[i] = now + duration
+                    running += 1
+                    heappush(events, (now + duration) * stride + i)
+
+        def wake() -> None:
+            """Move waiters of resources with free slots back to the ready queue and dispatch them."""
+            for name, queue in waiters.items():
+                while queue and usable[name] > 0 and running < limit:
+                    key = heappop(queue)
+                    heappush(ready, key)
+                    dispatch()
+                    if queue and queue[0] == key:
+                        break
+
+        dispatch()
+        while events:
+            now = events[0] // stride
+            boundary = (now + 1) * stride
+            while events and events[0] < boundary:
+                i = heappop(events) - now * stride
+                running -= 1
+                for name, amount in demands[i]:
+                    if name in usable:
+                        usable[name] += amount
+                resolve(i)
+            dispatch()
+            wake()
+
+        makespan = max((end for end in ends if end is not None), default=0)
+        utilization: Dict[str, float] = {}
+        for name, capacity in slots.items():
+            used = busy[name] + held[name] * makespan
+            utilization[name] = used / (capacity * makespan) if capacity and makespan else 0.0
+        for name, capacity in total_consumable.items():
+            utilization[name] = (capacity - consumable[name]) / capacity if capacity else 0.0
+        return SimulationResult(list(tasks), starts, ends, makespan, utilization)
+
+    def _initial_capacities(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Sum the pool's capacity per resource name, applying any overrides.
+
+        Returns:
+            Slots per usable resource name and remaining units per consumable resource name.
+        """
+        usable: Dict[str, int] = {}
+        consumable: Dict[str, int] = {}
+        for resource in self._process.resource_pool:
+            if resource.resource_type is ResourceType.USABLE:
+                usable[resource.name] = usable.get(resource.name, 0) + resource.capacity
+            else:
+                consumable[resource.name] = consumable.get(resource.name, 0) + resource.remaining_capacity
+        for name, capacity in self._capacities.items():
+            if name in consumable:
+                consumable[name] = capacity
+            else:
+                usable[name] = capacity
+        return usable, consumable
+
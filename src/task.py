@@ -11,7 +11,10 @@ stages. It demonstrates encapsulation and inheritance in OOP, encapsulating task
 and resource requirements for the process simulation in python-oop-review.
 """
 
+from src.events import EventType, emit
 from src.executable import Executable
+from src.metrics import timed_phase
+from typing import Dict, List, Optional
 
 class Task(Executable):
     """Concrete implementation of Executable for individual compilation tasks.
@@ -19,7 +22,11 @@ class Task(Executable):
     Demonstrates encapsulation and inheritance.
     """
 
-    def __init__(self, name: str, description: str, required_resources_names: list[str], duration_in_units: int):
+    __slots__ = ()
+
+    def __init__(self, name: str, description: str, required_resources_names: list[str], duration_in_units: int,
+                 dependencies: Optional[List[Executable]] = None, quantities: Optional[Dict[str, int]] = None,
+                 fingerprint: Optional[str] = None):
         """Initialize a Task for a compilation stage.
 
         Args:
@@ -27,9 +34,16 @@ class Task(Executable):
             description: A description of the task's purpose.
             required_resources_names: Names of resources required for execution.
             duration_in_units: Duration of execution in time units.
+            dependencies: Tasks that must complete before this one can start.
+            quantities: Units needed per required resource name (e.g., CPU slots); names
+                not listed need one unit.
+            fingerprint: Digest of the task's inputs; tasks with one may be completed from a
+                result cache instead of running (see Executable.set_fingerprint).
         """
-        super().__init__(name, description, required_resources_names, duration_in_units)
+        super().__init__(name, description, required_resources_names, duration_in_units, dependencies, quantities,
+                         fingerprint)
 
+    @timed_phase("execute")
     def execute(self) -> None:
         """Execute the task using assigned resources.
 
@@ -38,6 +52,6 @@ class Task(Executable):
         """
         if len(self._assigned_resources) != len(self._required_resources_names):
             raise RuntimeError(f"Resources not properly assigned for task '{self._name}'")
-        print(f"Executing task '{self._name}': {self._description} (Duration: {self._duration_in_units} units)")
+        emit(EventType.TASK_START, self._name, description=self._description, duration=self._duration_in_units)
         for resource in self._assigned_resources:
             resource.use()
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+File: task_source.py
+Purpose: Implements the TaskSource class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the TaskSource class, a single-pass stream of tasks read lazily from an
+iterator, a generator or an async generator. A Process that uses a TaskSource pulls the next task
+only when it can make progress on it and drops each task once it finished, so task streams fed by
+an upstream queue may be arbitrarily long, or unbounded.
+
+An async source is read on a private event loop by default. When a process is run from a coroutine
+(see Process.run_async), the source is bound to the caller's loop instead, so the generator can
+await objects that belong to that loop, such as an asyncio.Queue it shares with other coroutines.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable
+from src.executable import Executable
+from typing import AsyncIterator, Iterable, Iterator, Optional, Union
+
+class TaskSource:
+    """Lazy, single-pass stream of executables.
+
+    Demonstrates the iterator protocol: synchronous and asynchronous sources are read
+    through the same __next__ method.
+    """
+
+    def __init__(self, source: Union[Iterable[Executable], AsyncIterable]):
+        """Initialize a TaskSource.
+
+        Args:
+            source: An iterable or async iterable of tasks. To read from a queue, pass e.g.
+                iter(queue.get, None) so that putting None ends the stream.
+        """
+        self._iterator: Optional[Iterator[Executable]] = None
+        self._async_iterator: Optional[AsyncIterator[Executable]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bound: Optional[asyncio.AbstractEventLoop] = None
+        if isinstance(source, AsyncIterable):
+            self._async_iterator = source.__aiter__()
+        else:
+            self._iterator = iter(source)
+        self._consumed = 0
+        self._exhausted = False
+
+    def __iter__(self) -> "TaskSource":
+        return self
+
+    def __next__(self) -> Executable:
+        """Read the next task, waiting for the source if it has none yet.
+
+        Returns:
+            The next task.
+
+        Raises:
+            StopIteration: If the source is exhausted.
+            ValueError: If the source yields something that is not an Executable.
+            RuntimeError: If an async source is read on a thread running an event loop, which
+                the read would block.
+        """
+        if self._exhausted:
+            raise StopIteration
+        try:
+            if self._iterator is not None:
+                task = next(self._iterator)
+            else:
+                self._check_no_running_loop()
+                if self._bound is not None:
+                    task = asyncio.run_coroutine_threadsafe(self._anext(), self._bound).result()
+                else:
+                    if self._loop is None:
+                        self._loop = asyncio.new_event_loop()
+                    task = self._loop.run_until_complete(self._anext())
+        except (StopIteration, StopAsyncIteration):
+            self.close()
+            raise StopIteration from None
+        if not isinstance(task, Executable):
+            raise ValueError(f"Task source yielded {type(task).__name__}, not an Executable")
+        self._consumed += 1
+        return task
+
+    def bind(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Read an async source on a running event loop instead of a private one.
+
+        Tasks are then read from other threads, each read waiting for the generator to
+        advance on the loop; synchronous sources ignore the binding.
+
+        Args:
+            loop: The loop the generator's awaitables belong to, or None to read on a private
+                loop again.
+        """
+        self._bound = loop
+
+    @property
+    def consumed(self) -> int:
+        """Get the number of tasks read so far."""
+        return self._consumed
+
+    @property
+    def exhausted(self) -> bool:
+        """Check whether the stream has ended or was closed."""
+        return self._exhausted
+
+    def close(self) -> None:
+        """Stop reading and release the source (and the event loop of an async source)."""
+        if self._exhausted:
+            return
+        self._exhausted = True
+        if self._bound is not None and self._async_iterator is not None:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is self._bound:
+                self._bound.create_task(self._aclose())
+            else:
+                asyncio.run_coroutine_threadsafe(self._aclose(), self._bound).result()
+        elif self._loop is not None:
+            self._loop.run_until_complete(self._aclose())
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        elif self._iterator is not None and hasattr(self._iterator, "close"):
+            self._iterator.close()
+
+    async def _anext(self) -> Executable:
+        """Advance the async source (a coroutine, as run_coroutine_threadsafe requires)."""
+        return await self._async_iterator.__anext__()
+
+    async def _aclose(self) -> None:
+        """Close the async source if it supports it."""
+        aclose = getattr(self._async_iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    @staticmethod
+    def _check_no_running_loop() -> None:
+        """Refuse to block a thread that runs an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError("An async task source cannot be read inside a running event loop; "
+                           "run the process with Process.run_async")
@@ -0,0 +1,175 @@
+"""
+File: task_table.py
+Purpose: Implements the TaskTable class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the TaskTable class, a columnar store of task definitions for processes with
+millions of tasks. Durations and requirement ids live in typed arrays, identical requirement lists
+and descriptions are stored once, and dependencies and fingerprints are kept per row index. Task
+objects are only created when a row is read, so a Process holding a TaskTable does not keep one
+object per task. Rows are plain Task definitions: a Task subclass cannot be rebuilt from columns,
+so it is refused rather than silently read back as a Task.
+"""
+
+import sys
+from array import array
+from src.executable import Executable, intern_requirements
+from src.task import Task
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+_Requirement = Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]
+
+class TaskTable:
+    """Columnar, array-backed collection of task definitions.
+
+    Demonstrates encapsulation: rows are added and read as Tasks while the storage stays columnar.
+    """
+
+    def __init__(self):
+        """Initialize an empty TaskTable."""
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._durations = array("q")
+        self._requirement_ids = array("l")
+        self._requirements: List[_Requirement] = []
+        self._requirement_index: Dict[_Requirement, int] = {}
+        self._dependencies: Dict[int, Tuple[int, ...]] = {}
+        self._fingerprints: Dict[int, str] = {}
+
+    def add(self, name: str, description: str, required_resources_names: Iterable[str], duration_in_units: int,
+            quantities: Optional[Mapping[str, int]] = None, dependencies: Iterable[int] = (),
+            fingerprint: Optional[str] = None) -> int:
+        """Append a task definition.
+
+        Args:
+            name: The unique identifier for the task.
+            description: A description of the task's purpose.
+            required_resources_names: Names of resources required for execution.
+            duration_in_units: Duration of execution in time units.
+            quantities: Units needed per required resource name.
+            dependencies: Row indices of earlier tasks that must complete first.
+            fingerprint: Digest of the task's inputs (see Executable.set_fingerprint).
+
+        Returns:
+            The row index of the new task.
+
+        Raises:
+            ValueError: If name is empty, duration or a quantity is not positive, or a
+                dependency does not refer to an earlier row.
+        """
+        if not name:
+            raise ValueError("Executable name cannot be empty")
+        if duration_in_units <= 0:
+            raise ValueError(f"Duration for '{name}' must be positive")
+        row = len(self._names)
+        quantity_items = tuple(sorted((quantities or {}).items()))
+        for resource_name, amount in quantity_items:
+            if amount <= 0:
+                raise ValueError(f"Quantity of '{resource_name}' for '{name}' must be positive")
+        depends_on = tuple(dependencies)
+        for index in depends_on:
+            if not 0 <= index < row:
+                raise ValueError(f"Task '{name}' can only depend on earlier rows, not row {index}")
+        key = (intern_requirements(required_resources_names), quantity_items)
+        requirement_id = self._requirement_index.get(key)
+        if requirement_id is None:
+            requirement_id = self._requirement_index[key] = len(self._requirements)
+            self._requirements.append(key)
+        self._names.append(name)
+        self._descriptions.append(sys.intern(description))
+        self._durations.append(duration_in_units)
+        self._requirement_ids.append(requirement_id)
+        if depends_on:
+            self._dependencies[row] = depends_on
+        if fingerprint is not None:
+            self._fingerprints[row] = fingerprint
+        return row
+
+    def add_task(self, task: Executable) -> int:
+        """Append the definition of an existing task.
+
+        Args:
+            task: A plain Task without dependencies (dependencies between rows are given as indices).
+
+        Returns:
+            The row index of the new task.
+
+        Raises:
+            TypeError: If the entity is not a plain Task (e.g., a Task subclass or a nested Process).
+            ValueError: If the task declares dependencies.
+        """
+        if type(task) is not Task:
+            raise TypeError(f"Only plain tasks can be stored in a task table, not '{task.name}' "
+                            f"of type {type(task).__name__}")
+        if task.dependencies:
+            raise ValueError(f"Task '{task.name}' has object dependencies; add it with row indices instead")
+        return self.add(task.name, task.description, task.required_resources_names, task.duration_in_units,
+                        task.required_quantities, (), task.fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Yield a fresh Task per row, without dependencies wired up."""
+        for row in range(len(self._names)):
+            yield self.row(row)
+
+    def row(self, index: int) -> Task:
+        """Create a Task for one row, without its dependencies.
+
+        Args:
+            index: The row index.
+
+        Returns:
+            A new Task with the row's definition and fingerprint.
+        """
+        names, quantities = self._requirements[self._requirement_ids[index]]
+        return Task(self._names[index], self._descriptions[index], names, self._durations[index], None,
+                    dict(quantities) if quantities else None, self._fingerprints.get(index))
+
+    def materialize(self) -> List[Task]:
+        """Create a Task for every row, with dependencies wired between them.
+
+        Returns:
+            The tasks in row order.
+        """
+        tasks = [self.row(index) for index in range(len(self._names))]
+        for index, depends_on in self._dependencies.items():
+            for dependency in depends_on:
+                tasks[index].add_dependency(tasks[dependency])
+        return tasks
+
+    def name(self, index: int) -> str:
+        """Get the name of a row."""
+        return self._names[index]
+
+    def description(self, index: int) -> str:
+        """Get the description of a row."""
+        return self._descriptions[index]
+
+    def duration(self, index: int) -> int:
+        """Get the duration of a row."""
+        return self._durations[index]
+
+    def requirements(self, index: int) -> Sequence[str]:
+        """Get the required resource names of a row."""
+        return self._requirements[self._requirement_ids[index]][0]
+
+    def quantities(self, index: int) -> Tuple[Tuple[str, int], ...]:
+        """Get the declared (name, units) quantities of a row, sorted by name."""
+        return self._requirements[self._requirement_ids[index]][1]
+
+    def fingerprint(self, index: int) -> Optional[str]:
+        """Get the fingerprint of a row, or None if it has none."""
+        return self._fingerprints.get(index)
+
+    def dependencies(self, index: int) -> Tuple[int, ...]:
+        """Get the row indices a row depends on."""
+        return self._dependencies.get(index, ())
+
+    def has_dependencies(self) -> bool:
+        """Check whether any row declares a dependency."""
+        return bool(self._dependencies)
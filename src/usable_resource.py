@@ -8,10 +8,16 @@ License: MIT
 
 This module defines the UsableResource class, inheriting from Resource to model reusable resources
 like a CPU. It showcases inheritance and polymorphism in OOP, providing a distinct implementation
-of resource management for the process simulation in python-oop-review.
+of resource management for the process simulation in python-oop-review. A usable resource behaves
+like a counting semaphore: its capacity is the number of slots that can be held at the same time.
 """
 
+import threading
+import time
+from collections import deque
+from src.events import EventType, emit
 from src.resource import Resource, ResourceType
+from typing import Any, Deque, Dict, Optional
 
 class UsableResource(Resource):
     """Usable resource that is occupied during use, such as a CPU.
@@ -19,12 +25,15 @@ class UsableResource(Resource):
     Demonstrates inheritance and polymorphism from Resource.
     """
 
+    __slots__ = ("_capacity", "_in_use", "_waiters", "_slots_freed")
+
     def __init__(self, name: str, capacity: int):
         """Initialize a UsableResource with a name and capacity.
 
         Args:
             name: The unique identifier for the resource.
-            capacity: The capacity of the resource (e.g., GHz).
+            capacity: The capacity of the resource (e.g., GHz), i.e. the number of slots
+                that may be held at the same time.
 
         Raises:
             ValueError: If capacity is not positive.
@@ -33,31 +42,145 @@ class UsableResource(Resource):
         if capacity <= 0:
             raise ValueError(f"Capacity for resource '{name}' must be positive")
         self._capacity = capacity
+        self._in_use = 0
+        # Created on the first blocking wait; most resources never need them.
+        self._waiters: Optional[Deque[object]] = None
+        self._slots_freed: Optional[threading.Condition] = None
 
     def is_available_for_use(self) -> bool:
         """Check if the resource is available.
 
         Returns:
-            True if the resource is not currently allocated, False otherwise.
+            True if at least one slot is free, False otherwise.
         """
         return self._is_available
 
-    def allocate(self) -> None:
-        """Allocate the resource, marking it as unavailable.
+    def can_allocate(self, amount: int = 1) -> bool:
+        """Check if enough slots are free and no earlier request is waiting for them.
+
+        Args:
+            amount: The number of slots requested.
+
+        Returns:
+            True if allocate(amount) would succeed, False otherwise.
+        """
+        return not self._waiters and self._capacity - self._in_use >= amount
+
+    def allocate(self, amount: int = 1) -> None:
+        """Allocate slots of the resource without waiting.
+
+        Args:
+            amount: The number of slots to hold.
+
+        Raises:
+            ValueError: If amount is not positive.
+            RuntimeError: If not enough slots are free, or other requests are waiting for them.
+        """
+        self._check_amount(amount)
+        with self._lock:
+            if self._waiters or self._capacity - self._in_use < amount:
+                raise RuntimeError(f"Usable resource '{self._name}' is already allocated")
+            self._take(amount)
+        emit(EventType.RESOURCE_ALLOCATE, self._name, amount=amount)
+        if self._metrics is not None:
+            self._metrics.record_allocation(self._name, amount)
+
+    def wait_and_allocate(self, amount: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until enough slots are free, then allocate them.
+
+        Waiters are served in arrival order, so a request for many slots is not starved
+        by a stream of smaller ones.
+
+        Args:
+            amount: The number of slots to hold.
+            timeout: Maximum number of seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the slots were allocated, False if the timeout expired first.
 
         Raises:
-            RuntimeError: If the resource is already allocated.
+            ValueError: If amount is not positive or exceeds the resource's capacity.
         """
-        if not self._is_available:
-            raise RuntimeError(f"Usable resource '{self._name}' is already allocated")
-        self._is_available = False
+        self._check_amount(amount)
+        if amount > self._capacity:
+            raise ValueError(f"Usable resource '{self._name}' has only {self._capacity} slots")
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        ticket = object()
+        waited = False
+        with self._lock:
+            if self._slots_freed is None:
+                self._waiters = deque()
+                self._slots_freed = threading.Condition(self._lock)
+        with self._slots_freed:
+            self._waiters.append(ticket)
+            try:
+                while self._waiters[0] is not ticket or self._capacity - self._in_use < amount:
+                    waited = True
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._slots_freed.wait(remaining)
+                self._take(amount)
+            finally:
+                self._waiters.remove(ticket)
+                self._slots_freed.notify_all()
+                if waited and self._metrics is not None:
+                    self._metrics.record_contention(self._name)
+                    self._metrics.record_wait(self._name, time.monotonic() - started)
+        emit(EventType.RESOURCE_ALLOCATE, self._name, amount=amount)
+        if self._metrics is not None:
+            self._metrics.record_allocation(self._name, amount)
+        return True
 
-    def release(self) -> None:
-        """Release the resource, making it available again."""
-        if self._is_available:
-            print(f"Warning: Attempted to release already free usable resource '{self._name}'")
-        self._is_available = True
+    def release(self, amount: int = 1) -> None:
+        """Release slots of the resource, making them available again.
+
+        Args:
+            amount: The number of slots that were held.
+        """
+        with self._lock:
+            over_released = amount > self._in_use
+            self._in_use = max(self._in_use - amount, 0)
+            self._is_available = True
+            if self._slots_freed is not None:
+                self._slots_freed.notify_all()
+        emit(EventType.RESOURCE_RELEASE, self._name, amount=amount)
+        if self._metrics is not None:
+            self._metrics.record_release(self._name, amount)
+        if over_released:
+            emit(EventType.WARNING, self._name,
+                 message=f"Attempted to release already free usable resource '{self._name}'")
+        self._freed()
 
     def use(self) -> None:
-        """Display the resource usage details."""
-        print(f"    Using usable resource '{self._name}' (capacity: {self._capacity} GHz)")
\ No newline at end of file
+        """Report the resource usage details."""
+        emit(EventType.RESOURCE_USE, self._name, resource_type=self._resource_type.value,
+             capacity=self._capacity, in_use=self._in_use)
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of slots that may be held at the same time."""
+        return self._capacity
+
+    @property
+    def in_use(self) -> int:
+        """Get the number of slots currently held."""
+        return self._in_use
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Copy the resource's state for pickling, without its wait queue."""
+        state = super().__getstate__()
+        state["_waiters"] = None
+        state["_slots_freed"] = None
+        return state
+
+    def _take(self, amount: int) -> None:
+        """Mark slots as held (caller holds the lock)."""
+        self._in_use += amount
+        self._is_available = self._in_use < self._capacity
+
+    def _check_amount(self, amount: int) -> None:
+        """Reject non-positive slot requests."""
+        if amount <= 0:
+            raise ValueError(f"Amount allocated from resource '{self._name}' must be positive")
@@ -0,0 +1,340 @@
+"""
+File: wait_queue.py
+Purpose: Implements the WaitQueue class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines the WaitQueue class, which holds tasks that could not get their resources.
+A waiting task takes a ticket in the queue of every resource name it lacks; tickets are ranked by
+priority, then arrival, so the queues are FIFO among tasks of equal priority. A task that heads
+every queue it waits in watches the names it lacks in the ResourcePool, and a release,
+replenishment or addition of one of them wakes it; the tasks behind it are not woken, and a
+request ranked below a waiting one must leave it the names they share (see queued_ahead), so a
+request for many units is not starved by a stream of smaller ones. When a task gets its
+resources or leaves, the next task in line is woken if what it needs is available. Woken tasks
+are handed back in priority order once their back-off has elapsed. Tasks that exceed the
+RetryPolicy's attempts or timeout are given up. Nothing polls the pool while tasks wait.
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from concurrent.futures import Future
+from src.executable import Executable
+from src.resource_pool import ResourcePool
+from src.retry_policy import RetryPolicy
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+class _Waiter:
+    """Bookkeeping for one waiting task."""
+
+    __slots__ = ("task", "missing", "priority", "sequence", "since", "deadline", "attempts", "ready_at", "token",
+                 "woken", "blind")
+
+    def __init__(self, task: Executable, sequence: int, since: float, deadline: Optional[float]):
+        self.task = task
+        self.missing: Sequence[str] = ()
+        self.priority = 0
+        self.sequence = sequence
+        self.since = since
+        self.deadline = deadline
+        self.attempts = 0
+        self.ready_at = since
+        self.token: Optional[int] = None
+        self.woken = False
+        # Set while the names it lacks are unknown, so it only retries after a release.
+        self.blind = False
+
+class WaitQueue:
+    """Tasks blocked on resources, woken through the pool's per-name watchers.
+
+    Demonstrates composition: the queue combines a pool's watchers with a RetryPolicy.
+    Wake-ups may come from any thread; the other methods are meant for one dispatcher.
+    Only the task at the head of its queues watches the pool, so a release wakes one task
+    per name rather than every task waiting for it.
+    """
+
+    def __init__(self, pool: ResourcePool, policy: RetryPolicy):
+        """Initialize an empty WaitQueue.
+
+        Args:
+            pool: The pool whose releases wake waiting tasks.
+            policy: The retry limits and ordering to apply.
+        """
+        self._pool = pool
+        self._policy = policy
+        self._waiters: Dict[int, _Waiter] = {}
+        self._ready: List[Tuple[int, int, int]] = []
+        self._backing_off: List[Tuple[float, int, int]] = []
+        self._deadlines: List[Tuple[float, int, int]] = []
+        self._tickets: Dict[str, List[Tuple[int, int, int]]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._alarm: Future = Future()
+        self._poked = False
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def __contains__(self, task: object) -> bool:
+        return id(task) in self._waiters
+
+    def park(self, task: Executable, missing: Sequence[str], priority: int, counted: bool = True) -> bool:
+        """Make a task wait for the resources it lacks, counting one failed attempt.
+
+        The task keeps its tickets while it waits; names it lacks on a later attempt are
+        added to them. A task that did not request its resources because tasks ranked ahead
+        of it wait for them (see queued_ahead) has not failed an attempt; only the task first
+        in line is woken, so a woken task only fails if something outside the queue took
+        the units first.
+
+        Args:
+            task: The task whose allocation just failed, or that has to wait its turn.
+            missing: The resource names it could not get (all its names if unknown).
+            priority: Its rank among waiting tasks; the policy may override it.
+            counted: Whether the task requested its resources and was refused, which
+                counts against the policy's max_attempts.
+
+        Returns:
+            True if the task now waits, False if the policy gave up on it (it is removed).
+        """
+        now = time.monotonic()
+        key = id(task)
+        with self._lock:
+            waiter = self._waiters.get(key)
+            if waiter is None:
+                timeout = self._policy.timeout
+                waiter = self._waiters[key] = _Waiter(task, next(self._sequence), now,
+                                                      None if timeout is None else now + timeout)
+                if waiter.deadline is not None:
+                    heapq.heappush(self._deadlines, (waiter.deadline, waiter.sequence, key))
+            waiter.attempts += counted
+            gave_up = ((counted and not self._policy.allows(waiter.attempts))
+                       or (waiter.deadline is not None and now >= waiter.deadline))
+            if gave_up:
+                del self._waiters[key]
+            else:
+                rank = self._policy.priority_of(task, priority)
+                names = tuple(dict.fromkeys((*waiter.missing, *(missing or task.required_resources_names))))
+                queued = () if rank != waiter.priority else waiter.missing
+                for name in names:
+                    if name not in queued:
+                        heapq.heappush(self._tickets.setdefault(name, []), (-rank, waiter.sequence, key))
+                waiter.missing = names
+                waiter.priority = rank
+                waiter.ready_at = now + self._policy.delay_before(waiter.attempts)
+                waiter.woken = False
+                waiter.blind = not missing
+            token, waiter.token = waiter.token, None
+        if token is not None:
+            self._pool.unwatch(token)
+        self._advance(waiter.missing)
+        return not gave_up
+
+    def queued_ahead(self, task: Executable, priority: int) -> List[str]:
+        """Name the resources a task must leave to waiting tasks ranked ahead of it.
+
+        Args:
+            task: A task about to request its resources, waiting or not.
+            priority: Its rank if it is not waiting yet; the policy may override it.
+
+        Returns:
+            The required names whose queue is headed by another task ranked ahead of it
+            (empty if the task may request every resource now).
+        """
+        if not self._waiters:
+            return []
+        with self._lock:
+            waiter = self._waiters.get(id(task))
+            if waiter is None:
+                rank = (-self._policy.priority_of(task, priority), math.inf)
+            else:
+                rank = (-waiter.priority, waiter.sequence)
+            ahead: List[str] = []
+            for name in task.required_resources_names:
+                head = self._head(name)
+                if head is not None and head is not waiter and (-head.priority, head.sequence) < rank:
+                    ahead.append(name)
+            return ahead
+
+    def _head(self, name: str) -> Optional[_Waiter]:
+        """Get the task first in line for a name, dropping stale tickets (caller holds the lock)."""
+        tickets = self._tickets.get(name)
+        while tickets:
+            negative, sequence, key = tickets[0]
+            waiter = self._waiters.get(key)
+            if waiter is not None and waiter.sequence == sequence and waiter.priority == -negative \
+                    and name in waiter.missing:
+                return waiter
+            heapq.heappop(tickets)
+        if tickets is not None:
+            del self._tickets[name]
+        return None
+
+    def _advance(self, names: Iterable[str]) -> None:
+        """Let the task first in line for each name proceed: wake it if it can be served, or watch for it.
+
+        A task is only considered once it heads every queue it waits in.
+        """
+        for name in dict.fromkeys(names):
+            with self._lock:
+                head = self._head(name)
+                if head is None or head.woken or head.token is not None \
+                        or any(self._head(other) is not head for other in head.missing):
+                    continue
+            task = head.task
+            lacking = list(head.missing) if head.blind else \
+                [other for other in head.missing if not self._pool.is_available(other, task.quantity_of(other))]
+            if lacking:
+                token = self._pool.watch(lacking, lambda key=id(task): self._wake(key))
+                with self._lock:
+                    armed = self._waiters.get(id(task)) is head and head.token is None and not head.woken
+                    if armed:
+                        head.token = token
+                if not armed:
+                    self._pool.unwatch(token)
+                    continue
+                # A release on another thread may have happened before the watch was registered.
+                if head.blind or not all(self._pool.is_available(other, task.quantity_of(other)) for other in lacking):
+                    continue
+            self._wake(id(task))
+
+    def _wake(self, key: int) -> None:
+        """Move a waiting task to the ready or back-off heap (may run on any thread)."""
+        with self._lock:
+            waiter = self._waiters.get(key)
+            if waiter is None or waiter.woken:
+                return
+            waiter.woken = True
+            if waiter.ready_at <= time.monotonic():
+                heapq.heappush(self._ready, (-waiter.priority, waiter.sequence, key))
+            else:
+                heapq.heappush(self._backing_off, (waiter.ready_at, waiter.sequence, key))
+            if not self._alarm.done():
+                self._alarm.set_result(None)
+
+    def pop_due(self) -> Optional[Executable]:
+        """Take the highest-priority woken task whose back-off has elapsed.
+
+        The task stays registered: call dispatched() if it got its resources, or park()
+        again if it did not.
+
+        Returns:
+            The task, or None if no woken task is due.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._backing_off and self._backing_off[0][0] <= now:
+                _, sequence, key = heapq.heappop(self._backing_off)
+                waiter = self._waiters.get(key)
+                if waiter is not None and waiter.sequence == sequence:
+                    heapq.heappush(self._ready, (-waiter.priority, sequence, key))
+            while self._ready:
+                _, sequence, key = heapq.heappop(self._ready)
+                waiter = self._waiters.get(key)
+                if waiter is not None and waiter.sequence == sequence and waiter.woken:
+                    waiter.woken = False
+                    return waiter.task
+        return None
+
+    def dispatched(self, task: Executable) -> Optional[Tuple[float, List[str]]]:
+        """Forget a task that got its resources.
+
+        Args:
+            task: The task.
+
+        Returns:
+            When it started waiting and the names it lacked, or None if it never waited.
+        """
+        if id(task) not in self._waiters:
+            return None
+        with self._lock:
+            waiter = self._waiters.pop(id(task), None)
+        if waiter is None:
+            return None
+        if waiter.token is not None:
+            self._pool.unwatch(waiter.token)
+        self._advance(waiter.missing)
+        return waiter.since, list(waiter.missing)
+
+    def expire(self) -> List[Executable]:
+        """Remove the tasks whose timeout has passed.
+
+        Returns:
+            The expired tasks, oldest deadline first.
+        """
+        now = time.monotonic()
+        expired: List[_Waiter] = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, sequence, key = heapq.heappop(self._deadlines)
+                waiter = self._waiters.get(key)
+                if waiter is not None and waiter.sequence == sequence:
+                    del self._waiters[key]
+                    expired.append(waiter)
+        for waiter in expired:
+            if waiter.token is not None:
+                self._pool.unwatch(waiter.token)
+        self._advance(name for waiter in expired for name in waiter.missing)
+        return [waiter.task for waiter in expired]
+
+    def drain(self) -> List[Executable]:
+        """Remove every waiting task that no release has woken since it last failed.
+
+        Tasks first in line are removed, then those behind them get their turn; a task that
+        can be served then is woken instead, and tasks behind a woken one keep waiting.
+
+        Returns:
+            The removed tasks, highest priority first.
+        """
+        drained: List[_Waiter] = []
+        while True:
+            with self._lock:
+                stuck = [waiter for waiter in self._waiters.values() if not waiter.woken
+                         and all(self._head(name) is waiter for name in waiter.missing)]
+                for waiter in stuck:
+                    del self._waiters[id(waiter.task)]
+            if not stuck:
+                break
+            for waiter in stuck:
+                if waiter.token is not None:
+                    self._pool.unwatch(waiter.token)
+            drained.extend(stuck)
+            self._advance(name for waiter in stuck for name in waiter.missing)
+        drained.sort(key=lambda waiter: (-waiter.priority, waiter.sequence))
+        return [waiter.task for waiter in drained]
+
+    def next_event(self) -> Optional[float]:
+        """Get the seconds until the next back-off ends or timeout passes.
+
+        Returns:
+            The delay (0 if one is already due), or None if no such event is pending.
+        """
+        with self._lock:
+            times = [heap[0][0] for heap in (self._backing_off, self._deadlines) if heap]
+        if not times:
+            return None
+        return max(min(times) - time.monotonic(), 0.0)
+
+    def alarm(self) -> Future:
+        """Get a future that completes when a waiting task is woken, or the queue is poked.
+
+        The returned future is already done while woken tasks are ready to be taken, and
+        once after a poke.
+        """
+        with self._lock:
+            if self._alarm.done() and not self._ready and not self._poked:
+                self._alarm = Future()
+            self._poked = False
+            return self._alarm
+
+    def poke(self) -> None:
+        """Complete the alarm without waking a task, so whoever waits on it checks again why tasks wait."""
+        with self._lock:
+            self._poked = True
+            if not self._alarm.done():
+                self._alarm.set_result(None)
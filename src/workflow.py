@@ -0,0 +1,453 @@
+"""
+File: workflow.py
+Purpose: Implements loading and saving of process definitions for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This module defines a declarative on-disk format for processes, their resources, tasks and
+dependencies, as an alternative to building them with add_resource and add_task calls. A workflow
+is a stream of records, stored either as JSON lines or in a compact binary form, and it is read one
+record at a time: plain tasks go straight into a TaskTable, so loading a million-task definition
+never creates a million Task objects. Only definitions are saved, not runtime state such as
+consumed capacity or metrics. Tasks are saved as plain Task definitions with their fingerprints;
+a Task subclass is refused, since loading could not rebuild it.
+
+In the JSON form the first line is the header and every other line is one record:
+
+    {"workflow": 1}
+    {"type": "process", "name": "Build", "description": "...", "requires": [], "duration": 10,
+     "max_workers": 2, "backend": "thread", "quantities": {}, "quotas": {}, "after": []}
+    {"type": "resource", "kind": "usable", "name": "CPU", "capacity": 3}
+    {"type": "task", "name": "Scan", "description": "...", "requires": ["CPU"], "duration": 2,
+     "quantities": {"CPU": 2}, "after": [], "fingerprint": "..."}
+    {"type": "end"}
+
+A process record opens a process and the records up to its matching end belong to it, so nested
+processes appear as nested process/end pairs. "after" names earlier siblings that must complete
+first (later siblings are accepted too, at the cost of creating Task objects for that process);
+"quantities", "quotas" and "after" may be omitted when empty, and "fingerprint" when the task has
+none. The binary form stores the same records, with repeated strings written once, dependencies
+given as sibling indices and a fingerprint as a record of its own before its task.
+"""
+
+import io
+import json
+import struct
+from array import array
+from src.consumable_resource import ConsumableResource
+from src.executable import Executable
+from src.process import Process
+from src.resource import Resource, ResourceType
+from src.task import Task
+from src.task_table import TaskTable
+from src.usable_resource import UsableResource
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+FORMAT_VERSION = 1
+BINARY_MAGIC = b"PWFB\x01"
+
+_STRING = b"S"
+_TASK = b"T"
+_FINGERPRINT = b"F"
+_RECORD = b"R"
+_LENGTH = struct.Struct("<I")
+_TASK_HEADER = struct.Struct("<IIqHHH")
+_QUANTITY = struct.Struct("<Iq")
+
+# A dependency is written as (sibling index, sibling name); each form keeps the part it needs.
+_After = Sequence[Tuple[int, str]]
+
+class _JsonWriter:
+    """Writes workflow records as JSON lines."""
+
+    def __init__(self, file: BinaryIO):
+        self._file = io.TextIOWrapper(file, encoding="utf-8", newline="\n")
+        self._write({"workflow": FORMAT_VERSION})
+
+    def process(self, process: Process, after: _After) -> None:
+        record: Dict[str, Any] = {"type": "process", "name": process.name, "description": process.description,
+                                  "requires": list(process.required_resources_names),
+                                  "duration": process.duration_in_units, "max_workers": process.max_workers,
+                                  "backend": process.backend.value}
+        self._optional(record, "quantities", dict(process.required_quantities))
+        self._optional(record, "quotas", process.resource_pool.quotas)
+        self._optional(record, "after", [name for _, name in after])
+        self._write(record)
+
+    def resource(self, resource: Resource) -> None:
+        self._write(_resource_record(resource))
+
+    def task(self, name: str, description: str, requires: Sequence[str], duration: int,
+             quantities: Mapping[str, int], after: _After, fingerprint: Optional[str]) -> None:
+        record: Dict[str, Any] = {"type": "task", "name": name, "description": description,
+                                  "requires": list(requires), "duration": duration}
+        self._optional(record, "quantities", dict(quantities))
+        self._optional(record, "after", [name for _, name in after])
+        if fingerprint is not None:
+            record["fingerprint"] = fingerprint
+        self._write(record)
+
+    def end(self) -> None:
+        self._write({"type": "end"})
+
+    def close(self) -> None:
+        self._file.flush()
+        self._file.detach()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    @staticmethod
+    def _optional(record: Dict[str, Any], key: str, value: Union[Dict, List]) -> None:
+        if value:
+            record[key] = value
+
+class _BinaryWriter:
+    """Writes workflow records in the compact binary form.
+
+    Every distinct string except task names is written once and then referred to by id.
+    Tasks use a fixed header; the rarer process, resource and end records are stored as
+    length-prefixed JSON.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+        self._strings: Dict[str, int] = {}
+        self._requirements: Dict[Tuple[str, ...], bytes] = {}
+        file.write(BINARY_MAGIC)
+
+    def process(self, process: Process, after: _After) -> None:
+        record = {"type": "process", "name": process.name, "description": process.description,
+                  "requires": list(process.required_resources_names), "duration": process.duration_in_units,
+                  "max_workers": process.max_workers, "backend": process.backend.value,
+                  "quantities": dict(process.required_quantities), "quotas": process.resource_pool.quotas,
+                  "after": [index for index, _ in after]}
+        self._record(record)
+
+    def resource(self, resource: Resource) -> None:
+        self._record(_resource_record(resource))
+
+    def task(self, name: str, description: str, requires: Sequence[str], duration: int,
+             quantities: Mapping[str, int], after: _After, fingerprint: Optional[str]) -> None:
+        if fingerprint is not None:
+            encoded = fingerprint.encode("utf-8")
+            self._file.write(_FINGERPRINT + _LENGTH.pack(len(encoded)) + encoded)
+        key = tuple(requires)
+        packed = self._requirements.get(key)
+        if packed is None:
+            packed = self._requirements[key] = array("I", [self._string(req) for req in key]).tobytes()
+        description_id = self._string(description)
+        quantity_bytes = b"".join(_QUANTITY.pack(self._string(res), amount) for res, amount in quantities.items())
+        encoded = name.encode("utf-8")
+        self._file.write(_TASK + _TASK_HEADER.pack(len(encoded), description_id, duration, len(key),
+                                                   len(quantities), len(after)))
+        self._file.write(encoded + packed + quantity_bytes + array("I", [index for index, _ in after]).tobytes())
+
+    def end(self) -> None:
+        self._record({"type": "end"})
+
+    def close(self) -> None:
+        self._file.flush()
+
+    def _string(self, text: str) -> int:
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = self._strings[text] = len(self._strings)
+            encoded = text.encode("utf-8")
+            self._file.write(_STRING + _LENGTH.pack(len(encoded)) + encoded)
+        return string_id
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        encoded = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        self._file.write(_RECORD + _LENGTH.pack(len(encoded)) + encoded)
+
+def _resource_record(resource: Resource) -> Dict[str, Any]:
+    """Describe a resource's definition as a record."""
+    if isinstance(resource, UsableResource):
+        capacity = resource.capacity
+    elif isinstance(resource, ConsumableResource):
+        capacity = resource.total_capacity
+    else:
+        raise ValueError(f"Resource '{resource.name}' of type {type(resource).__name__} cannot be saved")
+    return {"type": "resource", "kind": resource.resource_type.value.lower(), "name": resource.name,
+            "capacity": capacity}
+
+def _write_process(writer: Union[_JsonWriter, _BinaryWriter], process: Process, after: _After) -> None:
+    """Write a process, its resources and its tasks (nested processes recursively)."""
+    writer.process(process, after)
+    for resource in process.resource_pool:
+        writer.resource(resource)
+    table = process.task_table
+    if table is not None:
+        for row in range(len(table)):
+            writer.task(table.name(row), table.description(row), table.requirements(row), table.duration(row),
+                        dict(table.quantities(row)), [(i, table.name(i)) for i in table.dependencies(row)],
+                        table.fingerprint(row))
+    else:
+        tasks = process.task_list()
+        # Rejects dependencies outside the process and cycles, which could not be loaded back.
+        process.topological_indices(*process.dependency_graph(tasks))
+        position = {id(task): i for i, task in enumerate(tasks)}
+        for task in tasks:
+            task_after = [(position[id(dependency)], dependency.name) for dependency in task.dependencies]
+            if isinstance(task, Process):
+                _write_process(writer, task, task_after)
+            elif type(task) is Task:
+                writer.task(task.name, task.description, task.required_resources_names, task.duration_in_units,
+                            task.required_quantities, task_after, task.fingerprint)
+            else:
+                raise ValueError(f"Task '{task.name}' of type {type(task).__name__} cannot be saved")
+    writer.end()
+
+def save(process: Process, path: str, binary: bool = False) -> None:
+    """Write a process definition, including nested processes, to a file.
+
+    Tasks are written in insertion order, so a loaded process lists them (and numbers them
+    in its checkpoint journal) as the saved one did. A dependency on a later task is
+    resolved when the process's end record is read.
+
+    Args:
+        process: The process to save.
+        path: The file to write.
+        binary: Write the compact binary form instead of JSON lines.
+
+    Raises:
+        ValueError: If the task graph has a cycle, a task depends on an entity outside its
+            process, or a task or resource type cannot be saved.
+    """
+    with open(path, "wb") as file:
+        writer = _BinaryWriter(file) if binary else _JsonWriter(file)
+        _write_process(writer, process, ())
+        writer.close()
+
+class _Builder:
+    """Collects the entries of one process while its records are read.
+
+    Tasks go into a TaskTable until a nested process or a dependency on a later sibling
+    appears; from then on the process holds objects, since a TaskTable only stores plain
+    tasks that depend on earlier rows. Dependencies on later siblings are linked in finish().
+    """
+
+    def __init__(self, process: Process, after: Sequence[Union[int, str]], by_name: bool):
+        self.process = process
+        self.after = after
+        self._table = TaskTable()
+        self._entries: Optional[List[Executable]] = None
+        self._names: Optional[Dict[str, int]] = {} if by_name else None
+        self._forward: List[Tuple[int, Union[int, str]]] = []
+
+    def add_task(self, name: str, description: str, requires: Sequence[str], duration: int,
+                 quantities: Optional[Dict[str, int]], after: Sequence[Union[int, str]],
+                 fingerprint: Optional[str]) -> None:
+        indices = self._indices(name, after)
+        self._register(name)
+        if self._entries is None and not self._forward:
+            self._table.add(name, description, requires, duration, quantities, indices, fingerprint)
+        else:
+            if self._entries is None:
+                self._entries = self._table.materialize()
+            self._entries.append(Task(name, description, list(requires), duration,
+                                      [self._entries[i] for i in indices], quantities, fingerprint))
+
+    def add_process(self, child: "_Builder") -> None:
+        indices = self._indices(child.process.name, child.after)
+        self._register(child.process.name)
+        if self._entries is None:
+            self._entries = self._table.materialize()
+        for i in indices:
+            child.process.add_dependency(self._entries[i])
+        self._entries.append(child.process)
+
+    def finish(self) -> Process:
+        count = self._count()
+        for position, reference in self._forward:
+            index = self._names.get(reference) if isinstance(reference, str) and self._names is not None else reference
+            entry = self._entries[position]
+            if not isinstance(index, int) or not 0 <= index < count:
+                raise ValueError(f"'{entry.name}' depends on '{reference}', which is not an entry "
+                                 f"of process '{self.process.name}'")
+            entry.add_dependency(self._entries[index])
+        if self._entries is None:
+            if len(self._table):
+                self.process.use_task_table(self._table)
+        else:
+            for entry in self._entries:
+                self.process.add_task(entry)
+        return self.process
+
+    def _count(self) -> int:
+        return len(self._table) if self._entries is None else len(self._entries)
+
+    def _register(self, name: str) -> None:
+        if self._names is not None:
+            if name in self._names:
+                raise ValueError(f"Duplicate entry '{name}' in process '{self.process.name}'")
+            self._names[name] = self._count()
+
+    def _indices(self, name: str, after: Sequence[Union[int, str]]) -> List[int]:
+        """Resolve the references to earlier siblings; those to later ones are kept for finish()."""
+        indices: List[int] = []
+        count = self._count()
+        for reference in after:
+            if isinstance(reference, str) and self._names is not None:
+                index = self._names.get(reference)
+                if index is None:
+                    self._forward.append((count, reference))
+                    continue
+            else:
+                index = reference
+            if not isinstance(index, int) or index < 0:
+                raise ValueError(f"'{name}' depends on '{reference}', which is not an entry "
+                                 f"of process '{self.process.name}'")
+            if index >= count:
+                self._forward.append((count, index))
+                continue
+            indices.append(index)
+        return indices
+
+def _read_json(file: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (type, record) pairs from a JSON-lines workflow."""
+    text = io.TextIOWrapper(file, encoding="utf-8")
+    header = json.loads(text.readline() or "{}")
+    if header.get("workflow") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported workflow header {header}")
+    for number, line in enumerate(text, start=2):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed workflow record on line {number}: {e}") from None
+        yield record.get("type"), record
+
+def _read_binary(file: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (type, record) pairs from a binary workflow; task records are built here."""
+    strings: List[str] = []
+    requirements: Dict[bytes, Tuple[str, ...]] = {}
+    fingerprint: Optional[str] = None
+    read = file.read
+    while True:
+        tag = read(1)
+        if not tag:
+            return
+        if tag == _TASK:
+            name_length, description_id, duration, requires_count, quantity_count, after_count = \
+                _TASK_HEADER.unpack(_read_exactly(read, _TASK_HEADER.size))
+            body = _read_exactly(read, name_length + 4 * requires_count + _QUANTITY.size * quantity_count
+                                 + 4 * after_count)
+            offset = name_length + 4 * requires_count
+            key = body[name_length:offset]
+            requires = requirements.get(key)
+            if requires is None:
+                requires = requirements[key] = tuple(strings[i] for i in array("I", key))
+            quantities = None
+            if quantity_count:
+                quantities = {}
+                for _ in range(quantity_count):
+                    string_id, amount = _QUANTITY.unpack_from(body, offset)
+                    quantities[strings[string_id]] = amount
+                    offset += _QUANTITY.size
+            yield "task", {"name": body[:name_length].decode("utf-8"), "description": strings[description_id],
+                           "requires": requires, "duration": duration, "quantities": quantities,
+                           "after": array("I", body[offset:]).tolist() if after_count else (),
+                           "fingerprint": fingerprint}
+            fingerprint = None
+        elif tag == _FINGERPRINT:
+            (length,) = _LENGTH.unpack(_read_exactly(read, _LENGTH.size))
+            fingerprint = _read_exactly(read, length).decode("utf-8")
+        elif tag == _STRING:
+            (length,) = _LENGTH.unpack(_read_exactly(read, _LENGTH.size))
+            strings.append(_read_exactly(read, length).decode("utf-8"))
+        elif tag == _RECORD:
+            (length,) = _LENGTH.unpack(_read_exactly(read, _LENGTH.size))
+            record = json.loads(_read_exactly(read, length))
+            yield record.get("type"), record
+        else:
+            raise ValueError(f"Unknown binary workflow record {tag!r}")
+
+def _read_exactly(read, size: int) -> bytes:
+    """Read size bytes, failing on a truncated file."""
+    data = read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary workflow")
+    return data
+
+def load(path: str) -> Process:
+    """Build a process from a workflow file written by save() or by hand.
+
+    The format (JSON lines or binary) is detected from the first bytes. Records are read
+    one at a time, and plain tasks are stored in TaskTables rather than as objects.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        The top-level process, with its resources, tasks and nested processes.
+
+    Raises:
+        ValueError: If the file is malformed, a record has an unknown type or resource kind,
+            or a dependency does not name a sibling.
+    """
+    with open(path, "rb") as file:
+        binary = file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+        if not binary:
+            file.seek(0)
+        records = _read_binary(file) if binary else _read_json(file)
+        stack: List[_Builder] = []
+        root: Optional[Process] = None
+        for kind, record in records:
+            try:
+                root = _apply(kind, record, stack, root, binary)
+            except KeyError as e:
+                raise ValueError(f"Workflow '{kind}' record is missing the field {e}") from None
+        if root is None:
+            raise ValueError(f"Workflow '{path}' does not contain a complete process")
+        return root
+
+def _apply(kind: str, record: Dict[str, Any], stack: List[_Builder], root: Optional[Process],
+           binary: bool) -> Optional[Process]:
+    """Apply one record to the processes being built.
+
+    Returns:
+        The top-level process once its end record was read, otherwise None.
+    """
+    if root is not None:
+        raise ValueError(f"Unexpected '{kind}' record after the end of process '{root.name}'")
+    if kind == "process":
+        process = Process(record["name"], record.get("description", ""), record.get("requires", []),
+                          record["duration"], record.get("max_workers", 1), None,
+                          record.get("quantities") or None, record.get("backend", "thread"))
+        for name, units in (record.get("quotas") or {}).items():
+            process.set_quota(name, units)
+        stack.append(_Builder(process, record.get("after", ()), not binary))
+        return None
+    if not stack:
+        raise ValueError(f"'{kind}' record outside of a process")
+    builder = stack[-1]
+    if kind == "task":
+        builder.add_task(record["name"], record.get("description", ""), record.get("requires", ()),
+                         record["duration"], record.get("quantities") or None, record.get("after", ()),
+                         record.get("fingerprint"))
+    elif kind == "resource":
+        builder.process.add_resource(_resource(record))
+    elif kind == "end":
+        stack.pop()
+        if stack:
+            stack[-1].add_process(builder)
+            builder.finish()
+        else:
+            return builder.finish()
+    else:
+        raise ValueError(f"Unknown workflow record type '{kind}'")
+    return None
+
+def _resource(record: Dict[str, Any]) -> Resource:
+    """Create a resource from its record."""
+    kind = record.get("kind")
+    if kind == ResourceType.USABLE.value.lower():
+        return UsableResource(record["name"], record["capacity"])
+    if kind == ResourceType.CONSUMABLE.value.lower():
+        return ConsumableResource(record["name"], record["capacity"])
+    raise ValueError(f"Unknown resource kind '{kind}' for '{record.get('name')}'")
@@ -0,0 +1,11 @@
+"""
+File: __init__.py
+Purpose: Marks the test package for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+This package holds the behaviour tests of python-oop-review. They use unittest and run with
+either "python -m unittest discover tests" or "python -m pytest" from the repository root.
+"""
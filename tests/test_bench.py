@@ -0,0 +1,86 @@
+"""
+File: test_bench.py
+Purpose: Tests the benchmark harness for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run the harness on tiny workloads. They check how synthetic tasks spread their
+requirements over the pool, that every operation is timed, that a sweep skips impossible
+combinations and leaves the active sink as it found it, and that the command line writes a
+machine-readable report.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.bench import OPERATIONS, Workload, main, measure, measure_memory, sweep
+from src.events import MemorySink, get_sink, set_sink
+
+class WorkloadTest(unittest.TestCase):
+    """Synthetic workloads."""
+
+    def test_requirements_are_spread_over_the_pool(self) -> None:
+        tasks = Workload(3, 4, 2).tasks()
+        self.assertEqual([list(task.required_resources_names) for task in tasks],
+                         [["Resource0", "Resource1"], ["Resource1", "Resource2"],
+                          ["Resource2", "Resource0"], ["Resource0", "Resource1"]])
+        self.assertEqual([task.duration_in_units for task in tasks], [1, 2, 3, 4])
+        self.assertEqual(len(Workload(3, 4, 2, max_workers=2).process().task_list()), 4)
+        for sizes in ((2, 4, 3), (0, 4, 1)):
+            with self.assertRaises(ValueError):
+                Workload(*sizes)
+
+class MeasureTest(unittest.TestCase):
+    """Timing operations and sweeping parameters."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_every_operation_is_timed(self) -> None:
+        result = measure(Workload(4, 10, 2), repeat=1)
+        self.assertEqual((result["pool_size"], result["task_count"], result["fan_in"]), (4, 10, 2))
+        for operation in OPERATIONS:
+            self.assertGreater(result[f"{operation}_s"], 0)
+            self.assertAlmostEqual(result[f"{operation}_us_per_task"], result[f"{operation}_s"] / 10 * 1e6)
+
+    def test_sweep_skips_impossible_combinations_and_restores_the_sink(self) -> None:
+        seen = []
+        results = sweep([1, 2], [5], [1, 2], repeat=1, progress=seen.append)
+        self.assertEqual([(result["pool_size"], result["fan_in"]) for result in results], [(1, 1), (2, 1), (2, 2)])
+        self.assertEqual(seen, results)
+        self.assertIs(get_sink(), self.sink)
+        self.assertEqual(self.sink.events, [])
+
+    def test_memory_is_reported_per_task(self) -> None:
+        result = measure_memory(50)
+        self.assertGreater(result["task_bytes_per_task"], 0)
+        self.assertGreater(result["table_bytes_per_task"], 0)
+
+class CommandLineTest(unittest.TestCase):
+    """Running the harness as `python -m src.bench`."""
+
+    def test_report_is_written_as_json(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            with contextlib.redirect_stderr(io.StringIO()) as progress:
+                main(["--pool-sizes", "2", "--task-counts", "5,10", "--fan-in", "1", "--repeat", "1",
+                      "--output", path])
+            with open(path, encoding="utf-8") as file:
+                report = json.load(file)
+        self.assertEqual([result["task_count"] for result in report["results"]], [5, 10])
+        self.assertEqual(report["repeat"], 1)
+        self.assertEqual(len(progress.getvalue().splitlines()), 2)
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--pool-sizes", "0"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+File: test_capacity_planner.py
+Purpose: Tests the CapacityPlanner class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests size pools for processes whose smallest capacities can be worked out by hand, for
+makespan and throughput targets and for a pipeline with a critical path. They check that the
+plan meets its target, that lowering any usable capacity misses it, that the real pool is left
+alone, and that targets no capacity can reach are refused.
+"""
+
+import unittest
+from src.capacity_planner import CapacityPlanner
+from src.consumable_resource import ConsumableResource
+from src.process import Process
+from src.simulation import Simulation
+from src.task import Task
+from src.usable_resource import UsableResource
+
+def independent(count: int) -> Process:
+    """Build a process of independent two-unit tasks that each hold a CPU slot and draw three units of memory."""
+    process = Process("Build", "Independent", [], 1, max_workers=8)
+    process.add_resource(UsableResource("CPU", 1))
+    process.add_resource(ConsumableResource("Memory", 5))
+    for i in range(count):
+        process.add_task(Task(f"T{i}", "Step", ["CPU", "Memory"], 2, quantities={"Memory": 3}))
+    return process
+
+class CapacityPlanTest(unittest.TestCase):
+    """Plans found by CapacityPlanner.plan."""
+
+    def test_slots_shrink_as_the_makespan_target_grows(self) -> None:
+        process = independent(8)
+        for target, cpu in ((4, 4), (8, 2), (16, 1), (20, 1)):
+            with self.subTest(target=target):
+                plan = CapacityPlanner(process, max_workers=0).plan(makespan=target)
+                self.assertEqual(plan.capacities, {"CPU": cpu, "Memory": 24})
+                self.assertLessEqual(plan.makespan, target)
+                self.assertEqual(plan.result.skipped, [])
+                if cpu > 1:
+                    fewer = Simulation(process, {"CPU": cpu - 1, "Memory": 24}, 0).run()
+                    self.assertGreater(fewer.makespan, target)
+        cpu, memory = sorted(process.resource_pool, key=lambda resource: resource.name)
+        self.assertEqual((cpu.capacity, memory.remaining_capacity), (1, 5))
+
+    def test_throughput_is_turned_into_a_makespan(self) -> None:
+        plan = CapacityPlanner(independent(8)).plan(throughput=2)
+        self.assertEqual((plan.target, plan.capacities["CPU"]), (4, 4))
+        self.assertGreater(plan.simulations, 0)
+
+    def test_pipeline_stages_share_slots_off_the_critical_path(self) -> None:
+        process = Process("Build", "Pipeline", [], 1, max_workers=8)
+        first = Task("Parse", "Step", ["CPU"], 3)
+        process.add_task(first)
+        process.add_task(Task("Link", "Step", ["CPU"], 3, [first]))
+        for i in range(3):
+            process.add_task(Task(f"Docs{i}", "Step", ["CPU", "GPU"], 2))
+        plan = CapacityPlanner(process).plan(makespan=6)
+        self.assertEqual(plan.capacities, {"CPU": 2, "GPU": 1})
+        self.assertEqual(plan.makespan, 6)
+        self.assertLessEqual(plan.lower_bounds["CPU"], plan.capacities["CPU"])
+
+    def test_unreachable_targets_are_refused(self) -> None:
+        planner = CapacityPlanner(independent(4))
+        for target in ({}, {"makespan": 0}, {"throughput": -1.0}, {"makespan": 1}, {"throughput": 8.0}):
+            with self.subTest(target=target):
+                with self.assertRaises(ValueError):
+                    planner.plan(**target)
+        workers = CapacityPlanner(independent(4), max_workers=1)
+        with self.assertRaises(ValueError):
+            workers.plan(makespan=6)
+
+if __name__ == "__main__":
+    unittest.main()
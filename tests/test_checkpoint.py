@@ -0,0 +1,94 @@
+"""
+File: test_checkpoint.py
+Purpose: Tests the CheckpointJournal class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests interrupt checkpointed runs, inline and with several workers, resume them from their
+journal and check that every task completes exactly once as far as consumable capacity is
+concerned. They also check that a journal is refused by a process whose tasks come in another
+order.
+"""
+
+import _thread
+import os
+import tempfile
+import time
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.task import Task
+
+class Crashing(Task):
+    """Task that interrupts the run the first time the task named 'crash_at' executes."""
+
+    __slots__ = ()
+    crash_at = ""
+
+    def execute(self) -> None:
+        super().execute()
+        time.sleep(0.005)
+        if self.name == Crashing.crash_at:
+            Crashing.crash_at = ""
+            _thread.interrupt_main()
+            time.sleep(1)
+
+class CrashResumeTest(unittest.TestCase):
+    """Resuming interrupted runs from their journal."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "build.journal")
+
+    def tearDown(self) -> None:
+        Crashing.crash_at = ""
+        set_sink(self.previous)
+        self.directory.cleanup()
+
+    def build(self, workers: int, names: list) -> tuple:
+        process = Process("Build", "Checkpointed", [], 1, max_workers=workers)
+        memory = ConsumableResource("Memory", 100)
+        process.add_resource(memory)
+        for name in names:
+            process.add_task(Crashing(name, "Step", ["Memory"], 1))
+        process.enable_checkpoints(self.path, every=2)
+        return process, memory
+
+    def crash_and_resume(self, workers: int) -> None:
+        names = [f"T{i}" for i in range(20)]
+        process, _ = self.build(workers, names)
+        Crashing.crash_at = "T9"
+        with self.assertRaises(KeyboardInterrupt):
+            process.run()
+        self.sink.clear()
+        process, memory = self.build(workers, names)
+        restored = process.resume()
+        self.assertGreater(restored, 0)
+        self.assertLess(restored, 20)
+        ended = [event.source for event in self.sink.events if event.event_type is EventType.TASK_END]
+        self.assertEqual(len(ended), 20 - restored)
+        self.assertEqual(memory.remaining_capacity, 80)
+
+    def test_inline_run_resumes_with_its_capacity(self) -> None:
+        self.crash_and_resume(1)
+
+    def test_concurrent_run_resumes_with_its_capacity(self) -> None:
+        self.crash_and_resume(3)
+
+    def test_reordered_tasks_are_refused(self) -> None:
+        process, _ = self.build(1, ["A", "B", "C"])
+        process.run()
+        process, _ = self.build(1, ["C", "B", "A"])
+        with self.assertRaises(ValueError):
+            process.resume()
+        process, memory = self.build(1, ["A", "B", "C"])
+        self.assertEqual(process.resume(), 3)
+        self.assertEqual(memory.remaining_capacity, 97)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+File: test_distributed.py
+Purpose: Tests the Coordinator, WorkerNode and ResourceBroker classes for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run a process on localhost, with a ResourceBroker owning the pool and worker nodes
+spawned in separate processes. They check that every task that fits completes after its
+dependencies, that no lease outlives the run, and that a run no node joins ends after the
+coordinator's timeout with its tasks skipped.
+"""
+
+import time
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.distributed import Coordinator, WorkerNode
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.resource_broker import BrokerClient, ResourceBroker
+from src.resource_pool import ResourcePool
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class LocalhostRunTest(unittest.TestCase):
+    """Distributed runs on one machine."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        self.broker = ResourceBroker(ResourcePool([UsableResource("CPU", 2), ConsumableResource("Memory", 100)]))
+        self.broker.start()
+
+    def tearDown(self) -> None:
+        self.broker.stop()
+        set_sink(self.previous)
+
+    def outcomes(self, event_type: EventType) -> list:
+        return [(event.source, event.data.get("reason")) for event in self.sink.events
+                if event.event_type is event_type]
+
+    def test_nodes_complete_every_task_that_fits(self) -> None:
+        process = Process("Build", "Distributed", [], 1)
+        tasks = []
+        for i in range(30):
+            task = Task(f"T{i}", "Step", ["CPU", "Memory"], 1, tasks[-2:], quantities={"CPU": 1 + i % 2, "Memory": 1})
+            tasks.append(task)
+            process.add_task(task)
+        huge = Task("Huge", "Never fits", ["CPU"], 1, quantities={"CPU": 3})
+        process.add_task(huge)
+        process.add_task(Task("After", "Depends on Huge", ["CPU"], 1, [huge]))
+        coordinator = Coordinator(process, self.broker.address, timeout=10)
+        nodes = [WorkerNode.spawn(coordinator.address, self.broker.address, threads=2, batch_size=4)
+                 for _ in range(2)]
+        self.assertEqual(coordinator.run(), 30)
+        for node in nodes:
+            node.join(10)
+            self.assertEqual(node.exitcode, 0)
+        self.assertEqual(sorted(name for name, _ in self.outcomes(EventType.TASK_SKIP)), ["After", "Huge"])
+        order = {(event.event_type, event.source): k for k, event in enumerate(self.sink.events)}
+        for task in tasks:
+            for dependency in task.dependencies:
+                self.assertLess(order[(EventType.TASK_END, dependency.name)], order[(EventType.TASK_START, task.name)])
+        self.assertEqual(self.broker.lease_count, 0)
+        with BrokerClient(self.broker.address) as client:
+            status = client.status()
+        self.assertEqual(status["CPU"]["in_use"], 0)
+        self.assertEqual(status["Memory"]["remaining"], 70)
+
+    def test_run_without_nodes_times_out(self) -> None:
+        process = Process("Build", "Distributed", [], 1)
+        first = Task("A", "Step", ["CPU"], 1)
+        process.add_task(first)
+        process.add_task(Task("B", "Step", ["CPU"], 1, [first]))
+        coordinator = Coordinator(process, self.broker.address, timeout=0.3)
+        started = time.perf_counter()
+        self.assertEqual(coordinator.run(), 0)
+        self.assertLess(time.perf_counter() - started, 5)
+        reason = "no worker node connected for 0.3 seconds"
+        self.assertEqual(sorted(self.outcomes(EventType.TASK_SKIP)), [("A", reason), ("B", reason)])
+        self.assertEqual(self.broker.lease_count, 0)
+
+    def test_non_positive_timeout_is_refused(self) -> None:
+        with self.assertRaises(ValueError):
+            Coordinator(Process("Build", "Distributed", [], 1), self.broker.address, timeout=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+File: test_events.py
+Purpose: Tests the structured event API for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run a process into a memory sink and check the structured records it emits, in
+order. They also check the sinks themselves: the bounded memory buffer, batched JSON-lines
+writing, the console messages, and a multi-sink that leaves disabled sinks out.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import (ConsoleSink, Event, EventType, JsonLinesSink, MemorySink, MultiSink, NullSink, emit,
+                        set_sink)
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class EmittedEventsTest(unittest.TestCase):
+    """Records emitted while a process runs."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_run_emits_structured_records_in_order(self) -> None:
+        process = Process("Build", "Traced", [], 1)
+        process.add_resource(UsableResource("CPU", 1))
+        process.add_resource(ConsumableResource("Memory", 10))
+        process.add_task(Task("A", "Step", ["CPU", "Memory"], 1, quantities={"Memory": 3}))
+        process.add_task(Task("B", "Step", ["GPU"], 1))
+        process.run()
+        self.assertEqual([(event.event_type, event.source) for event in self.sink.events], [
+            (EventType.PROCESS_START, "Build"),
+            (EventType.RESOURCE_ALLOCATE, "CPU"), (EventType.RESOURCE_ALLOCATE, "Memory"),
+            (EventType.TASK_START, "A"),
+            (EventType.RESOURCE_USE, "CPU"), (EventType.RESOURCE_USE, "Memory"),
+            (EventType.RESOURCE_RELEASE, "CPU"), (EventType.RESOURCE_RELEASE, "Memory"),
+            (EventType.TASK_END, "A"),
+            (EventType.TASK_SKIP, "B"),
+            (EventType.PROCESS_END, "Build")])
+        use = self.sink.events[5]
+        self.assertEqual(use.data, {"resource_type": "Consumable", "remaining": 7, "total": 10})
+        self.assertEqual(use.to_dict()["event"], "resource_use")
+
+class SinkTest(unittest.TestCase):
+    """Behaviour of the individual sinks."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @staticmethod
+    def event(source: str) -> Event:
+        return Event(EventType.TASK_SKIP, source, {"reason": "insufficient resources"}, 0.0)
+
+    def test_memory_sink_keeps_the_most_recent_events(self) -> None:
+        sink = MemorySink(capacity=2)
+        for source in ("A", "B", "C"):
+            sink.emit(self.event(source))
+        self.assertEqual([event.source for event in sink.events], ["B", "C"])
+        with self.assertRaises(ValueError):
+            MemorySink(capacity=0)
+
+    def test_json_lines_sink_writes_in_batches(self) -> None:
+        path = os.path.join(self.directory.name, "events.jsonl")
+
+        def records() -> list:
+            with open(path, encoding="utf-8") as file:
+                return [json.loads(line) for line in file]
+
+        with JsonLinesSink(path, batch_size=2) as sink:
+            sink.emit(self.event("A"))
+            self.assertEqual(records(), [])
+            sink.emit(self.event("B"))
+            sink.emit(self.event("C"))
+            sink.flush()
+            self.assertEqual([record["source"] for record in records()], ["A", "B", "C"])
+        self.assertEqual(records()[0], {"event": "task_skip", "source": "A", "timestamp": 0.0,
+                                        "reason": "insufficient resources"})
+        with self.assertRaises(ValueError):
+            JsonLinesSink(path, batch_size=0)
+
+    def test_console_sink_prints_the_simulation_messages(self) -> None:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ConsoleSink().emit(self.event("A"))
+            ConsoleSink().emit(Event(EventType.RESOURCE_ALLOCATE, "CPU", {"amount": 1}, 0.0))
+        self.assertEqual(output.getvalue(), "  Task 'A' skipped: insufficient resources\n")
+
+    def test_multi_sink_leaves_disabled_sinks_out(self) -> None:
+        first, second = MemorySink(), MemorySink()
+        sink = MultiSink([first, NullSink(), second])
+        previous = set_sink(sink)
+        try:
+            emit(EventType.WARNING, "Build", message="slow")
+        finally:
+            set_sink(previous)
+        self.assertEqual([len(first.events), len(second.events)], [1, 1])
+        self.assertFalse(MultiSink([NullSink()]).enabled)
+
+if __name__ == "__main__":
+    unittest.main()
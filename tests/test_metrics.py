@@ -0,0 +1,44 @@
+"""
+File: test_metrics.py
+Purpose: Tests the Metrics collector for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check the phase times a Process records for itself and for its tasks when metrics
+are enabled.
+"""
+
+import unittest
+from src.events import NullSink, set_sink
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class PhaseTest(unittest.TestCase):
+    """Phase accounting of an instrumented process."""
+
+    def setUp(self) -> None:
+        self.previous = set_sink(NullSink())
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_process_execute_is_kept_apart_from_task_execute(self) -> None:
+        process = Process("Build", "Instrumented", [], 1)
+        process.add_resource(UsableResource("CPU", 1))
+        for i in range(3):
+            process.add_task(Task(f"T{i}", "Step", ["CPU"], 1))
+        metrics = process.enable_metrics()
+        process.run()
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["phases"]["execute"]["count"], 3)
+        self.assertEqual(snapshot["phases"]["process_execute"]["count"], 1)
+        self.assertNotIn("execute", snapshot["tasks"]["Build"])
+        task_seconds = sum(snapshot["tasks"][f"T{i}"]["execute"] for i in range(3))
+        self.assertAlmostEqual(snapshot["phases"]["execute"]["seconds"], task_seconds)
+        self.assertEqual(snapshot["completed"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+File: test_nested_process.py
+Purpose: Tests processes nested in other processes for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run child processes that borrow their resources from the parent's pool. They check
+that a child's tasks wait while the parent's other tasks hold the shared slots instead of being
+skipped, that a child never borrows more than its quota, and that of two sibling children which
+hold the slots each other's tasks need, one skips its task rather than both waiting forever.
+"""
+
+import threading
+import time
+import unittest
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class Borrowing(Task):
+    """Task that holds its slots for a moment and records how many child tasks hold slots at once."""
+
+    __slots__ = ()
+    lock = threading.Lock()
+    held = 0
+    peak = 0
+
+    def execute(self) -> None:
+        amount = self.quantity_of("CPU")
+        with Borrowing.lock:
+            Borrowing.held += amount
+            Borrowing.peak = max(Borrowing.peak, Borrowing.held)
+        try:
+            time.sleep(0.01)
+            super().execute()
+        finally:
+            with Borrowing.lock:
+                Borrowing.held -= amount
+
+class Holding(Task):
+    """Parent task that holds its slot long enough for a child to run out of them."""
+
+    __slots__ = ()
+
+    def execute(self) -> None:
+        time.sleep(0.05)
+        super().execute()
+
+class NestedProcessTest(unittest.TestCase):
+    """Child processes sharing the budget of their parent."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        Borrowing.held = Borrowing.peak = 0
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def events(self, event_type: EventType) -> list:
+        return [event.source for event in self.sink.events if event.event_type is event_type]
+
+    def test_child_tasks_wait_for_slots_the_parent_holds(self) -> None:
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.sink.clear()
+                parent = Process("Build", "Shared", [], 1, max_workers=3)
+                parent.add_resource(UsableResource("CPU", 2))
+                gate = Task("Gate", "Step", [], 1)
+                child = Process("Tests", "Nested", [], 1, max_workers=workers, dependencies=[gate])
+                for i in range(3):
+                    child.add_task(Borrowing(f"C{i}", "Step", ["CPU"], 1))
+                for task in (Holding("P0", "Step", ["CPU"], 1), Holding("P1", "Step", ["CPU"], 1), gate, child):
+                    parent.add_task(task)
+                parent.run()
+                self.assertEqual(self.events(EventType.TASK_SKIP), [])
+                self.assertEqual(sorted(self.events(EventType.TASK_END)),
+                                 ["C0", "C1", "C2", "Gate", "P0", "P1", "Tests"])
+
+    def test_quota_bounds_what_a_child_borrows(self) -> None:
+        parent = Process("Build", "Shared", [], 1, max_workers=2)
+        cpu = UsableResource("CPU", 4)
+        parent.add_resource(cpu)
+        child = Process("Tests", "Nested", [], 1, max_workers=4)
+        child.set_quota("CPU", 2)
+        for i in range(12):
+            child.add_task(Borrowing(f"C{i}", "Step", ["CPU"], 1, quantities={"CPU": 1 + i % 2}))
+        parent.add_task(child)
+        parent.add_task(Holding("P0", "Step", ["CPU"], 1))
+        parent.run()
+        self.assertEqual(self.events(EventType.TASK_SKIP), [])
+        self.assertEqual(len(self.events(EventType.TASK_END)), 14)
+        self.assertEqual(Borrowing.peak, 2)
+        self.assertEqual((child.resource_pool.borrowed("CPU"), cpu.in_use), (0, 0))
+
+    def test_siblings_holding_the_slots_do_not_wait_for_each_other(self) -> None:
+        parent = Process("Build", "Shared", [], 1, max_workers=2)
+        cpu = UsableResource("CPU", 2)
+        parent.add_resource(cpu)
+        for name in ("A", "B"):
+            child = Process(name, "Nested", ["CPU"], 1, max_workers=2)
+            first = Holding(f"{name}0", "Step", [], 1)
+            child.add_task(first)
+            child.add_task(Borrowing(f"{name}1", "Step", ["CPU"], 1, [first]))
+            parent.add_task(child)
+        runner = threading.Thread(target=parent.run, daemon=True)
+        runner.start()
+        runner.join(10)
+        self.assertFalse(runner.is_alive())
+        skipped = self.events(EventType.TASK_SKIP)
+        self.assertEqual(len(skipped), 1)
+        self.assertEqual(sorted(skipped + self.events(EventType.TASK_END)), ["A", "A0", "A1", "B", "B0", "B1"])
+        self.assertEqual(cpu.in_use, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+File: test_pickling.py
+Purpose: Tests pickling of executables and resources for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check that tasks and resources survive the pickle round trip used by the process
+backend, including subclasses that do not declare __slots__ and keep attributes in __dict__, and
+that a task which cannot be sent to a worker process fails without leaking its future.
+"""
+
+import pickle
+import unittest
+from contextlib import ExitStack
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process, _Dispatcher
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class Heavy(Task):
+    """Task subclass without __slots__ whose body needs an attribute of its own."""
+
+    def __init__(self, name: str, n: int):
+        super().__init__(name, "Heavy computation", ["CPU"], 1)
+        self.n = n
+
+    def execute(self) -> None:
+        super().execute()
+        if sum(range(self.n)) != self.n * (self.n - 1) // 2:
+            raise RuntimeError(f"Task '{self.name}' computed a wrong sum")
+
+class Unpicklable(Task):
+    """Task subclass holding a lambda, which cannot be sent to a worker process."""
+
+    def __init__(self, name: str):
+        super().__init__(name, "Local only", ["CPU"], 1)
+        self.callback = lambda: None
+
+class LabelledCPU(UsableResource):
+    """Usable resource subclass without __slots__."""
+
+    def __init__(self, name: str, capacity: int, label: str):
+        super().__init__(name, capacity)
+        self.label = label
+
+class PicklingTest(unittest.TestCase):
+    """Round trips of non-slotted subclasses."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_task_subclass_keeps_its_attributes(self) -> None:
+        copy = pickle.loads(pickle.dumps(Heavy("H", 1000)))
+        self.assertEqual(copy.n, 1000)
+        self.assertEqual(copy.name, "H")
+        self.assertEqual(list(copy.required_resources_names), ["CPU"])
+
+    def test_resource_subclass_keeps_its_attributes(self) -> None:
+        cpu = LabelledCPU("CPU", 2, "fast")
+        cpu.allocate(1)
+        copy = pickle.loads(pickle.dumps(cpu))
+        self.assertEqual(copy.label, "fast")
+        self.assertEqual((copy.capacity, copy.in_use), (2, 1))
+        copy.allocate(1)
+        self.assertEqual(cpu.in_use, 1)
+
+    def test_process_backend_runs_non_slotted_tasks(self) -> None:
+        process = Process("Build", "Process backend", [], 1, max_workers=2, backend="process")
+        process.add_resource(LabelledCPU("CPU", 2, "fast"))
+        for i in range(4):
+            process.add_task(Heavy(f"H{i}", 10000 + i))
+        process.run()
+        ended = sorted(event.source for event in self.sink.events if event.event_type is EventType.TASK_END)
+        errors = [event.data for event in self.sink.events if event.event_type is EventType.TASK_ERROR]
+        self.assertEqual(errors, [])
+        self.assertEqual(ended, ["H0", "H1", "H2", "H3"])
+
+    def test_failed_transfer_is_forgotten(self) -> None:
+        process = Process("Build", "Process backend", [], 1, max_workers=2, backend="process")
+        process.add_resource(LabelledCPU("CPU", 2, "fast"))
+        task = Unpicklable("U")
+        process.add_task(task)
+        with ExitStack() as stack:
+            dispatcher = _Dispatcher(process, stack, lambda task: 0)
+            self.assertIsNone(dispatcher.offer(task))
+            finished = []
+            while not finished:
+                finished = dispatcher.wait()
+            self.assertIs(finished[0][0], task)
+            self.assertIsInstance(finished[0][1], Exception)
+            self.assertEqual(dispatcher._remote, set())
+        self.assertEqual(next(iter(process.resource_pool)).in_use, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+File: test_process.py
+Purpose: Tests concurrent dispatch of the Process class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run processes with several workers against fewer resource slots than tasks, and
+check that every task still completes, in dependency order, without ever holding more slots than
+the pool has, and that a request for many slots is served in turn rather than starved by smaller
+ones.
+"""
+
+import threading
+import time
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class Occupying(Task):
+    """Task that holds its slots for a moment and records how many are held at once."""
+
+    __slots__ = ()
+    lock = threading.Lock()
+    held = 0
+    peak = 0
+
+    def execute(self) -> None:
+        amount = self.quantity_of("CPU")
+        with Occupying.lock:
+            Occupying.held += amount
+            Occupying.peak = max(Occupying.peak, Occupying.held)
+        try:
+            time.sleep(0.01)
+            super().execute()
+        finally:
+            with Occupying.lock:
+                Occupying.held -= amount
+
+class ContendedDispatchTest(unittest.TestCase):
+    """Dispatch of more concurrent tasks than the pool can hold."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        Occupying.held = Occupying.peak = 0
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def events(self, event_type: EventType) -> list:
+        return [event.source for event in self.sink.events if event.event_type is event_type]
+
+    def test_slots_are_never_oversubscribed(self) -> None:
+        process = Process("Build", "Contended", [], 1, max_workers=6)
+        process.add_resource(UsableResource("CPU", 3))
+        process.add_resource(ConsumableResource("Memory", 100))
+        for i in range(24):
+            process.add_task(Occupying(f"T{i}", "Step", ["CPU", "Memory"], 1,
+                                       quantities={"CPU": 1 + i % 2, "Memory": 2}))
+        process.run()
+        self.assertEqual(self.events(EventType.TASK_SKIP), [])
+        self.assertEqual(self.events(EventType.TASK_ERROR), [])
+        self.assertEqual(sorted(self.events(EventType.TASK_END)), sorted(f"T{i}" for i in range(24)))
+        self.assertLessEqual(Occupying.peak, 3)
+        self.assertGreater(Occupying.peak, 1)
+        cpu, memory = sorted(process.resource_pool, key=lambda resource: resource.name)
+        self.assertEqual((cpu.in_use, memory.remaining_capacity), (0, 52))
+
+    def test_dependencies_finish_before_dependents_start(self) -> None:
+        process = Process("Build", "Chained", [], 1, max_workers=4)
+        process.add_resource(UsableResource("CPU", 2))
+        previous = []
+        for i in range(12):
+            task = Occupying(f"T{i}", "Step", ["CPU"], 1, previous[-2:])
+            previous.append(task)
+            process.add_task(task)
+        process.run()
+        order = {(event.event_type, event.source): k for k, event in enumerate(self.sink.events)}
+        for task in previous:
+            for dependency in task.dependencies:
+                self.assertLess(order[(EventType.TASK_END, dependency.name)],
+                                order[(EventType.TASK_START, task.name)])
+        self.assertLessEqual(Occupying.peak, 2)
+
+class FairQueueTest(unittest.TestCase):
+    """Waiting requests are served in line per resource name."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_large_request_is_not_starved_by_smaller_ones(self) -> None:
+        for workers in (2, 4, 8):
+            with self.subTest(workers=workers):
+                self.sink.clear()
+                process = Process("Build", "Mixed requests", [], 1, max_workers=workers)
+                process.add_resource(UsableResource("CPU", 2))
+                for i in range(21):
+                    process.add_task(Occupying(f"T{i}", "Step", ["CPU"], 1, quantities={"CPU": 2 if i == 1 else 1}))
+                process.run()
+                started = [event.source for event in self.sink.events if event.event_type is EventType.TASK_START]
+                self.assertEqual(len(started), 21)
+                self.assertLessEqual(started.index("T1"), 2)
+
+if __name__ == "__main__":
+    unittest.main()
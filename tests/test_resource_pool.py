@@ -0,0 +1,174 @@
+"""
+File: test_resource_pool.py
+Purpose: Tests the ResourcePool class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check that reservations are all or nothing: a reservation that fails, whether it is
+refused up front or loses a race while allocating, leaves every resource of the pool as it was.
+They also check that units given back on a resource directly, not through the pool, reach it,
+that executables take their resources from an indexed pool only, and that requests the pool
+already refused are rejected without searching until units may have been freed.
+"""
+
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import NullSink, set_sink
+from src.resource_pool import ResourcePool
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class Contended(UsableResource):
+    """Usable resource whose free slots are taken elsewhere between the pool's check and its allocation."""
+
+    def allocate(self, amount: int = 1) -> None:
+        super().allocate(self.capacity - self.in_use)
+        super().allocate(amount)
+
+class Counting(UsableResource):
+    """Usable resource that counts how often the pool asks whether it can serve a request."""
+
+    def __init__(self, name: str, capacity: int):
+        super().__init__(name, capacity)
+        self.checks = 0
+
+    def can_allocate(self, amount: int = 1) -> bool:
+        self.checks += 1
+        return super().can_allocate(amount)
+
+class ReserveRollbackTest(unittest.TestCase):
+    """Atomicity of ResourcePool.reserve."""
+
+    def setUp(self) -> None:
+        self.previous = set_sink(NullSink())
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_lost_race_gives_consumed_capacity_back(self) -> None:
+        memory = ConsumableResource("Memory", 10)
+        cpu = Contended("CPU", 1)
+        pool = ResourcePool([memory, cpu])
+        self.assertIsNone(pool.reserve([("Memory", 5), ("CPU", 1)]))
+        self.assertEqual(memory.remaining_capacity, 10)
+        self.assertTrue(pool.is_available("Memory", 10))
+
+    def test_refused_demand_allocates_nothing(self) -> None:
+        memory = ConsumableResource("Memory", 10)
+        cpu = UsableResource("CPU", 2)
+        pool = ResourcePool([memory, cpu])
+        self.assertIsNone(pool.reserve([("Memory", 4), ("CPU", 1), ("CPU", 2)]))
+        self.assertIsNone(pool.reserve([("Memory", 4), ("GPU", 1)]))
+        self.assertEqual((memory.remaining_capacity, cpu.in_use), (10, 0))
+        reserved = pool.reserve([("Memory", 4), ("CPU", 2)])
+        self.assertEqual(reserved, [memory, cpu])
+        self.assertEqual((memory.remaining_capacity, cpu.in_use), (6, 2))
+
+class DirectReleaseTest(unittest.TestCase):
+    """Units given back on a resource directly must reach its pool."""
+
+    def setUp(self) -> None:
+        self.previous = set_sink(NullSink())
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_direct_release_returns_slots_to_the_pool(self) -> None:
+        cpu = UsableResource("CPU", 1)
+        pool = ResourcePool([cpu])
+        self.assertIs(pool.acquire("CPU"), cpu)
+        self.assertFalse(pool.is_available("CPU"))
+        cpu.release(1)
+        self.assertTrue(pool.is_available("CPU"))
+        self.assertIs(pool.acquire("CPU"), cpu)
+
+    def test_direct_replenish_returns_capacity_to_the_pool(self) -> None:
+        memory = ConsumableResource("Memory", 4)
+        pool = ResourcePool([memory])
+        self.assertIsNotNone(pool.reserve([("Memory", 4)]))
+        self.assertFalse(pool.is_available("Memory"))
+        memory.replenish(2)
+        self.assertTrue(pool.is_available("Memory", 2))
+        self.assertFalse(pool.is_available("Memory", 3))
+
+    def test_temporary_pools_do_not_take_over_the_callback(self) -> None:
+        cpu = UsableResource("CPU", 1)
+        pool = ResourcePool([cpu])
+        ResourcePool.of([cpu])
+        self.assertTrue(cpu.reports_to(pool))
+
+class IndexedPoolTest(unittest.TestCase):
+    """Lookups go through the pool's indexes, never through a scan of its resources."""
+
+    def setUp(self) -> None:
+        self.previous = set_sink(NullSink())
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_plain_lists_are_indexed_once_by_the_caller(self) -> None:
+        cpu = UsableResource("CPU", 1)
+        task = Task("T", "Step", ["CPU"], 1)
+        for call in (task.can_execute, task.try_assign_resources, task.assign_resources):
+            with self.assertRaises(TypeError):
+                call([cpu])
+        pool = ResourcePool.of([cpu])
+        self.assertTrue(task.can_execute(pool))
+        self.assertTrue(task.try_assign_resources(pool))
+        self.assertEqual(cpu.in_use, 1)
+        task.release_resources()
+
+    def test_restore_only_accepts_own_consumables(self) -> None:
+        memory = ConsumableResource("Memory", 10)
+        pool = ResourcePool([memory, UsableResource("CPU", 1)])
+        self.assertIsNotNone(pool.reserve([("Memory", 10)]))
+        pool.restore(memory, 6)
+        self.assertTrue(pool.is_available("Memory", 6))
+        with self.assertRaises(ValueError):
+            pool.restore(ConsumableResource("Memory", 10), 5)
+        with self.assertRaises(ValueError):
+            pool.restore(pool.get("CPU")[0], 1)
+
+class RefusalCacheTest(unittest.TestCase):
+    """Refused requests are remembered per name until units may be available again."""
+
+    def setUp(self) -> None:
+        self.previous = set_sink(NullSink())
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_refused_requests_are_rejected_without_a_search(self) -> None:
+        cpu = Counting("CPU", 3)
+        pool = ResourcePool([cpu])
+        self.assertIsNotNone(pool.reserve([("CPU", 2)]))
+        task = Task("T", "Step", ["CPU"], 1, quantities={"CPU": 2})
+        self.assertFalse(task.try_assign_resources(pool))
+        checks = cpu.checks
+        self.assertFalse(task.try_assign_resources(pool))
+        self.assertFalse(pool.is_available("CPU", 3))
+        self.assertEqual(cpu.checks, checks)
+        self.assertIsNotNone(pool.acquire("CPU", 1))
+        self.assertGreater(cpu.checks, checks)
+        with self.assertRaises(RuntimeError):
+            task.assign_resources(pool)
+        self.assertEqual((len(task.assigned_resources), cpu.in_use), (0, 3))
+        pool.release(cpu, 2)
+        self.assertTrue(task.try_assign_resources(pool))
+
+    def test_refusals_are_forgotten_in_borrowing_pools(self) -> None:
+        cpu = UsableResource("CPU", 1)
+        parent = ResourcePool([cpu])
+        child = ResourcePool(parent=parent, quotas={"CPU": 0})
+        self.assertIsNotNone(parent.acquire("CPU"))
+        self.assertFalse(child.is_available("CPU"))
+        child.set_quota("CPU", 1)
+        self.assertFalse(child.is_available("CPU"))
+        parent.release(cpu)
+        self.assertIsNotNone(child.acquire("CPU"))
+        self.assertEqual(child.borrowed("CPU"), 1)
+
+if __name__ == "__main__":
+    unittest.main()
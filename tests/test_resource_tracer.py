@@ -0,0 +1,67 @@
+"""
+File: test_resource_tracer.py
+Purpose: Tests the ResourceTracer debug mode for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests run processes with tracing enabled and check the tracer's findings: hold times and
+no leaks for a clean run, a leak for a task that finishes while holding its resources, and no
+wait charged to a task whose refusal ended in a skip rather than an assignment.
+"""
+
+import time
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.resource_pool import ResourcePool
+from src.resource_tracer import ResourceTracer, disable_tracing, enable_tracing
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class TracedRunTest(unittest.TestCase):
+    """Findings of a tracer enabled around process runs."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        self.tracer = enable_tracing(ResourceTracer())
+
+    def tearDown(self) -> None:
+        disable_tracing()
+        set_sink(self.previous)
+
+    def run_process(self, tasks: list, resources: list) -> None:
+        process = Process("Build", "Traced", [], 1)
+        for resource in resources:
+            process.add_resource(resource)
+        for task in tasks:
+            process.add_task(task)
+        process.run()
+
+    def test_clean_run_has_hold_times_and_no_leaks(self) -> None:
+        self.run_process([Task(f"T{i}", "Step", ["CPU", "Memory"], 1) for i in range(3)],
+                         [UsableResource("CPU", 1), ConsumableResource("Memory", 10)])
+        snapshot = self.tracer.snapshot()
+        self.assertEqual(snapshot["hold_times"]["CPU"]["count"], 3)
+        self.assertEqual((snapshot["leaks"], snapshot["held"], snapshot["deadlocks"]), ([], [], []))
+
+    def test_finishing_while_holding_is_a_leak(self) -> None:
+        task = Task("A", "Step", ["CPU"], 1)
+        task.assign_resources(ResourcePool([UsableResource("CPU", 1)]))
+        self.tracer.finished(task)
+        self.assertEqual([(leak["executable"], leak["resource"]) for leak in self.tracer.leaks], [("A", "CPU")])
+        self.assertTrue(any(event.event_type is EventType.WARNING for event in self.sink.events))
+
+    def test_skipped_task_is_not_charged_a_wait(self) -> None:
+        task = Task("A", "Step", ["CPU"], 1, quantities={"CPU": 2})
+        self.run_process([task], [UsableResource("CPU", 1)])
+        time.sleep(0.05)
+        self.run_process([task], [UsableResource("CPU", 2)])
+        contention = self.tracer.contention()["CPU"]
+        self.assertEqual((contention["refusals"], contention["count"]), (1, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+File: test_result_cache.py
+Purpose: Tests the ResultCache class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check the cache's LRU and disk tiers on their own, and incremental runs of a Process: a second
+run completes unchanged tasks from the cache without consuming capacity, while a changed input
+fingerprint invalidates its task and every task downstream of it.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.result_cache import ResultCache, file_fingerprint
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class LeastRecentlyUsedTest(unittest.TestCase):
+    """The in-memory tier."""
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ResultCache(max_entries=2)
+        cache.put("a" * 64, {"task": "a"})
+        cache.put("b" * 64, {"task": "b"})
+        self.assertEqual(cache.get("a" * 64), {"task": "a"})
+        cache.put("c" * 64, {"task": "c"})
+        self.assertIsNone(cache.get("b" * 64))
+        self.assertEqual((len(cache), cache.hits, cache.misses), (2, 1, 1))
+
+class DiskTierTest(unittest.TestCase):
+    """The bounded disk tier."""
+
+    def test_discarded_files_free_their_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(max_entries=1, directory=directory, max_disk_bytes=1000)
+            for name in "abc":
+                cache.put(name * 64, {"task": name})
+            cache.discard("a" * 64)
+            cache.discard("b" * 64)
+            cache.discard("z" * 64)
+            size = len(json.dumps({"task": "c"}, separators=(",", ":")))
+            self.assertEqual(cache._disk_bytes, size)
+            self.assertEqual(ResultCache(directory=directory, max_disk_bytes=1000)._disk_bytes, size)
+
+class IncrementalRunTest(unittest.TestCase):
+    """Runs of a process sharing a persistent cache."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "main.c")
+        with open(self.source, "w") as file:
+            file.write("int main() { return 0; }")
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+        self.directory.cleanup()
+
+    def run_build(self, workers: int = 1) -> tuple:
+        process = Process("Compile", "Incremental", [], 1, max_workers=workers)
+        memory = ConsumableResource("Memory", 100)
+        process.add_resource(UsableResource("CPU", 2))
+        process.add_resource(memory)
+        scan = Task("Scan", "Tokenize", ["CPU", "Memory"], 2, fingerprint=file_fingerprint([self.source]))
+        parse = Task("Parse", "Parse", ["CPU", "Memory"], 3, [scan], fingerprint="v1")
+        link = Task("Link", "Link", ["CPU", "Memory"], 2, [parse])
+        docs = Task("Docs", "Document", ["CPU"], 1, fingerprint="v1")
+        for task in (scan, parse, link, docs):
+            process.add_task(task)
+        process.set_result_cache(ResultCache(directory=os.path.join(self.directory.name, "cache")))
+        self.sink.clear()
+        process.run()
+        ran = sorted(event.source for event in self.sink.events if event.event_type is EventType.TASK_START)
+        cached = sorted(event.source for event in self.sink.events
+                        if event.event_type is EventType.TASK_END and event.data.get("cached"))
+        return ran, cached, memory.remaining_capacity
+
+    def test_unchanged_tasks_hit_the_cache(self) -> None:
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                self.assertEqual(self.run_build(workers)[1], [])
+                ran, cached, remaining = self.run_build(workers)
+                self.assertEqual(ran, ["Link"])
+                self.assertEqual(cached, ["Docs", "Parse", "Scan"])
+                self.assertEqual(remaining, 99)
+                ResultCache(directory=os.path.join(self.directory.name, "cache")).clear()
+
+    def test_changed_fingerprint_invalidates_downstream_tasks(self) -> None:
+        self.run_build()
+        with open(self.source, "w") as file:
+            file.write("int main() { return 1; }")
+        ran, cached, remaining = self.run_build()
+        self.assertEqual(ran, ["Link", "Parse", "Scan"])
+        self.assertEqual(cached, ["Docs"])
+        self.assertEqual(remaining, 97)
+
+if __name__ == "__main__":
+    unittest.main()
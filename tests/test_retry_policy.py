@@ -0,0 +1,128 @@
+"""
+File: test_retry_policy.py
+Purpose: Tests the RetryPolicy class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check the retry rules on their own (limits, back-off) and as a Process applies them
+to tasks waiting on resources: giving up after max_attempts, timing out, retrying by priority
+and waking a waiting task when capacity is replenished. Waiting in line behind another task is
+not a failed attempt, so many tasks contending for a few slots still all run.
+"""
+
+import threading
+import time
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.resource_pool import ResourcePool
+from src.retry_policy import RetryPolicy
+from src.task import Task
+from src.usable_resource import UsableResource
+from src.wait_queue import WaitQueue
+
+class Slow(Task):
+    """Task that holds its resources long enough for others to wait on them."""
+
+    __slots__ = ()
+
+    def execute(self) -> None:
+        time.sleep(0.05)
+        super().execute()
+
+class RetryRulesTest(unittest.TestCase):
+    """The policy's arithmetic and validation."""
+
+    def test_attempts_are_bounded(self) -> None:
+        policy = RetryPolicy(max_attempts=2)
+        self.assertTrue(policy.allows(1))
+        self.assertFalse(policy.allows(2))
+        self.assertTrue(RetryPolicy().allows(1000))
+
+    def test_delay_grows_up_to_its_bound(self) -> None:
+        policy = RetryPolicy(delay=0.1, backoff=2.0, max_delay=0.3)
+        self.assertEqual([policy.delay_before(attempt) for attempt in range(4)], [0.0, 0.1, 0.2, 0.3])
+
+    def test_invalid_limits_are_refused(self) -> None:
+        for arguments in ({"max_attempts": 0}, {"delay": -1}, {"backoff": 0.5}, {"timeout": 0}):
+            with self.assertRaises(ValueError):
+                RetryPolicy(**arguments)
+
+    def test_waiting_in_line_is_not_an_attempt(self) -> None:
+        queue = WaitQueue(ResourcePool([UsableResource("CPU", 1)]), RetryPolicy(max_attempts=2))
+        task = Task("A", "Step", ["CPU"], 1)
+        for _ in range(3):
+            self.assertTrue(queue.park(task, ["CPU"], 0, counted=False))
+        self.assertTrue(queue.park(task, ["CPU"], 0))
+        self.assertFalse(queue.park(task, ["CPU"], 0))
+        self.assertEqual(len(queue), 0)
+
+class WaitingTaskTest(unittest.TestCase):
+    """A Process applying the policy to tasks whose resources are unavailable."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def run_process(self, policy: RetryPolicy, workers: int, tasks: list, resources: list) -> Process:
+        process = Process("Build", "Waiting", [], 1, max_workers=workers, retry_policy=policy)
+        for resource in resources:
+            process.add_resource(resource)
+        for task in tasks:
+            process.add_task(task)
+        process.run()
+        return process
+
+    def outcomes(self, event_type: EventType) -> list:
+        return [(event.source, event.data.get("reason")) for event in self.sink.events
+                if event.event_type is event_type]
+
+    def test_tasks_give_up_after_max_attempts(self) -> None:
+        tasks = [Slow(f"T{i}", "Step", ["CPU"], 1) for i in range(4)]
+        self.run_process(RetryPolicy(max_attempts=1), 3, tasks, [UsableResource("CPU", 1)])
+        skipped = self.outcomes(EventType.TASK_SKIP)
+        self.assertEqual(sorted(name for name, _ in skipped), ["T1", "T2", "T3"])
+        self.assertTrue(all(reason == "gave up waiting for resources" for _, reason in skipped))
+        self.assertEqual([name for name, _ in self.outcomes(EventType.TASK_END)], ["T0"])
+
+    def test_contending_tasks_do_not_exhaust_their_attempts(self) -> None:
+        for workers in (2, 8):
+            with self.subTest(workers=workers):
+                self.sink.clear()
+                tasks = [Slow(f"T{i}", "Step", ["CPU"], 1, quantities={"CPU": 2 if i == 1 else 1}) for i in range(21)]
+                self.run_process(RetryPolicy(max_attempts=3), workers, tasks, [UsableResource("CPU", 2)])
+                self.assertEqual(self.outcomes(EventType.TASK_SKIP), [])
+                self.assertEqual(len(self.outcomes(EventType.TASK_END)), 21)
+
+    def test_tasks_time_out_when_capacity_never_returns(self) -> None:
+        started = time.monotonic()
+        self.run_process(RetryPolicy(timeout=0.2), 2, [Task("A", "Step", ["Memory"], 1, quantities={"Memory": 5})],
+                         [ConsumableResource("Memory", 3)])
+        self.assertEqual(self.outcomes(EventType.TASK_SKIP), [("A", "timed out waiting for resources")])
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_waiting_tasks_are_retried_by_priority(self) -> None:
+        tasks = [Slow(f"T{i}", "Step", ["CPU"], 1) for i in range(5)]
+        self.run_process(RetryPolicy(priority=lambda task: int(task.name[1:])), 2, tasks, [UsableResource("CPU", 1)])
+        self.assertEqual([name for name, _ in self.outcomes(EventType.TASK_START)], ["T0", "T4", "T3", "T2", "T1"])
+
+    def test_replenishing_wakes_a_waiting_task(self) -> None:
+        process = Process("Build", "Waiting", [], 1, retry_policy=RetryPolicy(timeout=5))
+        process.add_resource(ConsumableResource("Memory", 10))
+        process.add_task(Task("B", "Step", ["Memory"], 1, quantities={"Memory": 8}))
+        process.add_task(Task("A", "Step", ["Memory"], 1, quantities={"Memory": 5}))
+        timer = threading.Timer(0.1, process.replenish_resource, ("Memory", 10))
+        timer.start()
+        process.run()
+        timer.join()
+        self.assertEqual(self.outcomes(EventType.TASK_SKIP), [])
+        self.assertEqual([name for name, _ in self.outcomes(EventType.TASK_END)], ["B", "A"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+File: test_schedule.py
+Purpose: Tests the critical-path scheduler of the Process class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests plan a fan-out build graph for several worker counts and check the start order,
+makespan and critical path. They also check that nested processes are planned with their own
+makespan, that graphs which cannot be ordered are refused, and that a task whose dependency
+failed is skipped rather than run.
+"""
+
+import unittest
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class Failing(Task):
+    """Task whose body raises."""
+
+    __slots__ = ()
+
+    def execute(self) -> None:
+        raise RuntimeError(f"'{self.name}' failed")
+
+def fan_out() -> Process:
+    """Build a process where one scan fans out to four parses joined by a link, next to a docs task."""
+    process = Process("Build", "Fan-out", [], 1)
+    process.add_task(Task("Docs", "Render", ["CPU"], 3))
+    scan = Task("Scan", "Tokenize", ["CPU"], 1)
+    process.add_task(scan)
+    parses = [Task(f"Parse{i}", "Parse", ["CPU"], 2, [scan]) for i in range(4)]
+    for parse in parses:
+        process.add_task(parse)
+    process.add_task(Task("Link", "Link", ["CPU"], 1, parses))
+    return process
+
+class CriticalPathTest(unittest.TestCase):
+    """Plans computed by Process.schedule."""
+
+    def test_makespan_shrinks_with_workers_down_to_the_critical_path(self) -> None:
+        process = fan_out()
+        for workers, makespan in ((1, 13), (2, 8), (4, 6), (8, 4)):
+            with self.subTest(workers=workers):
+                schedule = process.schedule(workers)
+                self.assertEqual(schedule.makespan, makespan)
+                self.assertEqual([task.name for task in schedule.critical_path], ["Scan", "Parse0", "Link"])
+                self.assertEqual(schedule.critical_path_length, 4)
+
+    def test_longest_remaining_path_starts_first(self) -> None:
+        schedule = fan_out().schedule(1)
+        self.assertEqual([task.name for task in schedule.order],
+                         ["Scan", "Docs", "Parse0", "Parse1", "Parse2", "Parse3", "Link"])
+        self.assertEqual([schedule.priority(task) for task in schedule.order[:3]], [4, 3, 3])
+
+    def test_nested_process_counts_with_its_own_makespan(self) -> None:
+        parent = Process("Release", "Nested", [], 1, max_workers=4)
+        child = fan_out()
+        parent.add_task(child)
+        parent.add_task(Task("Tag", "Tag", ["CPU"], 2, [child]))
+        self.assertEqual(child.planned_duration(), 13)
+        self.assertEqual(parent.schedule().makespan, 15)
+
+    def test_unorderable_graphs_are_refused(self) -> None:
+        process = Process("Build", "Cycle", [], 1)
+        first = Task("A", "Step", ["CPU"], 1)
+        second = Task("B", "Step", ["CPU"], 1, [first])
+        first.add_dependency(second)
+        process.add_task(first)
+        process.add_task(second)
+        with self.assertRaises(ValueError):
+            process.schedule()
+        outside = Process("Build", "Outside", [], 1)
+        outside.add_task(Task("C", "Step", ["CPU"], 1, [Task("D", "Step", ["CPU"], 1)]))
+        with self.assertRaises(ValueError):
+            outside.schedule()
+        with self.assertRaises(ValueError):
+            fan_out().schedule(0)
+
+class FailedDependencyTest(unittest.TestCase):
+    """Running tasks whose dependency did not complete."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_dependents_of_a_failed_task_are_skipped(self) -> None:
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.sink.clear()
+                process = Process("Build", "Failing", [], 1, max_workers=workers)
+                process.add_resource(UsableResource("CPU", 2))
+                scan = Failing("Scan", "Tokenize", ["CPU"], 1)
+                parse = Task("Parse", "Parse", ["CPU"], 1, [scan])
+                link = Task("Link", "Link", ["CPU"], 1, [parse])
+                for task in (scan, parse, link, Task("Docs", "Render", ["CPU"], 1)):
+                    process.add_task(task)
+                process.run()
+                skipped = [event.source for event in self.sink.events if event.event_type is EventType.TASK_SKIP]
+                ended = [event.source for event in self.sink.events if event.event_type is EventType.TASK_END]
+                self.assertEqual(skipped, ["Parse", "Link"])
+                self.assertEqual(ended, ["Docs"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+File: test_simulation.py
+Purpose: Tests the Simulation class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests simulate small processes whose timelines can be worked out by hand and check the
+start and end times, makespan and utilization. They also check that consumable resources are
+drawn down until tasks have to be skipped, that capacity and worker overrides change the
+timeline, and that simulating touches neither the real resources nor the event sink.
+"""
+
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.events import MemorySink, set_sink
+from src.process import Process
+from src.simulation import Simulation
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class TimelineTest(unittest.TestCase):
+    """Simulated timelines of processes against their pools."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_slots_are_held_for_the_task_duration(self) -> None:
+        process = Process("Build", "Simulated", [], 1, max_workers=4)
+        cpu = UsableResource("CPU", 2)
+        process.add_resource(cpu)
+        compile_ = Task("Compile", "Step", ["CPU"], 3)
+        lint = Task("Lint", "Step", ["CPU"], 1)
+        link = Task("Link", "Step", ["CPU"], 2, [compile_], quantities={"CPU": 2})
+        for task in (lint, compile_, link):
+            process.add_task(task)
+        result = Simulation(process).run()
+        self.assertEqual([(task.name, start, end) for task, start, end in result.timeline()],
+                         [("Lint", 0, 1), ("Compile", 0, 3), ("Link", 3, 5)])
+        self.assertEqual((result.makespan, result.skipped), (5, []))
+        self.assertAlmostEqual(result.utilization["CPU"], 0.8)
+        self.assertEqual((result.start_time(link), result.end_time(lint)), (3, 1))
+        self.assertEqual((cpu.in_use, self.sink.events), (0, []))
+
+    def test_exhausted_consumables_skip_tasks_and_their_dependents(self) -> None:
+        process = Process("Build", "Simulated", [], 1, max_workers=4)
+        process.add_resource(UsableResource("CPU", 4))
+        memory = ConsumableResource("Memory", 10)
+        process.add_resource(memory)
+        tasks = [Task(f"T{i}", "Step", ["CPU", "Memory"], 1, quantities={"Memory": 4}) for i in range(3)]
+        tasks.append(Task("Report", "Step", ["CPU"], 1, list(tasks)))
+        for task in tasks:
+            process.add_task(task)
+        result = Simulation(process).run()
+        self.assertEqual([task.name for task in result.skipped], ["T2", "Report"])
+        self.assertIsNone(result.start_time(tasks[3]))
+        self.assertAlmostEqual(result.utilization["Memory"], 0.8)
+        self.assertEqual(memory.remaining_capacity, 10)
+
+    def test_overrides_change_the_timeline(self) -> None:
+        process = Process("Build", "Simulated", [], 1, max_workers=4)
+        process.add_resource(UsableResource("CPU", 2))
+        for i in range(6):
+            process.add_task(Task(f"T{i}", "Step", ["CPU"], 1))
+        self.assertEqual(Simulation(process).run().makespan, 3)
+        self.assertEqual(Simulation(process, capacities={"CPU": 3}).run().makespan, 2)
+        self.assertEqual(Simulation(process, max_workers=1).run().makespan, 6)
+
+    def test_unmet_process_requirements_are_refused(self) -> None:
+        process = Process("Build", "Simulated", ["GPU"], 1)
+        process.add_resource(UsableResource("CPU", 1))
+        process.add_task(Task("T0", "Step", ["CPU"], 1))
+        with self.assertRaises(RuntimeError):
+            Simulation(process).run()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+File: test_task_source.py
+Purpose: Tests the TaskSource class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests stream tasks into processes from generators and async generators. They check that
+every streamed task runs after the tasks it depends on, that the stream is read only as fast as
+workers free up, and that an async generator awaiting a queue of the caller's event loop is read
+on that loop by Process.run_async, while Process.run refuses to block a running loop.
+"""
+
+import asyncio
+import unittest
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+
+class StreamTest(unittest.TestCase):
+    """Processes reading their tasks from a stream."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def process(self, workers: int = 1) -> Process:
+        process = Process("Build", "Streamed", [], 1, max_workers=workers)
+        process.add_resource(UsableResource("CPU", 2))
+        return process
+
+    def events(self, event_type: EventType) -> list:
+        return [event.source for event in self.sink.events if event.event_type is event_type]
+
+    def test_generator_is_read_lazily(self) -> None:
+        process = self.process()
+        pulled = []
+
+        def tasks():
+            previous = None
+            for i in range(50):
+                pulled.append((i, len(self.events(EventType.TASK_END))))
+                previous = Task(f"T{i}", "Step", ["CPU"], 1, [previous] if previous else None)
+                yield previous
+
+        source = process.use_task_source(tasks())
+        process.run()
+        self.assertEqual(self.events(EventType.TASK_END), [f"T{i}" for i in range(50)])
+        self.assertTrue(all(ended >= i - 1 for i, ended in pulled))
+        self.assertEqual((source.consumed, source.exhausted), (50, True))
+        with self.assertRaises(ValueError):
+            process.add_task(Task("Late", "Step", ["CPU"], 1))
+
+    def test_async_generator_runs_without_a_loop(self) -> None:
+        async def tasks():
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield Task(f"T{i}", "Step", ["CPU"], 1)
+
+        process = self.process(workers=2)
+        process.use_task_source(tasks())
+        process.run()
+        self.assertEqual(sorted(self.events(EventType.TASK_END)), sorted(f"T{i}" for i in range(10)))
+
+    def test_run_async_reads_on_the_callers_loop(self) -> None:
+        async def main() -> None:
+            queue: asyncio.Queue = asyncio.Queue()
+
+            async def tasks():
+                while True:
+                    task = await queue.get()
+                    if task is None:
+                        return
+                    yield task
+
+            async def produce() -> None:
+                for i in range(20):
+                    await queue.put(Task(f"T{i}", "Step", ["CPU"], 1))
+                    await asyncio.sleep(0.001)
+                await queue.put(None)
+
+            process = self.process(workers=2)
+            source = process.use_task_source(tasks())
+            await asyncio.gather(process.run_async(), produce())
+            self.assertEqual((source.consumed, source.exhausted), (20, True))
+
+        asyncio.run(main())
+        self.assertEqual(self.events(EventType.PROCESS_ERROR), [])
+        self.assertEqual(sorted(self.events(EventType.TASK_END)), sorted(f"T{i}" for i in range(20)))
+
+    def test_run_inside_a_loop_is_refused(self) -> None:
+        async def tasks():
+            yield Task("T0", "Step", ["CPU"], 1)
+
+        async def main() -> None:
+            process = self.process()
+            process.use_task_source(tasks())
+            process.run()
+
+        asyncio.run(main())
+        errors = [event.data["error"] for event in self.sink.events if event.event_type is EventType.PROCESS_ERROR]
+        self.assertEqual(len(errors), 1)
+        self.assertIn("run_async", errors[0])
+        self.assertEqual(self.events(EventType.TASK_END), [])
+
+if __name__ == "__main__":
+    unittest.main()
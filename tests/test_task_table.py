@@ -0,0 +1,82 @@
+"""
+File: test_task_table.py
+Purpose: Tests the TaskTable class for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests check that rows read back as the tasks that were stored, fingerprints included, that
+dependencies are wired by row index, that entities a row cannot represent are refused, and that a
+process holding a task table completes unchanged tasks from its result cache.
+"""
+
+import unittest
+from src.events import EventType, MemorySink, set_sink
+from src.process import Process
+from src.result_cache import ResultCache
+from src.task import Task
+from src.task_table import TaskTable
+from src.usable_resource import UsableResource
+
+class Labelled(Task):
+    """Task subclass, which a row cannot represent."""
+
+    __slots__ = ()
+
+class RowTest(unittest.TestCase):
+    """Storing and reading rows."""
+
+    def test_rows_read_back_as_stored(self) -> None:
+        table = TaskTable()
+        table.add_task(Task("Scan", "Tokenize", ["CPU", "Memory"], 2, quantities={"CPU": 2}, fingerprint="f1"))
+        table.add("Parse", "Parse", ["CPU"], 3, dependencies=[0])
+        scan, parse = table.materialize()
+        self.assertIs(type(scan), Task)
+        self.assertEqual((scan.name, scan.description, scan.duration_in_units), ("Scan", "Tokenize", 2))
+        self.assertEqual(list(scan.required_resources_names), ["CPU", "Memory"])
+        self.assertEqual(scan.quantity_of("CPU"), 2)
+        self.assertEqual((scan.fingerprint, parse.fingerprint), ("f1", None))
+        self.assertEqual(parse.dependencies, [scan])
+        self.assertEqual(table.row(0).fingerprint, table.fingerprint(0))
+
+    def test_entities_a_row_cannot_represent_are_refused(self) -> None:
+        table = TaskTable()
+        for entity in (Labelled("L", "Step", ["CPU"], 1), Process("Inner", "Nested", [], 1)):
+            with self.assertRaises(TypeError):
+                table.add_task(entity)
+        with self.assertRaises(ValueError):
+            table.add_task(Task("B", "Step", ["CPU"], 1, [Task("A", "Step", ["CPU"], 1)]))
+        with self.assertRaises(ValueError):
+            table.add("C", "Step", ["CPU"], 1, dependencies=[0])
+        self.assertEqual(len(table), 0)
+
+class TableProcessTest(unittest.TestCase):
+    """A process holding its tasks in a table."""
+
+    def setUp(self) -> None:
+        self.sink = MemorySink()
+        self.previous = set_sink(self.sink)
+
+    def tearDown(self) -> None:
+        set_sink(self.previous)
+
+    def test_fingerprinted_rows_hit_the_result_cache(self) -> None:
+        cache = ResultCache()
+        for _ in range(2):
+            self.sink.clear()
+            process = Process("Build", "Table", [], 1)
+            process.add_resource(UsableResource("CPU", 1))
+            process.use_task_table(TaskTable())
+            process.add_task(Task("A", "Step", ["CPU"], 1, fingerprint="a"))
+            process.add_task(Task("B", "Step", ["CPU"], 1))
+            process.set_result_cache(cache)
+            process.run()
+        cached = [event.source for event in self.sink.events
+                  if event.event_type is EventType.TASK_END and event.data.get("cached")]
+        self.assertEqual(cached, ["A"])
+        with self.assertRaises(TypeError):
+            process.add_task(Labelled("L", "Step", ["CPU"], 1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+File: test_workflow.py
+Purpose: Tests saving and loading workflows for python-oop-review.
+Author: IoT Solution Development Staff
+Date: 2026-10-17
+Version: 1.0
+License: MIT
+
+These tests save a process with nested processes, quotas, quantities, fingerprints and
+dependencies in both forms, load it back and compare the definitions. They also check that plain
+tasks are loaded into a TaskTable, that a dependency on a later sibling is resolved, and that
+definitions which could not be loaded back are refused.
+"""
+
+import os
+import tempfile
+import unittest
+from src.consumable_resource import ConsumableResource
+from src.process import Process
+from src.task import Task
+from src.usable_resource import UsableResource
+from src.workflow import load, save
+
+class Labelled(Task):
+    """Task subclass, which a workflow cannot rebuild."""
+
+    __slots__ = ()
+
+def describe(process: Process) -> list:
+    """Flatten a process definition into comparable tuples."""
+    entries = [(process.name, process.description, list(process.required_resources_names),
+                process.duration_in_units, process.max_workers, process.resource_pool.quotas,
+                sorted((resource.name, type(resource).__name__) for resource in process.resource_pool))]
+    for task in process.task_list():
+        if isinstance(task, Process):
+            entries.append(describe(task))
+        else:
+            entries.append((task.name, task.description, list(task.required_resources_names), task.duration_in_units,
+                            dict(task.required_quantities), task.fingerprint,
+                            [dependency.name for dependency in task.dependencies]))
+    return entries
+
+class RoundTripTest(unittest.TestCase):
+    """Saving and loading process definitions."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def build(self) -> Process:
+        process = Process("Build", "Compile and link", [], 10, max_workers=2)
+        process.add_resource(UsableResource("CPU", 3))
+        process.add_resource(ConsumableResource("Memory", 100))
+        scan = Task("Scan", "Tokenize", ["CPU", "Memory"], 2, quantities={"CPU": 2}, fingerprint="f1")
+        parse = Task("Parse", "Parse", ["CPU"], 3, [scan])
+        tests = Process("Tests", "Run the tests", ["CPU"], 4, dependencies=[parse])
+        tests.set_quota("CPU", 1)
+        tests.add_task(Task("Unit", "Unit tests", ["CPU"], 1, fingerprint="f2"))
+        for entry in (scan, parse, tests, Task("Link", "Link", ["CPU"], 1, [parse, tests])):
+            process.add_task(entry)
+        return process
+
+    def test_both_forms_round_trip(self) -> None:
+        original = self.build()
+        for binary in (False, True):
+            with self.subTest(binary=binary):
+                path = self.path("build.wfb" if binary else "build.jsonl")
+                save(original, path, binary)
+                loaded = load(path)
+                self.assertEqual(describe(loaded), describe(original))
+                save(loaded, path, binary)
+                self.assertEqual(describe(load(path)), describe(original))
+
+    def test_plain_tasks_are_loaded_into_a_table(self) -> None:
+        process = Process("Build", "Flat", [], 1)
+        first = Task("A", "Step", ["CPU"], 1, fingerprint="a")
+        process.add_task(first)
+        process.add_task(Task("B", "Step", ["CPU"], 1, [first]))
+        for binary in (False, True):
+            with self.subTest(binary=binary):
+                save(process, self.path("flat"), binary)
+                table = load(self.path("flat")).task_table
+                self.assertIsNotNone(table)
+                self.assertEqual((table.fingerprint(0), table.fingerprint(1), table.dependencies(1)), ("a", None, (0,)))
+
+    def test_dependency_on_a_later_sibling_is_resolved(self) -> None:
+        with open(self.path("forward.jsonl"), "w") as file:
+            file.write('{"workflow": 1}\n'
+                       '{"type": "process", "name": "Build", "duration": 1}\n'
+                       '{"type": "task", "name": "B", "duration": 1, "after": ["A"]}\n'
+                       '{"type": "task", "name": "A", "duration": 1}\n'
+                       '{"type": "end"}\n')
+        first, second = load(self.path("forward.jsonl")).task_list()
+        self.assertEqual(first.dependencies, [second])
+
+    def test_unloadable_definitions_are_refused(self) -> None:
+        process = Process("Build", "Subclass", [], 1)
+        process.add_task(Labelled("L", "Step", ["CPU"], 1))
+        with self.assertRaises(ValueError):
+            save(process, self.path("subclass.jsonl"))
+        with open(self.path("unknown.jsonl"), "w") as file:
+            file.write('{"workflow": 1}\n{"type": "process", "name": "Build", "duration": 1}\n'
+                       '{"type": "task", "name": "A", "duration": 1, "after": ["Missing"]}\n{"type": "end"}\n')
+        with self.assertRaises(ValueError):
+            load(self.path("unknown.jsonl"))
+
+if __name__ == "__main__":
+    unittest.main()